@@ -0,0 +1,83 @@
+# benchmarks/bench_detector.py
+"""변동성 감지기 마이크로 벤치마크
+
+- oldest: VolatilityDetector (윈도우 첫 가격 대비)
+- range: RangeVolatilityDetector (단조 최소/최대 큐)
+- zscore: ZScoreDetector (1초 로그 수익률의 Welford 추가/제거와 체결마다 z-점수 계산)
+- rescan: 매 체결마다 윈도우 전체를 다시 훑어 최고가/최저가를 구하는 단순 구현
+
+사용법:
+    python benchmarks/bench_detector.py --rates 100 1000 5000 --seconds 120
+"""
+
+import sys
+import time
+import random
+import argparse
+import contextlib
+import io
+from collections import deque
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from volmon.config import TIME_WINDOW
+from volmon.utils.detector import VolatilityDetector, RangeVolatilityDetector, ZScoreDetector
+
+
+class RescanDetector:
+    """비교용: 매번 윈도우 전체를 훑는 구현"""
+
+    def __init__(self):
+        self.price_history = deque()
+
+    def detect(self, price, event_time):
+        self.price_history.append((event_time, price))
+        while self.price_history[0][0] < event_time - TIME_WINDOW:
+            self.price_history.popleft()
+        prices = [p for _, p in self.price_history]
+        low, high = min(prices), max(prices)
+        return max((price - low) / low, (high - price) / high) * 100
+
+
+def make_ticks(rate: int, seconds: int):
+    """초당 rate건, seconds초 분량의 랜덤 워크 체결"""
+    random.seed(42)
+    price = 100.0
+    ticks = []
+    for i in range(rate * seconds):
+        price *= 1 + random.gauss(0, 0.0002)
+        ticks.append((i / rate, price))
+    return ticks
+
+
+def bench(detector, ticks) -> float:
+    """체결당 평균 처리 시간 (마이크로초)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # 감지 로그 출력 무시
+        for event_time, price in ticks:
+            detector.detect(price, event_time)
+    return (time.perf_counter() - start) / len(ticks) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rates', type=int, nargs='+', default=[100, 1000, 5000], help='초당 체결 수')
+    parser.add_argument('--seconds', type=int, default=120, help='시뮬레이션 기간 (초)')
+    parser.add_argument('--rescan-max-rate', type=int, default=100,
+                        help='이 체결률(초당)을 넘으면 느린 rescan 구현 생략')
+    args = parser.parse_args()
+
+    print(f"{'rate/s':>7} | {'oldest(us)':>10} | {'range(us)':>10} | {'zscore(us)':>10} | {'rescan(us)':>10}")
+    print("-" * 61)
+    for rate in args.rates:
+        ticks = make_ticks(rate, args.seconds)
+        oldest = bench(VolatilityDetector(), ticks)
+        ranged = bench(RangeVolatilityDetector(), ticks)
+        zscore = bench(ZScoreDetector(), ticks)
+        rescan = f"{bench(RescanDetector(), ticks):.2f}" if rate <= args.rescan_max_rate else '-'
+        print(f"{rate:>7} | {oldest:>10.2f} | {ranged:>10.2f} | {zscore:>10.2f} | {rescan:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+# benchmarks/bench_e2e.py
+"""오프라인 종단 간 부하 벤치마크
+
+로컬에 가짜 바이낸스(결합 스트림 웹소켓 + REST)와 가짜 디스코드 웹훅 서버를 별도 프로세스로
+띄우고, 실제 TickerMonitor / PriceDisplay / send_alert 파이프라인을 연결해 측정합니다.
+
+- 처리량: 초당 처리한 체결 수 (서버가 보낸 체결 수와 비교해 밀림 여부 확인)
+- 지연: 가장 최근에 처리한 체결의 체결 시간과 현재 시간의 차이 (p50 / p99 / 최대)
+- 체결-알림 지연: 급변 체결을 보낸 시각부터 웹훅이 도착한 시각까지 (p50 / p90 / p99 / 최대)
+- 자원: 프로세스 CPU 사용률, RSS (현재 / 최대)
+
+결과는 --results 파일(JSON Lines)에 커밋 해시와 함께 추가되며, 같은 조건의 이전 결과와
+비교해 출력합니다. 알림 URL 검증은 .env의 DISCORD_WEBHOOK_URL로 그대로 수행하고,
+전송 대상만 로컬 서버로 바꿉니다.
+
+가격 변동 프로필:
+- calm: 작은 랜덤 워크 (알림 없음)
+- spiky: calm + 심볼마다 --spike-interval초마다 --spike-size% 급변 (방향 교대)
+- volatile: 큰 랜덤 워크 + 급변
+
+사용법:
+    python benchmarks/bench_e2e.py --symbols 200 --rate 5000 --duration 60
+    python benchmarks/bench_e2e.py --symbols 1000 --rate 20000 --runtime asyncio --profile volatile
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import resource
+import threading
+import contextlib
+import subprocess
+import multiprocessing
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+# 프로필 -> (체결당 가격 변동 표준편차, 급변 여부)
+PROFILES = {
+    'calm': (0.00002, False),
+    'spiky': (0.00002, True),
+    'volatile': (0.0005, True),
+}
+
+
+# ---------------------------------------------------------------------------
+# 가짜 거래소 / 웹훅 서버 (별도 프로세스, volmon을 import하지 않음)
+# ---------------------------------------------------------------------------
+
+class _FakeExchange:
+    """결합 스트림 체결 생성기와 REST/웹훅 응답 상태"""
+
+    def __init__(self, symbols, rate, profile, spike_interval, spike_size):
+        self.symbols = symbols
+        self.rate_per_symbol = rate / len(symbols)
+        self.sigma, self.spikes_enabled = PROFILES[profile]
+        self.spike_interval = spike_interval
+        self.spike_size = spike_size / 100
+        self.started = time.time()
+        # 급변 시각은 심볼마다 한 주기 안에 고르게 엇갈리게 배치 (연결 직후는 피함)
+        self.next_spike = {
+            symbol: self.started + 3 + spike_interval * i / len(symbols) for i, symbol in enumerate(symbols)
+        }
+        self.spike_direction = {symbol: 1 if i % 2 else -1 for i, symbol in enumerate(symbols)}
+        self.prices = {symbol: 100.0 for symbol in symbols}
+        self.trade_ids = {symbol: 0 for symbol in symbols}
+        self.spikes = []  # (심볼, 보낸 시각)
+        self.webhooks = []  # (받은 시각, content)
+        self.sent = []  # 연결별 보낸 체결 수
+        self.lock = threading.Lock()
+
+    def next_message(self, symbol: str, now: float) -> str:
+        price = self.prices[symbol] * (1 + random.gauss(0, self.sigma))
+        if self.spikes_enabled and now >= self.next_spike[symbol]:
+            direction = self.spike_direction[symbol]
+            price *= 1 + direction * self.spike_size
+            self.spike_direction[symbol] = -direction
+            self.next_spike[symbol] += self.spike_interval
+            with self.lock:
+                self.spikes.append((symbol, now))
+        self.prices[symbol] = price
+        self.trade_ids[symbol] += 1
+        ms = int(now * 1000)
+        return (
+            f'{{"stream":"{symbol.lower()}@trade","data":{{"e":"trade","E":{ms},"s":"{symbol}",'
+            f'"t":{self.trade_ids[symbol]},"p":"{price:.8f}","q":"0.01000000","T":{ms},"m":false,"M":true}}}}'
+        )
+
+    def stream(self, ws):
+        """연결 하나의 구독 심볼에 대해 설정한 속도로 체결 전송"""
+        query = parse_qs(urlparse(ws.request.path).query)
+        symbols = [name.split('@')[0].upper() for name in query.get('streams', [''])[0].split('/') if name]
+        if not symbols:
+            return
+        with self.lock:
+            slot = len(self.sent)
+            self.sent.append(0)
+        rate = self.rate_per_symbol * len(symbols)
+        start = time.time()
+        sent = 0
+        i = 0
+        try:
+            while True:
+                now = time.time()
+                due = int((now - start) * rate) - sent
+                if due <= 0:
+                    time.sleep(0.001)
+                    continue
+                for _ in range(due):
+                    ws.send(self.next_message(symbols[i % len(symbols)], now))
+                    i += 1
+                sent += due
+                self.sent[slot] = sent
+        except Exception:
+            pass  # 클라이언트 연결 종료
+
+    def stats(self):
+        with self.lock:
+            return {'sent': sum(self.sent), 'spikes': list(self.spikes), 'webhooks': list(self.webhooks)}
+
+
+def _rest_handler(exchange: _FakeExchange):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _reply(self, status, body=b''):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/api/v3/ticker/price':
+                query = parse_qs(url.query)
+                symbols = json.loads(query['symbols'][0]) if 'symbols' in query else exchange.symbols
+                body = [{'symbol': symbol, 'price': '100.00000000'} for symbol in symbols]
+            elif url.path in ('/api/v3/klines', '/api/v3/aggTrades'):
+                body = []  # 과거 데이터 없음 (백필/누락 보충은 즉시 끝남)
+            elif url.path == '/__stats':
+                body = exchange.stats()
+            else:
+                return self._reply(404)
+            self._reply(200, json.dumps(body).encode())
+
+        def do_POST(self):
+            received = time.time()
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            with exchange.lock:
+                exchange.webhooks.append((received, payload.get('content', '')))
+            self._reply(204)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _serve(conn, symbols, rate, profile, spike_interval, spike_size):
+    """가짜 서버 프로세스 진입점. (REST 포트, 웹소켓 포트)를 conn으로 알림"""
+    from websockets.sync.server import serve
+
+    exchange = _FakeExchange(symbols, rate, profile, spike_interval, spike_size)
+    http_server = ThreadingHTTPServer(('127.0.0.1', 0), _rest_handler(exchange))
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    ws_server = serve(exchange.stream, '127.0.0.1', 0, max_size=None, compression=None)
+    conn.send((http_server.server_address[1], ws_server.socket.getsockname()[1]))
+    ws_server.serve_forever()
+
+
+# ---------------------------------------------------------------------------
+# 측정
+# ---------------------------------------------------------------------------
+
+def _percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def _rss_mb():
+    """현재 RSS (MB). /proc이 없으면 최대 RSS"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _alert_latencies(spikes, webhooks, symbols):
+    """급변별로 그 이후 처음 도착한 해당 심볼 알림까지의 지연"""
+    pending = {}
+    for symbol, sent in spikes:
+        pending.setdefault(symbol, []).append(sent)
+    known = set(symbols)
+    pattern = re.compile(r'[A-Z0-9]+USDT')
+    latencies = []
+    for received, content in sorted(webhooks):
+        for symbol in set(pattern.findall(content)) & known:
+            queue = pending.get(symbol)
+            # 이 알림보다 먼저 보낸 급변 중 가장 최근 것과 짝지음 (그 이전 급변은 놓친 것으로 봄)
+            matched = None
+            while queue and queue[0] <= received:
+                matched = queue.pop(0)
+            if matched is not None:
+                latencies.append(received - matched)
+    return latencies
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run(args):
+    parent, child = multiprocessing.Pipe()
+    symbols = [f"S{i:04d}USDT" for i in range(args.symbols)]
+    server = multiprocessing.Process(
+        target=_serve, args=(child, symbols, args.rate, args.profile, args.spike_interval, args.spike_size),
+        daemon=True
+    )
+    server.start()
+    rest_port, ws_port = parent.recv()
+    rest_url = f"http://127.0.0.1:{rest_port}"
+
+    # volmon 모듈이 읽기 전에 접속 주소 설정
+    os.environ['VOLMON_API_URL'] = rest_url
+    os.environ['VOLMON_STREAM_URL'] = f"ws://127.0.0.1:{ws_port}/stream"
+    os.environ['VOLMON_RUNTIME'] = args.runtime
+
+    import logging
+    import main as app
+    from volmon.config import BACKFILL_ON_START, BATCH_INTERVAL_MS, DISCORD_WEBHOOK_URL
+
+    # 콘솔 로그와 화면 출력은 측정에 방해되지 않도록 숨김 (파일 로그는 유지)
+    app.log.console_handler.setLevel(logging.WARNING)
+    webhook_path = urlparse(DISCORD_WEBHOOK_URL).path
+    app.alert_dispatcher.webhook_url = f"{rest_url}{webhook_path}"
+    if args.coalesce_window is not None:
+        app.alert_dispatcher.coalesce_window = args.coalesce_window
+
+    devnull = open(os.devnull, 'w')
+    with contextlib.redirect_stdout(devnull):
+        display = app.PriceDisplay(symbols)
+        monitors = [app.TickerMonitor(symbol, display) for symbol in symbols]
+        app.bootstrap_prices(display, monitors)
+        if BACKFILL_ON_START:
+            app.backfill({monitor.symbol: monitor.warm for monitor in monitors})
+
+        handlers = {monitor.symbol: monitor.on_trade for monitor in monitors}
+        ticker_interval = BATCH_INTERVAL_MS / 1000
+        if args.runtime == 'asyncio':
+            multiplexer = app.AsyncStreamMultiplexer(handlers)
+            ticker = app.IngestTicker(monitors, None, multiplexer, stats_interval=float('inf'))
+            threading.Thread(
+                target=lambda: asyncio.run(multiplexer.run(on_tick=ticker, tick_interval=ticker_interval)),
+                daemon=True
+            ).start()
+        else:
+            multiplexer = app.StreamMultiplexer(handlers)
+            ticker = app.IngestTicker(monitors, None, multiplexer, stats_interval=float('inf'))
+            multiplexer.start()
+
+        def processed():
+            return sum(monitor.batcher.stats()['received'] for monitor in monitors)
+
+        def latest_event_time():
+            return max(monitor.detector.max_event_time for monitor in monitors)
+
+        started = time.time()
+        measure_from = started + args.warmup
+        lags = []
+        base_count = base_cpu = None
+        next_tick = started
+        while True:
+            now = time.time()
+            if now >= started + args.warmup + args.duration:
+                break
+            if args.runtime != 'asyncio' and now >= next_tick:
+                ticker()
+                next_tick = now + ticker_interval
+            if base_count is None and now >= measure_from:
+                base_count = processed()
+                base_cpu = time.process_time()
+                measure_from = now
+            if base_count is not None:
+                latest = latest_event_time()
+                if latest > 0:
+                    lags.append(now - latest)
+            time.sleep(min(ticker_interval, 0.05))
+
+        elapsed = time.time() - measure_from
+        count = processed() - base_count
+        cpu = (time.process_time() - base_cpu) / elapsed * 100
+        time.sleep(max(1.0, app.alert_dispatcher.coalesce_window) + 0.5)  # 마지막 알림 전송 대기
+        multiplexer.stop()
+
+    import requests
+    stats = requests.get(f"{rest_url}/__stats", timeout=10).json()
+    server.terminate()
+    alert_latencies = _alert_latencies(stats['spikes'], stats['webhooks'], symbols)
+
+    return {
+        'revision': _git_revision(),
+        'time': datetime.now().isoformat(timespec='seconds'),
+        'params': {
+            'symbols': args.symbols, 'rate': args.rate, 'profile': args.profile, 'runtime': args.runtime,
+            'duration': args.duration, 'spike_interval': args.spike_interval, 'spike_size': args.spike_size,
+        },
+        'generated': stats['sent'],
+        'processed_rate': count / elapsed,
+        'lag_p50': _percentile(lags, 0.5),
+        'lag_p99': _percentile(lags, 0.99),
+        'lag_max': max(lags) if lags else None,
+        'spikes': len(stats['spikes']),
+        'webhooks': len(stats['webhooks']),
+        'alert_p50': _percentile(alert_latencies, 0.5),
+        'alert_p90': _percentile(alert_latencies, 0.9),
+        'alert_p99': _percentile(alert_latencies, 0.99),
+        'alert_max': max(alert_latencies) if alert_latencies else None,
+        'alerts_matched': len(alert_latencies),
+        'cpu_percent': cpu,
+        'rss_mb': _rss_mb(),
+        'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _load_previous(path: Path, params):
+    """같은 조건의 가장 최근 결과"""
+    if not path.exists():
+        return None
+    previous = None
+    for line in path.read_text(encoding='utf-8').splitlines():
+        if line.strip():
+            record = json.loads(line)
+            if record['params'] == params:
+                previous = record
+    return previous
+
+
+def _report(result, previous):
+    metrics = [
+        ('processed_rate', 'throughput (trades/s)', '{:,.0f}'),
+        ('lag_p50', 'event lag p50 (s)', '{:.3f}'),
+        ('lag_p99', 'event lag p99 (s)', '{:.3f}'),
+        ('lag_max', 'event lag max (s)', '{:.3f}'),
+        ('alert_p50', 'tick-to-alert p50 (s)', '{:.3f}'),
+        ('alert_p90', 'tick-to-alert p90 (s)', '{:.3f}'),
+        ('alert_p99', 'tick-to-alert p99 (s)', '{:.3f}'),
+        ('alert_max', 'tick-to-alert max (s)', '{:.3f}'),
+        ('cpu_percent', 'CPU (%)', '{:.1f}'),
+        ('rss_mb', 'RSS (MB)', '{:.1f}'),
+        ('max_rss_mb', 'max RSS (MB)', '{:.1f}'),
+    ]
+    params = result['params']
+    print(f"revision {result['revision']}: {params['symbols']} symbols, {params['rate']:,} trades/s offered, "
+          f"profile {params['profile']}, runtime {params['runtime']}")
+    print(f"generated {result['generated']:,} trades, {result['spikes']} spikes, {result['webhooks']} webhooks "
+          f"({result['alerts_matched']} matched to spikes)")
+    header = f"{'metric':<24} | {'value':>12}"
+    if previous:
+        header += f" | {'prev (' + previous['revision'] + ')':>16} | {'change':>8}"
+    print(header)
+    print("-" * len(header))
+    for key, label, fmt in metrics:
+        value = result[key]
+        line = f"{label:<24} | {fmt.format(value) if value is not None else '-':>12}"
+        if previous:
+            old = previous.get(key)
+            line += f" | {fmt.format(old) if old is not None else '-':>16}"
+            change = f"{(value - old) / old * 100:+.1f}%" if value is not None and old else '-'
+            line += f" | {change:>8}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=200, help='심볼 수')
+    parser.add_argument('--rate', type=int, default=5000, help='전체 체결 속도 (초당)')
+    parser.add_argument('--duration', type=float, default=60, help='측정 시간 (초)')
+    parser.add_argument('--warmup', type=float, default=5, help='측정 전 준비 시간 (초)')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='spiky', help='가격 변동 프로필')
+    parser.add_argument('--spike-interval', type=float, default=60, help='심볼별 급변 주기 (초)')
+    parser.add_argument('--spike-size', type=float, default=1.0, help='급변 크기 (%%)')
+    parser.add_argument('--runtime', choices=['thread', 'asyncio'], default='thread', help='수신 런타임')
+    parser.add_argument('--coalesce-window', type=float, help='알림 묶음 시간 (초, 기본: 설정값)')
+    parser.add_argument('--results', type=Path, default=ROOT / 'benchmarks' / 'results' / 'bench_e2e.jsonl',
+                        help='결과를 추가할 JSON Lines 파일')
+    args = parser.parse_args()
+
+    result = run(args)
+    previous = _load_previous(args.results, result['params'])
+    _report(result, previous)
+
+    args.results.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.results, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(result) + "\n")
+    print(f"\nresult appended to {args.results}")
+
+
+if __name__ == "__main__":
+    main()
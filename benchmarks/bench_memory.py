@@ -0,0 +1,200 @@
+# benchmarks/bench_memory.py
+"""심볼별 상태의 메모리 벤치마크
+
+심볼마다 모니터(수집기, 감지기)와 알림 상태를 만들고 감지 윈도우를 채운 뒤, 심볼당 RSS 증가량,
+tracemalloc으로 잰 남은 할당 블록 수/바이트, 채우는 동안의 GC 실행 횟수와 시간을 비교합니다.
+- legacy: 이전 구현 (감지기 기록은 (event_time, price) 튜플 데크, 알림 상태는 dict의 dict,
+  모니터/수집기는 인스턴스 __dict__)
+- current: TickerMonitor / VolatilityDetector(array 링 버퍼) / NotificationState (__slots__ 레코드)
+
+각 방식은 별도 프로세스에서 측정하며, tracemalloc은 할당마다 느려지므로 RSS/시간과 할당 통계는
+서로 다른 프로세스에서 잽니다.
+
+사용법:
+    python benchmarks/bench_memory.py --symbols 1000 --rate 20
+"""
+
+import os
+import gc
+import sys
+import time
+import argparse
+import resource
+import threading
+import tracemalloc
+import multiprocessing
+from collections import deque
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+VARIANTS = ('legacy', 'current')
+
+
+class LegacyDetector:
+    """비교용: 이전 VolatilityDetector의 기록 방식 (튜플 데크)"""
+
+    def __init__(self, time_window: float):
+        self.price_history = deque()
+        self.time_window = time_window
+        self.alert_threshold = 0.3
+        self.verbose = True
+        self.allowed_lateness = 2
+        self.max_event_time = float('-inf')
+        self.late_samples = 0
+        self.last_log_time = 0
+        self.log_interval = 300
+        self.last_detected_change = 0
+        self.last_direction = 0
+
+    def warm(self, samples):
+        for event_time, price in samples:
+            self.max_event_time = max(self.max_event_time, event_time)
+            while self.price_history and self.price_history[0][0] < self.max_event_time - self.time_window:
+                self.price_history.popleft()
+            self.price_history.append((event_time, price))
+
+
+class LegacyBatcher:
+    """비교용: __slots__ 없는 TradeBatcher와 같은 속성"""
+
+    def __init__(self):
+        self.interval = 0.1
+        self.max_size = 1000
+        self.policy = 'none'
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        self.received = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.batches = 0
+
+
+class LegacyMonitor:
+    """비교용: __slots__ 없는 TickerMonitor와 같은 속성"""
+
+    def __init__(self, symbol: str, time_window: float):
+        self.symbol = symbol
+        self.display = None
+        self.engine = None
+        self.detector = LegacyDetector(time_window)
+        self.stream = None
+        self.last_price = 0
+        self.last_processed_time = 0
+        self.last_event_time = 0
+        self.batcher = LegacyBatcher()
+        self.lock = threading.Lock()
+        self.alert_sender = None
+
+
+def _rss_bytes() -> int:
+    """현재 RSS (바이트). /proc이 없으면 최대 RSS"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _samples(rate: int, seconds: float, offset: int):
+    """초당 rate건, seconds초 분량의 (event_time, price)"""
+    count = int(rate * seconds)
+    return [(1_700_000_000 + i / rate, 100.0 + ((i + offset) % 97) * 0.01) for i in range(count)]
+
+
+def _gc_collections() -> int:
+    return sum(generation['collections'] for generation in gc.get_stats())
+
+
+def _measure(variant: str, symbols: int, rate: int, trace: bool, conn):
+    """한 방식의 심볼별 상태를 만들고 측정값을 conn으로 보냄 (자식 프로세스, trace면 tracemalloc 통계만)"""
+    from volmon.config import TIME_WINDOW
+    from volmon.utils.notifier import NotificationState
+    names = [f"S{i:04d}USDT" for i in range(symbols)]
+    if variant == 'current':
+        from main import PriceDisplay, TickerMonitor
+        display = PriceDisplay(names)
+    # 윈도우보다 약간 긴 분량 (오래된 샘플이 빠지는 상태)
+    feeds = [_samples(rate, TIME_WINDOW * 1.2, i) for i in range(symbols)]
+
+    gc.collect()
+    rss_before = _rss_bytes()
+    collections_before = _gc_collections()
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+
+    if variant == 'current':
+        monitors = [TickerMonitor(name, display) for name in names]
+        state = NotificationState.isolated()
+        for monitor, samples in zip(monitors, feeds):
+            monitor.detector.warm(samples)
+            state.should_notify(monitor.symbol, 0.5, now=samples[-1][0])
+    else:
+        monitors = [LegacyMonitor(name, TIME_WINDOW) for name in names]
+        state = {}
+        for monitor, samples in zip(monitors, feeds):
+            monitor.detector.warm(samples)
+            state[monitor.symbol] = {
+                "last_notified": samples[-1][0], "last_change": 0.5, "last_threshold_index": 1, "last_direction": 1
+            }
+
+    elapsed = time.perf_counter() - started
+    collections = _gc_collections() - collections_before
+    if trace:
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        stats = snapshot.statistics('filename')
+        conn.send({
+            'alloc_bytes': sum(stat.size for stat in stats),
+            'alloc_blocks': sum(stat.count for stat in stats),
+        })
+    else:
+        gc.collect()
+        conn.send({
+            'variant': variant,
+            'rss': _rss_bytes() - rss_before,
+            'gc_collections': collections,
+            'elapsed': elapsed,
+        })
+    conn.close()
+
+
+def _spawn(variant: str, symbols: int, rate: int, trace: bool) -> dict:
+    context = multiprocessing.get_context('spawn')
+    parent, child = context.Pipe()
+    process = context.Process(target=_measure, args=(variant, symbols, rate, trace, child))
+    process.start()
+    result = parent.recv()
+    process.join()
+    return result
+
+
+def run(variant: str, symbols: int, rate: int) -> dict:
+    result = _spawn(variant, symbols, rate, trace=False)
+    result.update(_spawn(variant, symbols, rate, trace=True))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=1000, help='심볼 수')
+    parser.add_argument('--rate', type=int, default=20, help='심볼당 초당 체결 수 (윈도우 안 샘플 수 = rate * TIME_WINDOW)')
+    parser.add_argument('--variants', nargs='+', choices=VARIANTS, default=list(VARIANTS), help='측정할 방식')
+    args = parser.parse_args()
+
+    results = [run(variant, args.symbols, args.rate) for variant in args.variants]
+    n = args.symbols
+    print(f"{n:,} symbols, {args.rate} trades/s per symbol")
+    print(f"{'variant':<8} | {'RSS/sym(KB)':>11} | {'alloc/sym(KB)':>13} | {'blocks/sym':>10} | "
+          f"{'gc runs':>7} | {'build(s)':>8}")
+    print("-" * 74)
+    for result in results:
+        print(f"{result['variant']:<8} | {result['rss'] / n / 1024:>11.1f} | {result['alloc_bytes'] / n / 1024:>13.1f} | "
+              f"{result['alloc_blocks'] / n:>10.0f} | {result['gc_collections']:>7} | {result['elapsed']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
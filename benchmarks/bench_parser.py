@@ -0,0 +1,77 @@
+# benchmarks/bench_parser.py
+"""메시지 파서 백엔드별 처리량 비교
+
+백엔드마다 두 가지를 측정합니다.
+- loads: 메시지 전체를 dict로 디코딩
+- fast path: 결합 스트림 체결 메시지에서 필요한 필드만 추출 (parse_combined)
+
+--input으로 녹화한 메시지 파일(한 줄에 메시지 하나)을 주면 그 내용을 사용하고,
+없으면 바이낸스 trade/aggTrade 형식의 메시지를 생성합니다.
+
+사용법:
+    python benchmarks/bench_parser.py --count 200000
+    python benchmarks/bench_parser.py --input recorded.jsonl
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from volmon.utils.parser import available_backends, create_parser
+
+
+def make_payloads(count: int):
+    """바이낸스 결합 스트림 trade/aggTrade 메시지 생성"""
+    random.seed(7)
+    payloads = []
+    for i in range(count):
+        symbol = random.choice(['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT'])
+        price = f"{random.uniform(1, 100000):.8f}"
+        qty = f"{random.uniform(0.0001, 10):.8f}"
+        if i % 2:
+            data = {"e": "trade", "E": 1700000000000 + i, "s": symbol, "t": 3000000000 + i,
+                    "p": price, "q": qty, "T": 1700000000000 + i, "m": bool(i % 3), "M": True}
+            stream = f"{symbol.lower()}@trade"
+        else:
+            data = {"e": "aggTrade", "E": 1700000000000 + i, "s": symbol, "a": 2000000000 + i,
+                    "p": price, "q": qty, "f": 100 + i, "l": 105 + i, "T": 1700000000000 + i,
+                    "m": bool(i % 3), "M": True}
+            stream = f"{symbol.lower()}@aggTrade"
+        payloads.append(json.dumps({"stream": stream, "data": data}, separators=(',', ':')))
+    return payloads
+
+
+def rate(func, payloads) -> float:
+    """초당 처리 메시지 수"""
+    start = time.perf_counter()
+    for payload in payloads:
+        func(payload)
+    return len(payloads) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=200000, help='생성할 메시지 수')
+    parser.add_argument('--input', type=Path, help='녹화한 결합 스트림 메시지 파일 (한 줄에 하나)')
+    args = parser.parse_args()
+
+    if args.input:
+        payloads = [line for line in args.input.read_text(encoding='utf-8').splitlines() if line.strip()]
+    else:
+        payloads = make_payloads(args.count)
+
+    print(f"messages: {len(payloads)}")
+    print(f"{'backend':<8} | {'loads (msg/s)':>14} | {'fast path (msg/s)':>18}")
+    print("-" * 48)
+    for backend in available_backends():
+        p = create_parser(backend)
+        print(f"{backend:<8} | {rate(p.loads, payloads):>14,.0f} | {rate(p.parse_combined, payloads):>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
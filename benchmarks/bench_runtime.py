@@ -0,0 +1,139 @@
+# benchmarks/bench_runtime.py
+"""스레드 런타임과 asyncio 런타임의 수신 처리량 비교
+
+심볼마다 소켓 하나(socketpair)를 두고 별도 프로세스가 체결 메시지를 흘려보냅니다.
+- thread: 소켓마다 스레드가 블로킹 읽기 후 콜백 실행 (websocket-client 방식)
+- asyncio: 이벤트 루프 하나가 모든 소켓을 읽고 콜백 실행
+
+사용법:
+    python benchmarks/bench_runtime.py --symbols 500 --messages 200
+"""
+
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import resource
+import threading
+import multiprocessing
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from volmon.utils.detector import VolatilityDetector
+
+
+def _make_message(symbol: str, i: int) -> bytes:
+    """결합 스트림 형식의 체결 메시지 한 줄"""
+    price = 100.0 + (i % 50) * 0.01
+    data = {"e": "trade", "E": i, "s": symbol.upper(), "t": i, "p": f"{price:.2f}", "q": "0.1", "T": i}
+    return (json.dumps({"stream": f"{symbol}@trade", "data": data}) + "\n").encode()
+
+
+def _produce(socks, symbols, messages):
+    """모든 소켓에 돌아가며 메시지를 기록한 뒤 소켓을 닫음"""
+    for i in range(messages):
+        for sock, symbol in zip(socks, symbols):
+            sock.sendall(_make_message(symbol, i))
+    for sock in socks:
+        sock.shutdown(socket.SHUT_WR)
+        sock.close()
+
+
+def _handler_factory():
+    """심볼별 처리 콜백 (JSON 파싱 + 변동성 감지)"""
+    detector = VolatilityDetector()
+
+    def handle(line: bytes):
+        payload = json.loads(line)
+        detector.detect(float(payload['data']['p']))
+
+    return handle
+
+
+def run_threaded(read_socks):
+    def reader(sock):
+        handle = _handler_factory()
+        with sock.makefile('rb') as f:
+            for line in f:
+                handle(line)
+
+    threads = [threading.Thread(target=reader, args=(sock,), daemon=True) for sock in read_socks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_asyncio(read_socks):
+    async def reader(sock):
+        handle = _handler_factory()
+        stream, _ = await asyncio.open_connection(sock=sock)
+        while True:
+            line = await stream.readline()
+            if not line:
+                break
+            handle(line)
+
+    async def run_all():
+        await asyncio.gather(*(reader(sock) for sock in read_socks))
+
+    asyncio.run(run_all())
+
+
+def bench(mode: str, n_symbols: int, n_messages: int) -> dict:
+    symbols = [f"sym{i}usdt" for i in range(n_symbols)]
+    pairs = [socket.socketpair() for _ in symbols]
+    read_socks = [r for r, _ in pairs]
+    write_socks = [w for _, w in pairs]
+
+    producer = multiprocessing.Process(target=_produce, args=(write_socks, symbols, n_messages))
+    usage_before = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_before = time.process_time()
+    start = time.perf_counter()
+    producer.start()
+    for sock in write_socks:
+        sock.close()  # 쓰기 쪽은 생산자 프로세스만 보유
+
+    if mode == 'thread':
+        run_threaded(read_socks)
+    else:
+        run_asyncio(read_socks)
+
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_before
+    usage_after = resource.getrusage(resource.RUSAGE_SELF)
+    producer.join()
+
+    total = n_symbols * n_messages
+    return {
+        "mode": mode,
+        "messages": total,
+        "elapsed_s": round(elapsed, 3),
+        "msgs_per_s": round(total / elapsed),
+        "cpu_s": round(cpu, 3),
+        "ctx_switches": (usage_after.ru_nvcsw - usage_before.ru_nvcsw)
+                        + (usage_after.ru_nivcsw - usage_before.ru_nivcsw),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=500)
+    parser.add_argument('--messages', type=int, default=200, help='심볼당 메시지 수')
+    parser.add_argument('--mode', choices=['thread', 'asyncio', 'both'], default='both')
+    args = parser.parse_args()
+
+    modes = ['thread', 'asyncio'] if args.mode == 'both' else [args.mode]
+    print(f"{'mode':<8} | {'messages':>9} | {'elapsed(s)':>10} | {'msgs/s':>9} | {'cpu(s)':>7} | ctx switches")
+    print("-" * 70)
+    for mode in modes:
+        r = bench(mode, args.symbols, args.messages)
+        print(f"{r['mode']:<8} | {r['messages']:>9} | {r['elapsed_s']:>10} | {r['msgs_per_s']:>9} "
+              f"| {r['cpu_s']:>7} | {r['ctx_switches']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_tick_store.py
+"""체결 기록 저장소 벤치마크
+
+- record: 수신 경로에서 체결 하나를 쓰기 큐에 넣는 비용
+- flush: 큐의 체결을 세그먼트 파일에 쓰는 처리량
+- read: mmap 뷰로 세그먼트를 열어 가격 합계를 구하는 처리량 (복사 없음)
+- load: 심볼 하나를 골라 배열로 가져오는 처리량
+
+사용법:
+    python benchmarks/bench_tick_store.py --count 2000000 --symbols 400
+"""
+
+import sys
+import time
+import random
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from volmon.utils.parser import Trade
+from volmon.utils.tick_store import RECORD_SIZE, TickRecorder, TickStore
+
+
+def make_trades(count: int, symbols: int):
+    """심볼 번호와 체결 목록 생성"""
+    random.seed(3)
+    start = int(time.time() * 1000)
+    return [
+        (random.randrange(symbols), Trade('X', random.uniform(1, 1000), random.uniform(0.01, 5), start + i, i))
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000000, help='기록할 체결 수')
+    parser.add_argument('--symbols', type=int, default=400, help='심볼 수')
+    args = parser.parse_args()
+
+    trades = make_trades(args.count, args.symbols)
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = TickRecorder(directory)
+
+        start = time.perf_counter()
+        for symbol_id, trade in trades:
+            recorder.record(symbol_id, trade)
+        record_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        recorder.flush()
+        flush_time = time.perf_counter() - start
+        recorder.stop()
+
+        store = TickStore(directory)
+        start = time.perf_counter()
+        total = 0
+        rows = 0
+        for _, ticks in store.iter_segments():
+            total += float(ticks['price'].sum())
+            rows += len(ticks)
+        read_time = time.perf_counter() - start
+
+        store.symbols = [f"S{i}" for i in range(args.symbols)]  # 벤치마크는 심볼 표 없이 번호만 기록
+        start = time.perf_counter()
+        selected = store.load('S0')
+        load_time = time.perf_counter() - start
+
+    print(f"trades: {args.count:,} ({args.count * RECORD_SIZE / 1e6:.1f} MB)")
+    print(f"record: {record_time / args.count * 1e9:,.0f} ns/trade")
+    print(f"flush:  {args.count / flush_time:,.0f} trades/s")
+    print(f"read:   {rows / read_time:,.0f} trades/s (mmap view)")
+    print(f"load:   {rows / load_time:,.0f} trades/s scanned, {len(selected):,} selected")
+
+
+if __name__ == "__main__":
+    main()
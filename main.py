@@ -3,128 +3,110 @@
 import sys
 import os
 import time
-import logging
 from pathlib import Path
-import json
+import asyncio
+import queue
 import threading
-import websocket
+import multiprocessing
 from datetime import datetime
 from typing import Dict
 
-# 로깅 설정
-def setup_logging():
-    # 로거 생성
-    logger = logging.getLogger('volmon')
-    logger.setLevel(logging.INFO)
-    
-    # 파일 핸들러 (로깅용)
-    file_handler = logging.FileHandler('volmon.log', encoding='utf-8')
-    file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', 
-                                     datefmt='%Y-%m-%d %H:%M:%S')
-    file_handler.setFormatter(file_formatter)
-    
-    # 콘솔 핸들러 (에러만 표시)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_formatter = logging.Formatter('%(message)s')
-    console_handler.setFormatter(console_formatter)
-    
-    # 핸들러 추가
-    logger.addHandler(file_handler)
-    
-    return logger
+# 로깅 설정 (파일 쓰기는 리스너 스레드에서)
+from volmon.utils import log
+from volmon.utils.log import CONSOLE, setup_logging
 
 logger = setup_logging()
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.append(str(Path(__file__).parent))
 
-from volmon.utils.binance_client import get_price
-from volmon.utils.detector import VolatilityDetector
-from volmon.utils.notifier import send_alert
-from volmon.config import SYMBOLS, BASE_WEBSOCKET_URL, ALERT_THRESHOLD, TIME_WINDOW, UPDATE_INTERVAL
+from volmon.utils.binance_client import binance_client, get_price, get_prices
+from volmon.utils.detector import create_detector
+from volmon.utils.ingest import TradeBatcher
+from volmon.utils.backfill import backfill
+from volmon.utils.tick_store import TickRecorder
+from volmon.utils.vector_engine import VectorDetectionEngine
+from volmon.utils.notifier import NotificationState, StateSnapshotter, send_alert, alert_dispatcher
+from volmon.utils.parser import Trade
+from volmon.utils.stream import StreamMultiplexer
+from volmon.utils.aio_stream import AsyncStreamMultiplexer
+from volmon.utils import metrics
+from volmon.utils.renderer import TerminalRenderer
+from volmon.utils.shared_table import SharedPriceTable
+from volmon.utils.supervisor import backoff_delay
+from volmon.utils.universe import UniverseWatcher
+from volmon.config import (
+    SYMBOLS, ALERT_THRESHOLD, TIME_WINDOW, RUNTIME, BATCH_INTERVAL_MS,
+    DETECTION_ENGINE, BACKFILL_ON_START, RECORD_TRADES, RECORD_DIR, METRICS_ENABLED, DISPLAY_MODE,
+    SHARD_PROCESSES, REQUEST_WEIGHT_LIMIT, UNIVERSE_ENABLED, STATE_PERSIST
+)
 
 class PriceDisplay:
+    """심볼별 가격, 갱신 시간, 변동률 저장소
+
+    수신 스레드는 딕셔너리 항목 하나씩만 쓰고(GIL 아래 원자적) 바로 반환하며,
+    화면 출력은 TerminalRenderer가 자기 스레드에서 스냅샷을 떠서 수행합니다.
+    """
+
     def __init__(self, symbols):
         self.prices = {}  # 가격 저장 딕셔너리
         self.last_update = {}  # 마지막 업데이트 시간 저장
-        self.update_interval = UPDATE_INTERVAL  # 화면 갱신 주기(초)
-        self.lock = threading.Lock()  # 스레드 안전을 위한 락
-        self.last_display_time = 0  # 마지막 화면 갱신 시간
-        self.initial_prices_received = False  # 초기 가격 수신 여부
+        self.changes = {}  # 감지 윈도우 변동률 (%)
         self.expected_symbols = set(symbol.upper() for symbol in symbols)  # 대소문자 구분 없이 처리
 
     def update_price(self, symbol: str, price: float):
-        """가격을 업데이트하고 필요시 화면 갱신"""
-        now = time.time()
+        """가격과 갱신 시간 기록"""
         symbol = symbol.upper()  # 대문자로 통일
-        
-        with self.lock:
-            # 가격 업데이트 (변경 여부와 관계없이)
-            price_changed = symbol not in self.prices or self.prices[symbol] != price
-            if price_changed:
-                self.prices[symbol] = price
-            self.last_update[symbol] = now  # 항상 타임스탬프 업데이트
-            
-            # 가격이 변경되지 않았고 초기 가격도 수신된 상태면 화면 갱신만 수행
-            if not price_changed and self.initial_prices_received:
-                if now - self.last_display_time >= self.update_interval:
-                    self.last_display_time = now
-                    self._update_display()
-                return
+        self.prices[symbol] = price
+        self.last_update[symbol] = time.time()
 
-            # 초기 가격이 아직 수신되지 않았을 때
-            if not self.initial_prices_received:
-                # 모든 심볼의 가격을 수신했는지 확인
-                if all(sym in self.prices for sym in self.expected_symbols):
-                    self.initial_prices_received = True
-                    self.last_display_time = now
-                    self._update_display()
-                return
-                
-            # 초기 가격 이후에는 주기적으로만 업데이트
-            if now - self.last_display_time >= self.update_interval:
-                self.last_display_time = now
-                self._update_display()
-
-
-
-    def _update_display(self):
-        # 헤더 출력
-        print("=== VolMon - Cryptocurrency Volatility Monitor ===")
-        print(f"Monitoring {len(self.expected_symbols)} coins - {', '.join(sorted(self.expected_symbols))}")
-        print(f"Alert threshold: {ALERT_THRESHOLD}% change within {TIME_WINDOW} seconds")
-        print("=" * 50 + "\n")
-        
-        # 가격 테이블 헤더
-        print("=== Cryptocurrency Price Monitor ===")
-        print(f"{'Symbol':<10} | {'Price (USDT)':>15} | Last Updated")
-        print("-" * 50)
-        
-        # 각 심볼별 가격 출력 (알파벳 순 정렬)
-        for symbol in sorted(self.expected_symbols):
-            price = self.prices.get(symbol, 0)
-            last_update_ts = self.last_update.get(symbol, 0)
-            last_update = datetime.fromtimestamp(last_update_ts).strftime('%H:%M:%S') if last_update_ts > 0 else '--:--:--'
-            price_str = f"{price:,.2f}" if price > 0 else 'Loading...'
-            print(f"{symbol:<10} | {price_str:>15} | {last_update}")
-        
-        sys.stdout.flush()  # 출력 버퍼 비우기
+    def update_prices(self, prices: Dict[str, float]):
+        """여러 심볼의 가격을 한 번에 반영 (초기 가격 일괄 적재용)"""
+        now = time.time()
+        for symbol, price in prices.items():
+            symbol = symbol.upper()
+            self.prices[symbol] = price
+            self.last_update[symbol] = now
+
+    def add_symbols(self, symbols):
+        """표시할 심볼 추가 (행은 첫 가격을 받을 때 생김)"""
+        self.expected_symbols = self.expected_symbols | {symbol.upper() for symbol in symbols}
+
+    def remove_symbols(self, symbols):
+        """심볼의 행 삭제"""
+        symbols = {symbol.upper() for symbol in symbols}
+        self.expected_symbols = self.expected_symbols - symbols
+        for symbol in symbols:
+            self.prices.pop(symbol, None)
+            self.last_update.pop(symbol, None)
+            self.changes.pop(symbol, None)
+
+    def update_change(self, symbol: str, change: float):
+        """심볼의 감지 윈도우 변동률 기록"""
+        self.changes[symbol] = change
+
+    def update_changes(self, symbols, changes):
+        """여러 심볼의 변동률을 한 번에 기록 (벡터 엔진용)"""
+        self.changes.update(zip(symbols, changes))
 
 class TickerMonitor:
-    def __init__(self, symbol: str, display: PriceDisplay):
+    __slots__ = (
+        'symbol', 'display', 'engine', 'detector', 'stream', 'last_price', 'last_processed_time', 'last_event_time',
+        'batcher', 'lock', 'alert_sender'
+    )
+
+    def __init__(self, symbol: str, display: PriceDisplay, engine: VectorDetectionEngine = None):
         self.symbol = symbol.upper()  # 거래소 심볼 (예: BTCUSDT)
         self.display = display  # 가격 표시기
-        self.detector = VolatilityDetector()  # 변동성 감지기
-        self.ws_url = f"{BASE_WEBSOCKET_URL}{symbol.lower()}@trade"  # 웹소켓 URL (소문자로 통일)
-        self.ws = None  # 웹소켓 연결 객체
-        self.thread = None  # 웹소켓 스레드
-        self.last_update_time = 0  # 마지막 업데이트 시간
+        self.engine = engine  # 벡터 감지 엔진 (있으면 심볼별 감지기 대신 사용)
+        self.detector = create_detector() if engine is None else None  # 변동성 감지기
+        self.stream = None  # 단독 실행 시 사용하는 결합 스트림 연결
         self.last_price = 0  # 마지막 가격
         self.last_processed_time = 0  # 마지막 처리 시간
-        self.message_queue = []  # 메시지 큐
-        self.processing = False  # 메시지 처리 중 플래그
-        self.reconnect_attempts = 0 # 재연결 시도 횟수
+        self.last_event_time = 0  # 마지막으로 수신한 체결의 거래소 체결 시간 (초)
+        self.batcher = TradeBatcher()  # 체결 묶음 수집기
+        self.lock = threading.Lock()  # 수집기와 감지기 접근 직렬화
+        self.alert_sender = send_alert  # 알림 전송 함수 (디스패처 큐에 넣고 바로 반환)
 
     def get_current_price_rest(self) -> float:
         """REST API를 사용해 현재 가격 조회"""
@@ -136,84 +118,88 @@ class TickerMonitor:
             logger.error(f"[{self.symbol}] REST API 오류: {str(e)[:100]}")
             return -1
 
-    def on_message(self, ws, message):
-        """웹소켓 메시지 처리"""
+    def on_trade(self, trade: Trade):
+        """체결 처리 (결합 스트림 연결의 심볼 핸들러)"""
+        # 거래소 체결 시간 (밀리초). 없으면 수신 시간 사용
+        received = time.time()
+        event_time = trade.event_time / 1000 if trade.event_time is not None else received
+        if metrics.enabled:
+            metrics.event_receive_seconds.observe(received - event_time)
+        if event_time > self.last_event_time:
+            self.last_event_time = event_time
+
+        # 모든 체결을 버퍼에 넣고, 묶음 전송 시점이 되면 한 번에 감지
+        with self.lock:
+            batch = self.batcher.add(event_time, trade.price)
+            if batch:
+                self._process_batch(batch)
+
+    def warm(self, samples):
+        """백필한 과거 샘플로 감지 윈도우를 채움 (알림 없음)"""
+        if not samples:
+            return
+        with self.lock:
+            if self.engine is not None:
+                self.engine.warm(self.symbol, samples)
+            else:
+                self.detector.warm(samples)
+            _, self.last_price = samples[-1]
+
+    def flush(self):
+        """버퍼에 남은 체결을 감지기로 넘김 (메시지가 뜸한 심볼을 위해 주기적으로 호출)"""
+        with self.lock:
+            batch = self.batcher.flush()
+            if batch:
+                self._process_batch(batch)
+
+    def _process_batch(self, batch):
+        """체결 묶음으로 화면 갱신 및 변동성 감지"""
         try:
-            current_time = time.time()
-            
-            # 0.1초 이내에 도착한 메시지는 무시
-            if current_time - self.last_processed_time < 0.1:
-                return
-                
-            data = json.loads(message)
-            price = float(data['p'])  # 현재 가격
-            
-            # 가격이 변경되었는지 확인
-            price_changed = abs(price - self.last_price) >= 0.01  # 부동소수점 비교를 위한 작은 값 사용
-        
-            # 가격이 변경되었거나, 1초 이상 지났으면 업데이트
-            if price_changed or (current_time - self.last_processed_time >= 1.0):
-                if price_changed:
-                    self.last_price = price
-                self.last_processed_time = current_time
-                
-                # 디스플레이 업데이트 (타임스탬프 갱신을 위해 항상 호출)
-                self.display.update_price(self.symbol, self.last_price)
-                
-                # 1초에 한 번만 변동성 감지
-                if current_time - self.last_update_time >= 1.0:
-                    detected, change = self.detector.detect(price)
-                    self.last_update_time = current_time
-                    
-                    # 변동성이 감지된 경우에만 알림 전송 및 로깅
-                    if detected:
-                        print(f"\n[{self.symbol}] Volatility detected! Change: {change:+.2f}% (Threshold: {ALERT_THRESHOLD}%)")
-                        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        send_alert(
-                            symbol=self.symbol,
-                            price=price,
-                            change=change,
-                            timestamp=current_time
-                        )
-                
-        except json.JSONDecodeError:
-            logger.error(f"[{self.symbol}] JSON 디코딩 오류: {message}")
-        except (KeyError, TypeError) as e:
-            logger.error(f"[{self.symbol}] 메시지 형식 오류 (키 또는 타입): {e} - 데이터: {message}")
-        except ValueError:
-            logger.error(f"[{self.symbol}] 가격 변환 오류: {data.get('p', 'N/A')}")
-        except Exception as e:
-            logger.error(f"[{self.symbol}] 메시지 처리 중 예상치 못한 오류: {e}")
+            _, price = batch[-1]  # 묶음의 마지막 가격
+            self.last_price = price
+            self.last_processed_time = time.time()
 
-    def on_error(self, ws, error):
-        """웹소켓 에러 처리"""
-        if hasattr(error, 'status_code') and error.status_code == 429:
-            logger.warning(f"[{self.symbol}] 요청 제한 초과. 60초 후 재연결합니다.")
-            time.sleep(60)
-        else:
-            logger.error(f"[{self.symbol}] 웹소켓 오류: {error}")
+            # 디스플레이 업데이트 (묶음당 한 번)
+            self.display.update_price(self.symbol, price)
 
-    def on_close(self, ws, close_status_code, close_msg):
-        """웹소켓 연결 종료 처리 및 재연결 로직"""
-        logger.warning(f"[{self.symbol}] 웹소켓 연결 종료. 재연결을 시도합니다...")
-        self.reconnect()
+            # 벡터 엔진 사용 시 기록만 하고 감지는 주기 작업에서 일괄 수행
+            if self.engine is not None:
+                self.engine.push(self.symbol, batch)
+                return
 
-    def on_open(self, ws):
-        """웹소켓 연결 성공 시 호출"""
-        logger.info(f"[{self.symbol}] 웹소켓 연결 성공.")
-        self.reconnect_attempts = 0  # 연결 성공 시 재시도 횟수 초기화
+            started = time.perf_counter() if metrics.enabled else 0
+            detected, change = self.detector.detect_batch(batch)
+            if metrics.enabled:
+                metrics.detect_seconds.observe(time.perf_counter() - started)
+            self.display.update_change(self.symbol, self.detector.change)
 
-    def reconnect(self):
-        """지수 백오프를 사용한 재연결"""
-        self.reconnect_attempts += 1
-        wait_time = min(2 ** self.reconnect_attempts, 60)  # 최대 60초까지 대기
-        logger.info(f"[{self.symbol}] {wait_time}초 후 재연결 시도... ({self.reconnect_attempts}번째 시도)")
-        time.sleep(wait_time)
-        self.start()
+            # 변동성이 감지된 경우에만 알림 전송 및 로깅 (다중 윈도우 감지기는 감지된 윈도우마다)
+            if detected:
+                for window, window_change in self.detector.detections:
+                    self.on_detected(price, window_change, window, self.detector.score)
+        except Exception as e:
+            logger.error(f"[{self.symbol}] 메시지 처리 중 예상치 못한 오류: {e}")
 
+    def on_detected(self, price: float, change: float, window: int = None, score: float = None):
+        """변동성 감지 시 알림 전송 및 로그 출력 (window: 다중 윈도우 감지의 윈도우(초), score: z-점수 감지의 z-점수)
 
-    def start(self):
-        """모니터링 시작"""
+        변동이 이어지는 동안 묶음(BATCH_INTERVAL_MS)마다 호출되므로, 콘솔에는 알림 조건을 통과해
+        전송 큐에 들어간 감지만 출력하고 나머지는 디버그 로그로 남깁니다. 샤드 워커는 판단을 부모
+        프로세스에 넘기므로(alert_sender가 None 반환) 콘솔 출력은 부모의 forward_alerts가 담당합니다.
+        """
+        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        queued = self.alert_sender(
+            symbol=self.symbol,
+            price=price,
+            change=change,
+            timestamp=current_time,
+            window=window,
+            score=score
+        )
+        log_detection(queued, self.symbol, change, window, score)
+
+    def load_initial_price(self):
+        """REST API로 초기 가격을 조회해 화면에 반영"""
         # 로그 파일에만 기록
         logger.info(f"[VolMon] Starting monitoring: {self.symbol}")
 
@@ -226,48 +212,481 @@ class TickerMonitor:
             self.last_processed_time = time.time()
             self.display.update_price(self.symbol, rest_price)
 
-        # 웹소켓 연결 시작
-        self.ws = websocket.WebSocketApp(
-            self.ws_url,
-            on_message=self.on_message,
-            on_error=self.on_error,
-            on_close=self.on_close,
-            on_open=self.on_open,
-        )
+    def start(self):
+        """이 심볼만 구독하는 연결로 모니터링 시작 (재연결과 누락 체결 보충은 연결이 담당)"""
+        self.load_initial_price()
+        self.stream = StreamMultiplexer({self.symbol: self.on_trade})
+        self.stream.start()
 
-        # 웹소켓을 별도 스레드에서 실행
-        self.thread = threading.Thread(target=self.ws.run_forever)
-        self.thread.daemon = True  # 메인 스레드 종료 시 함께 종료
-        self.thread.start()
+    def stop(self):
+        """단독 실행 연결 종료"""
+        if self.stream is not None:
+            self.stream.stop()
+
+class IngestTicker:
+    """주기적으로 모든 모니터의 버퍼를 비우고 (벡터 엔진이면 일괄 감지 후) 수집 통계를 기록"""
+    def __init__(self, monitors, engine: VectorDetectionEngine = None, stream=None,
+                 recorder: TickRecorder = None, display: PriceDisplay = None, stats_interval: float = 60):
+        self.monitors = monitors
+        self.engine = engine  # 벡터 감지 엔진
+        self.display = display  # 벡터 엔진의 변동률을 기록할 가격 표시기 (화면을 그리지 않으면 None)
+        self.stream = stream  # 재연결 통계를 제공하는 스트림 멀티플렉서
+        self.recorder = recorder  # 체결 기록기
+        self.stats_interval = stats_interval  # 통계 기록 주기 (초)
+        self.last_stats_time = time.time()  # 마지막 통계 기록 시간
+        self.last_overwritten = 0  # 마지막 통계 기록 때 벡터 엔진이 덮어쓴 샘플 수
+
+    def __call__(self):
+        for monitor in self.monitors:
+            monitor.flush()
+
+        if self.engine is not None:
+            # 모든 심볼을 벡터 연산 한 번으로 평가
+            started = time.perf_counter() if metrics.enabled else 0
+            detected, change, detected_change = self.engine.evaluate()
+            if metrics.enabled:
+                metrics.detect_seconds.observe(time.perf_counter() - started)
+            if self.display is not None:
+                self.display.update_changes(self.engine.symbols, change.tolist())
+            score = self.engine.score
+            for i in detected.nonzero()[0]:
+                monitor = self.monitors[i]
+                monitor.on_detected(monitor.last_price, float(detected_change[i]),
+                                    score=float(score[i]) if score is not None else None)
+
+        now = time.time()
+        if now - self.last_stats_time >= self.stats_interval:
+            self.last_stats_time = now
+            totals = {}
+            for monitor in self.monitors:
+                for key, value in monitor.batcher.stats().items():
+                    totals[key] = totals.get(key, 0) + value
+            logger.info(
+                f"[Ingest] 수신 {totals['received']} / 전달 {totals['delivered']} / "
+                f"압축 {totals['coalesced']} / 버림 {totals['dropped']} / 묶음 {totals['batches']}"
+            )
+            if self.engine is not None:
+                engine = self.engine.stats()
+                logger.info(f"[Engine] 늦은 샘플 {engine['late_samples']} / 덮어씀 {engine['overwritten']}")
+                if engine['overwritten'] > self.last_overwritten:
+                    logger.warning(
+                        f"[Engine] 링 버퍼가 모자라 윈도우 안의 샘플을 덮어썼습니다 "
+                        f"(심볼 {engine['overwritten_symbols']}개). VECTOR_RING_CAPACITY를 늘리세요"
+                    )
+                self.last_overwritten = engine['overwritten']
+            if self.stream is not None:
+                recovery = self.stream.stats()
+                logger.info(
+                    f"[Stream] 복구 {recovery['recoveries']} / 보충 체결 {recovery['gap_trades']} / "
+                    f"보충 실패 {recovery['fill_errors']} / 보충 한도 초과 {recovery['cold_symbols']} / 재연결 대기 {recovery['reconnect_attempts']} / "
+                    f"복구 시간 최근 {recovery['last_recovery_time']:.2f}s, 최대 {recovery['max_recovery_time']:.2f}s"
+                )
+            if self.recorder is not None:
+                records = self.recorder.stats()
+                logger.info(
+                    f"[Recorder] 기록 {records['recorded']} / 대기 {records['pending']} / "
+                    f"버림 {records['dropped']} / 세그먼트 {records['segments']}"
+                )
+            alerts = alert_dispatcher.stats()
+            logger.info(
+                f"[Notifier] 대기 {alerts['queue_depth']} / 전송 {alerts['sent']} / 실패 {alerts['failed']} / "
+                f"버림 {alerts['dropped']} / 재시도 {alerts['retries']} / "
+                f"합침 {alerts['coalesced']} / 메시지 {alerts['messages']} / 건너뜀 {alerts['skipped']} / "
+                f"지연 p50 {alerts['latency_p50']:.3f}s, 최대 {alerts['latency_max']:.3f}s"
+            )
+
+class Universe:
+    """유니버스 변경을 실행 중인 파이프라인에 반영 (UniverseWatcher 콜백)
+
+    추가된 심볼은 모니터(감지기)를 만들어 과거 데이터로 윈도우를 채운 뒤 기존 연결에 구독하고,
+    제거된 심볼은 구독을 해제한 뒤 모니터, 화면 행, 알림 상태를 바로 정리합니다.
+    monitors 목록은 IngestTicker와 함께 쓰므로 제자리에서 바꿉니다.
+    """
+    def __init__(self, display: PriceDisplay, monitors, multiplexer, recorder: TickRecorder = None):
+        self.display = display
+        self.monitors = monitors
+        self.multiplexer = multiplexer
+        self.recorder = recorder
+
+    def apply(self, added, removed):
+        if removed:
+            self.remove(removed)
+        if added:
+            self.add(added)
+
+    def add(self, symbols):
+        monitors = [TickerMonitor(symbol, self.display) for symbol in symbols]
+        if BACKFILL_ON_START:
+            backfill({monitor.symbol: monitor.warm for monitor in monitors}, backfill_lookback(monitors))
+        self.display.add_symbols(symbols)
+        handlers = {monitor.symbol: monitor.on_trade for monitor in monitors}
+        if self.recorder is not None:
+            handlers = self.recorder.wrap(handlers)
+        self.monitors.extend(monitors)
+        self.multiplexer.add_symbols(handlers)
+
+    def remove(self, symbols):
+        self.multiplexer.remove_symbols(symbols)
+        removed = {symbol.upper() for symbol in symbols}
+        self.monitors[:] = [monitor for monitor in self.monitors if monitor.symbol not in removed]
+        self.display.remove_symbols(removed)
+        state = NotificationState()
+        for symbol in removed:
+            state.forget(symbol)
+
+def resolve_symbols(watcher: UniverseWatcher = None):
+    """모니터링할 심볼 (유니버스를 쓰면 거래소 정보로 선택, 실패하면 SYMBOLS)"""
+    if watcher is None:
+        return [symbol.upper() for symbol in SYMBOLS]
+    try:
+        return watcher.load()
+    except Exception as e:
+        logger.error(f"[Universe] 유니버스 조회 오류, SYMBOLS를 사용합니다: {str(e)[:100]}")
+        watcher.symbols = [symbol.upper() for symbol in SYMBOLS]
+        return list(watcher.symbols)
+
+def pipeline_metrics(monitors, engine=None, stream=None, recorder: TickRecorder = None):
+    """스크랩 시점에 심볼별 수신/버림 수, 수신 지연, 알림/재연결/기록 통계를 읽는 지표 수집 함수"""
+    def collect():
+        now = time.time()
+        received, dropped, coalesced, late, lag = [], [], [], [], []
+        for monitor in monitors:
+            labels = {'symbol': monitor.symbol}
+            stats = monitor.batcher.stats()
+            received.append(('volmon_trades_received_total', labels, stats['received']))
+            dropped.append(('volmon_trades_dropped_total', labels, stats['dropped']))
+            coalesced.append(('volmon_trades_coalesced_total', labels, stats['coalesced']))
+            if monitor.detector is not None:
+                late.append(('volmon_late_samples_total', labels, monitor.detector.late_samples))
+            if monitor.last_event_time:
+                lag.append(('volmon_ingest_lag_seconds', labels, now - monitor.last_event_time))
+        yield 'volmon_trades_received_total', 'counter', '심볼별 수신 체결 수', received
+        yield 'volmon_trades_dropped_total', 'counter', '버퍼가 가득 차 버린 체결 수', dropped
+        yield 'volmon_trades_coalesced_total', 'counter', '버퍼 압축으로 합쳐진 체결 수', coalesced
+        if engine is not None:
+            late.append(('volmon_late_samples_total', {'symbol': 'ALL'}, engine.late_samples))
+        yield 'volmon_late_samples_total', 'counter', '워터마크보다 늦게 도착해 버린 체결 수', late
+        if engine is not None:
+            overwritten = engine.stats()
+            yield 'volmon_vector_overwritten_total', 'counter', '벡터 엔진 링 버퍼가 모자라 윈도우 안에서 덮어쓴 샘플 수', [
+                ('volmon_vector_overwritten_total', {}, overwritten['overwritten'])]
+            yield 'volmon_vector_overwritten_symbols', 'gauge', '윈도우 안에서 덮어쓴 적이 있는 심볼 수', [
+                ('volmon_vector_overwritten_symbols', {}, overwritten['overwritten_symbols'])]
+        yield 'volmon_ingest_lag_seconds', 'gauge', '마지막으로 수신한 체결의 체결 시간 이후 경과 시간', lag
+
+        alerts = alert_dispatcher.stats()
+        yield 'volmon_alert_queue_depth', 'gauge', '전송 대기 알림 수', [('volmon_alert_queue_depth', {}, alerts['queue_depth'])]
+        for key in ('sent', 'failed', 'dropped', 'retries', 'rate_limited', 'coalesced', 'messages', 'skipped'):
+            name = f'volmon_alerts_{key}_total'
+            yield name, 'counter', f'알림 디스패처 {key} 수', [(name, {}, alerts[key])]
+        yield 'volmon_alert_state_entries', 'gauge', '알림 상태 수 (심볼, 윈도우별)', [
+            ('volmon_alert_state_entries', {}, len(NotificationState()))]
+
+        if stream is not None:
+            recovery = stream.stats()
+            for key in ('recoveries', 'gap_trades', 'fill_errors', 'cold_symbols'):
+                name = f'volmon_stream_{key}_total'
+                yield name, 'counter', f'스트림 재연결 {key} 수', [(name, {}, recovery[key])]
+            yield ('volmon_stream_recovery_seconds', 'gauge', '마지막 재연결 복구 소요 시간',
+                   [('volmon_stream_recovery_seconds', {}, recovery['last_recovery_time'])])
+
+        if recorder is not None:
+            records = recorder.stats()
+            for key in ('recorded', 'dropped'):
+                name = f'volmon_recorder_{key}_total'
+                yield name, 'counter', f'체결 기록기 {key} 수', [(name, {}, records[key])]
+
+        logs = log.stats()
+        for key in ('dropped', 'suppressed'):
+            name = f'volmon_log_{key}_total'
+            yield name, 'counter', f'로그 {key} 수 (큐 초과, 반복 억제)', [(name, {}, logs.get(key, 0))]
+    return collect
+
+def restore_notification_state():
+    """저장된 알림 상태를 복원하고 주기적 저장 시작 (STATE_PERSIST가 꺼져 있으면 None)"""
+    if not STATE_PERSIST:
+        return None
+    snapshotter = StateSnapshotter()
+    snapshotter.load()
+    snapshotter.start()
+    return snapshotter
+
+def bootstrap_prices(display: PriceDisplay, monitors):
+    """모든 심볼의 초기 가격을 한 번의 REST 요청으로 조회해 화면과 모니터에 반영
+
+    일괄 조회가 실패하면 (심볼 하나가 상장 폐지돼도 요청 전체가 실패) 전체 가격 조회로,
+    그것도 실패하면 심볼별 조회로 대신합니다.
+    """
+    symbols = [monitor.symbol for monitor in monitors]
+    try:
+        prices = get_prices(symbols)
+    except Exception as e:
+        logger.warning(f"[VolMon] 초기 가격 일괄 조회 오류, 전체 가격으로 재시도: {str(e)[:100]}")
+        try:
+            wanted = set(symbols)
+            prices = {symbol: price for symbol, price in get_prices().items() if symbol in wanted}
+        except Exception as e:
+            logger.warning(f"[VolMon] 전체 가격 조회 오류, 심볼별로 재시도: {str(e)[:100]}")
+            prices = {}
+            for symbol in symbols:
+                try:
+                    prices[symbol] = get_price(symbol)
+                except Exception as e:
+                    logger.error(f"[{symbol}] 초기 가격 조회 오류: {str(e)[:100]}")
 
-def main():
-    display = PriceDisplay(SYMBOLS)  # 모든 심볼로 디스플레이 초기화
-    monitors = []
-    
-    # 모든 모니터 초기화
-    for symbol in SYMBOLS:
-        monitor = TickerMonitor(symbol, display)
-        monitors.append(monitor)
-    
-    # 모든 모니터 시작
     for monitor in monitors:
-        monitor.start()
-        time.sleep(0.5)  # API 요청 간 간격 유지
-    
-    # 초기 화면 표시
-    display._update_display()
+        price = prices.get(monitor.symbol)
+        if price:
+            monitor.last_price = price
+    logger.info(f"[VolMon] 초기 가격 {len(prices)}/{len(monitors)}개 조회 완료")
+    display.update_prices(prices)
+
+def create_monitors(symbols, display):
+    """심볼별 모니터와 (벡터 엔진 사용 시) 공유 감지 엔진 생성"""
+    # 벡터 엔진 사용 시 모든 심볼의 윈도우를 한 엔진에서 관리 (행 순서 = 모니터 순서)
+    engine = VectorDetectionEngine(symbols) if DETECTION_ENGINE == 'vector' else None
+    monitors = [TickerMonitor(symbol, display, engine) for symbol in symbols]
+    return monitors, engine
+
+def backfill_lookback(monitors) -> float:
+    """감지기가 필요로 하는 가장 긴 과거 구간 (초, 다중 윈도우는 가장 긴 윈도우, z-점수는 기준 구간까지)"""
+    return max(((monitor.detector or monitor.engine).lookback for monitor in monitors), default=TIME_WINDOW)
+
+def create_ingest(monitors, record_dir: str = RECORD_DIR):
+    """감지 윈도우 백필 후 체결 기록기와 스트림 멀티플렉서 생성"""
+    # 과거 데이터로 감지 윈도우를 미리 채움 (심볼별 병렬 조회)
+    if BACKFILL_ON_START:
+        backfill({monitor.symbol: monitor.warm for monitor in monitors}, backfill_lookback(monitors))
+
+    # 모든 심볼을 결합 스트림 연결로 묶어 수신 (연결은 동시에 시작)
+    handlers = {monitor.symbol: monitor.on_trade for monitor in monitors}
+
+    # 체결 기록 (핸들러 앞에서 큐에 넣기만 하고 파일 쓰기는 기록 스레드가 담당)
+    recorder = TickRecorder(record_dir) if RECORD_TRADES else None
+    if recorder is not None:
+        handlers = recorder.wrap(handlers)
+        recorder.start()
+    if RUNTIME == 'asyncio':
+        multiplexer = AsyncStreamMultiplexer(handlers)
+    else:
+        multiplexer = StreamMultiplexer(handlers)
+    return multiplexer, recorder
+
+def run_ingest(multiplexer, ticker, stop_event=None):
+    """수신과 주기 작업 실행 (stop_event가 설정될 때까지, 없으면 중단될 때까지)"""
+    tick_interval = BATCH_INTERVAL_MS / 1000
+    if RUNTIME == 'asyncio':
+        # 이벤트 루프 하나가 소켓, 파싱, 감지를 모두 담당 (알림 전송은 디스패처 스레드)
+        asyncio.run(_run_async(multiplexer, ticker, tick_interval, stop_event))
+        return
+    multiplexer.start()
+    # 메인 스레드는 버퍼 비우기와 통계 기록 담당
+    while stop_event is None or not stop_event.is_set():
+        time.sleep(tick_interval)
+        ticker()
+
+async def _run_async(multiplexer, ticker, tick_interval: float, stop_event=None):
+    task = asyncio.ensure_future(multiplexer.run(on_tick=ticker, tick_interval=tick_interval))
+    if stop_event is None:
+        await task
+        return
+    while not task.done() and not stop_event.is_set():
+        await asyncio.sleep(0.5)
+    multiplexer.stop()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+def log_detection(queued: bool, symbol: str, change: float, window: int = None, score: float = None, **_):
+    """감지 로그 (알림이 전송 큐에 들어갔으면 콘솔에도 출력)"""
+    if score is not None:
+        message = f"[{symbol}] Volatility detected! Change: {change:+.2f}% (z-score {score:+.1f})"
+    elif window is None:
+        message = f"[{symbol}] Volatility detected! Change: {change:+.2f}% (Threshold: {ALERT_THRESHOLD}%)"
+    else:
+        message = f"[{symbol}] Volatility detected! Change: {change:+.2f}% over {window}s"
+    if queued:
+        logger.info(message, extra=CONSOLE)
+    else:
+        logger.debug(message)
+
+def forward_alerts(alert_queue, timeout: float = 1, limit: int = 1000):
+    """샤드 워커가 넘긴 감지를 부모의 알림 디스패처로 전달 (대기 중인 것을 limit개까지, 없으면 timeout초 대기)"""
+    try:
+        alert = alert_queue.get(timeout=timeout)
+        for _ in range(limit):
+            log_detection(send_alert(**alert), **alert)
+            alert = alert_queue.get_nowait()
+    except queue.Empty:
+        pass
+
+def run_shard(shard_id: int, symbols, all_symbols, table_name: str, alert_queue, log_queue, stop_event, shards: int):
+    """샤드 워커 프로세스: 맡은 심볼의 수신과 감지를 수행하고 결과를 공유 메모리 표에 기록
+
+    감지된 알림은 alert_queue로, 로그는 log_queue로 부모 프로세스에 넘겨 하나의 디스패처와
+    로그 파일에서 처리합니다.
+    """
+    setup_logging(forward_to=log_queue)
+    metrics.enabled = False  # 지표는 부모 프로세스에서만 노출
+    binance_client.weight_limiter.limit = REQUEST_WEIGHT_LIMIT // shards  # 요청 가중치 한도를 워커끼리 나눔
+    table = SharedPriceTable(all_symbols, name=table_name)
+
+    def forward_alert(**alert):
+        alert_queue.put(alert)
+
+    monitors, engine = create_monitors(symbols, table)
+    prices = table.prices
+    for monitor in monitors:
+        monitor.alert_sender = forward_alert
+        monitor.last_price = prices.get(monitor.symbol, 0)
+    logger.info(f"[Shard {shard_id}] 심볼 {len(symbols)}개 수신 시작 (pid {os.getpid()})")
+
+    # 체결 기록은 워커마다 별도 디렉터리에 (세그먼트 파일을 함께 쓰지 않도록)
+    multiplexer, recorder = create_ingest(monitors, os.path.join(RECORD_DIR, f"shard-{shard_id}"))
+    ticker = IngestTicker(monitors, engine, multiplexer, recorder, table)
+    try:
+        run_ingest(multiplexer, ticker, stop_event)
+    except KeyboardInterrupt:
+        pass  # 부모 프로세스가 종료를 담당
+    finally:
+        multiplexer.stop()
+        if recorder is not None:
+            recorder.stop()
+        table.close()
+
+def run_sharded(shards: int, symbols):
+    """심볼을 shards개 워커 프로세스로 나눠 수신/감지하고, 부모는 화면과 알림 전송만 담당
+
+    GIL 때문에 한 프로세스의 파싱과 감지는 코어 하나를 넘지 못하므로, 전체 심볼을
+    구독할 때는 워커 수만큼 코어를 나눠 씁니다.
+    """
+    table = SharedPriceTable(symbols)  # 가격, 변동률, 갱신 시간 (워커가 쓰고 부모가 읽음)
+    try:
+        table.update_prices(get_prices(table.symbols))
+    except Exception as e:
+        logger.error(f"[VolMon] 초기 가격 일괄 조회 오류: {str(e)[:100]}")
+
+    context = multiprocessing.get_context('spawn')  # 스레드가 있는 부모를 fork하지 않음
+    alert_queue = context.Queue()
+    log_queue = log.forward_queue(context)
+    stop_event = context.Event()
+
+    def spawn(shard_id: int):
+        process = context.Process(
+            target=run_shard,
+            args=(shard_id, table.symbols[shard_id::shards], table.symbols, table.name, alert_queue, log_queue, stop_event, shards),
+            name=f"volmon-shard-{shard_id}",
+            daemon=True
+        )
+        process.start()
+        return process
+
+    # 거래량이 큰 심볼이 한 워커에 몰리지 않도록 번갈아 배정
+    processes = [spawn(shard_id) for shard_id in range(shards)]
+    restarts = [0] * shards
+    restart_at = [0.0] * shards
+    logger.info(f"[VolMon] 심볼 {len(table.symbols)}개를 워커 프로세스 {shards}개로 나눠 수신합니다.")
+
+    snapshotter = restore_notification_state()  # 알림 판단은 부모 프로세스에서만
+    renderer = TerminalRenderer(table) if DISPLAY_MODE != 'headless' else None
+    if renderer is not None:
+        renderer.start()
+    if METRICS_ENABLED:
+        metrics.registry.register(pipeline_metrics([]))
+        metrics.start_http_server()
 
     try:
-        # 메인 스레드 유지
         while True:
-            time.sleep(1)
+            forward_alerts(alert_queue)
+
+            # 비정상 종료한 워커는 백오프 후 다시 시작
+            now = time.time()
+            for shard_id, process in enumerate(processes):
+                if process.is_alive():
+                    continue
+                if not restart_at[shard_id]:
+                    restarts[shard_id] += 1
+                    restart_at[shard_id] = now + backoff_delay(restarts[shard_id])
+                    logger.error(f"[Shard {shard_id}] 워커 종료 (exitcode {process.exitcode}), 재시작 대기 중")
+                elif now >= restart_at[shard_id]:
+                    restart_at[shard_id] = 0.0
+                    processes[shard_id] = spawn(shard_id)
+    except KeyboardInterrupt:
+        print("\n프로그램을 종료합니다.")
+    finally:
+        stop_event.set()
+        if renderer is not None:
+            renderer.stop()
+        for process in processes:
+            process.join(5)
+            if process.is_alive():
+                process.terminate()
+        table.close()
+        alert_dispatcher.stop()
+        if snapshotter is not None:
+            snapshotter.stop()
+        print("모니터링이 중지되었습니다.")
+
+def main():
+    # 유니버스를 쓰면 거래소 정보와 24시간 거래대금으로 심볼을 정함
+    watcher = UniverseWatcher() if UNIVERSE_ENABLED else None
+    symbols = resolve_symbols(watcher)
+
+    if SHARD_PROCESSES > 1:
+        # 워커 프로세스마다 공유 메모리 표의 행이 고정이므로 유니버스는 시작 시에만 정함
+        run_sharded(SHARD_PROCESSES, symbols)
+        return
+
+    display = PriceDisplay(symbols)  # 모든 심볼로 디스플레이 초기화
+    monitors, engine = create_monitors(symbols, display)
+
+    # 모든 심볼의 초기 가격을 한 번에 조회
+    bootstrap_prices(display, monitors)
+
+    # 재시작 전 알림 단계를 이어받아 같은 변동으로 다시 알리지 않음
+    snapshotter = restore_notification_state()
+
+    multiplexer, recorder = create_ingest(monitors)
+
+    # 화면은 렌더러 스레드가 주기적으로 그림 (headless면 그리지 않음)
+    renderer = TerminalRenderer(display) if DISPLAY_MODE != 'headless' else None
+    ticker = IngestTicker(monitors, engine, multiplexer, recorder, display if renderer is not None else None)
+
+    # 단계별 지연과 파이프라인 통계를 /metrics로 노출
+    if METRICS_ENABLED:
+        metrics.registry.register(pipeline_metrics(monitors, engine, multiplexer, recorder))
+        metrics.start_http_server()
+    if renderer is not None:
+        renderer.start()
+
+    # 유니버스 변경은 연결을 끊지 않고 SUBSCRIBE/UNSUBSCRIBE로 반영
+    if watcher is not None:
+        if engine is not None:
+            logger.warning("[Universe] 벡터 엔진은 심볼 행이 고정이라 유니버스를 시작 시에만 정합니다.")
+        else:
+            watcher.on_change = Universe(display, monitors, multiplexer, recorder).apply
+            watcher.start()
+    try:
+        run_ingest(multiplexer, ticker)
     except KeyboardInterrupt:
         print("\n프로그램을 종료합니다.")
         sys.exit(0)
     except Exception as e:
-        print(f"\n예상치 못한 오류 발생: {str(e)}")
+        logger.error(f"[VolMon] 예상치 못한 오류 발생: {str(e)}", exc_info=True, extra=CONSOLE)
     finally:
+        if watcher is not None:
+            watcher.stop()
+        if renderer is not None:
+            renderer.stop()
+        multiplexer.stop()
+        if recorder is not None:
+            recorder.stop()
+        alert_dispatcher.stop()
+        if snapshotter is not None:
+            snapshotter.stop()
         print("모니터링이 중지되었습니다.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,79 @@
+# tests/test_detector.py
+"""감지기의 워터마크(늦은 체결)와 최고가/최저가 윈도우 검사"""
+
+import random
+
+from volmon.utils.detector import VolatilityDetector, RangeVolatilityDetector
+
+
+def _window(samples, time_window):
+    """받아들인 샘플 중 가장 늦은 이벤트 시간 기준 time_window 안의 샘플 (이벤트 시간 순)"""
+    latest = max(t for t, _ in samples)
+    return sorted((t, p) for t, p in samples if t >= latest - time_window)
+
+
+def _accepted(samples, lateness):
+    """워터마크(도착 순서상 최대 이벤트 시간 - lateness)를 통과한 샘플"""
+    accepted, max_time = [], float('-inf')
+    for t, p in samples:
+        if t >= max_time:
+            max_time = t
+        elif t < max_time - lateness:
+            continue
+        accepted.append((t, p))
+    return accepted
+
+
+def _stream(count, seed, disorder=3.0):
+    rng = random.Random(seed)
+    t, price, samples = 1000.0, 100.0, []
+    for _ in range(count):
+        t += rng.expovariate(5)
+        price *= 1 + rng.gauss(0, 0.002)
+        # 일부 체결은 disorder초까지 늦게 도착
+        samples.append((t - rng.uniform(0, disorder) if rng.random() < 0.3 else t, price))
+    return samples
+
+
+def test_late_sample_is_dropped_and_counted():
+    detector = VolatilityDetector(time_window=60, alert_threshold=1)
+    detector.detect_batch([(100.0, 100.0), (110.0, 101.0)])
+    # 워터마크(110 - 허용 지연)보다 이른 샘플은 버리고 변동률에 반영하지 않음
+    detector.detect_batch([(100.5, 50.0)])
+    assert detector.late_samples == 1
+    assert detector.change == 1.0
+
+
+def test_out_of_order_sample_within_lateness_is_inserted():
+    detector = VolatilityDetector(time_window=60, alert_threshold=1)
+    detector.warm([(100.0, 100.0), (102.0, 102.0)])
+    detector.warm([(101.5, 101.0)])
+    assert detector.late_samples == 0
+    # 마지막 가격은 이벤트 시간이 가장 늦은 샘플
+    assert detector.change == 2.0
+
+
+def test_oldest_change_matches_brute_force_with_disorder():
+    samples = _stream(3000, seed=1)
+    detector = VolatilityDetector(time_window=30, alert_threshold=100)
+    lateness = detector.allowed_lateness
+    seen = []
+    for sample in samples:
+        detector.warm([sample])
+        seen.append(sample)
+        window = _window(_accepted(seen, lateness), 30)
+        expected = (window[-1][1] - window[0][1]) / window[0][1] * 100 if len(window) >= 2 else 0
+        assert abs(detector.change - expected) < 1e-9
+
+
+def test_range_window_matches_brute_force_with_disorder():
+    samples = _stream(3000, seed=2)
+    detector = RangeVolatilityDetector(time_window=20, alert_threshold=100)
+    lateness = detector.allowed_lateness
+    seen = []
+    for sample in samples:
+        detector.warm([sample])
+        seen.append(sample)
+        window = _window(_accepted(seen, lateness), 20)
+        prices = [p for _, p in window]
+        assert detector.window_range() == (min(prices), max(prices))
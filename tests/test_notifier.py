@@ -0,0 +1,78 @@
+# tests/test_notifier.py
+"""알림 디스패처의 429 응답과 레이트 리밋 헤더 처리 검사"""
+
+import json
+import time
+
+from volmon.utils.binance_client import RequestWeightLimiter
+from volmon.utils.notifier import AlertDispatcher
+
+
+class FakeResponse:
+    def __init__(self, status_code=204, headers=None, body=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body
+        self.text = '' if body is None else json.dumps(body)
+
+    def json(self):
+        if self.body is None:
+            raise ValueError('no body')
+        return self.body
+
+
+class FakeSession:
+    """정해진 응답을 차례로 돌려주는 세션 대역"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.posts = 0
+
+    def post(self, url, data=None, timeout=None):
+        self.posts += 1
+        return self.responses.pop(0)
+
+
+def _dispatcher(responses):
+    dispatcher = AlertDispatcher(webhook_url='https://discord.com/api/webhooks/1/test', max_retries=2)
+    dispatcher.session = FakeSession(responses)
+    return dispatcher
+
+
+def test_429_is_retried_after_retry_after():
+    dispatcher = _dispatcher([FakeResponse(429, body={'retry_after': 0.01}), FakeResponse(204)])
+    assert dispatcher._deliver({'content': 'test'})
+    assert dispatcher.rate_limited == 1
+    assert dispatcher.retries == 1
+    assert dispatcher.session.posts == 2
+
+
+def test_429_with_http_date_retry_after_is_retried():
+    retry_after = {'Retry-After': 'Wed, 21 Oct 2026 07:28:00 GMT'}
+    dispatcher = _dispatcher([FakeResponse(429, headers=retry_after), FakeResponse(204)])
+    assert AlertDispatcher._retry_after(dispatcher.session.responses[0]) == 1.0
+    assert dispatcher._deliver({'content': 'test'})
+    assert dispatcher.rate_limited == 1
+
+
+def test_rate_limit_headers_delay_next_send():
+    dispatcher = _dispatcher([])
+    dispatcher._update_rate_limit(FakeResponse(headers={'X-RateLimit-Remaining': '0',
+                                                        'X-RateLimit-Reset-After': '2.5'}))
+    assert dispatcher.rate_limited_until > time.monotonic() + 2
+
+
+def test_malformed_rate_limit_headers_are_ignored():
+    dispatcher = _dispatcher([])
+    for headers in ({'X-RateLimit-Remaining': 'abc', 'X-RateLimit-Reset-After': '1'},
+                    {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset-After': 'soon'}):
+        dispatcher._update_rate_limit(FakeResponse(headers=headers))
+    assert dispatcher.rate_limited_until == 0
+
+
+def test_malformed_used_weight_header_is_ignored():
+    limiter = RequestWeightLimiter(limit=100)
+    limiter.update('not-a-number')
+    assert limiter.used == 0
+    limiter.update('42')
+    assert limiter.used == 42
@@ -0,0 +1,79 @@
+# tests/test_supervisor.py
+"""GapFiller의 중복 제거와 전달 순서 검사"""
+
+import threading
+import time
+
+from volmon.utils.parser import Trade
+from volmon.utils.supervisor import GapFiller
+
+
+class FakeClient:
+    """last_id 다음부터 정해진 ID까지 집계 체결을 돌려주는 aggTrades 대역 (release 전까지 대기)"""
+
+    def __init__(self, last_id: int, blocking: bool = False):
+        self.last_id = last_id
+        self.release = threading.Event()
+        if not blocking:
+            self.release.set()
+        self.calls = 0
+
+    def iter_agg_trades(self, symbol, start_ms, end_ms):
+        self.calls += 1
+        self.release.wait(5)
+        # 이미 전달한 체결과 겹치는 구간부터 돌려줌 (중복 제거 확인용)
+        for trade_id in range(98, self.last_id + 1):
+            yield {'p': '1', 'q': '1', 'T': start_ms, 'l': trade_id}
+
+
+def _filler(client):
+    received = []
+    filler = GapFiller({'btcusdt': lambda trade: received.append(trade.trade_id)}, 'Test', client=client)
+    return filler, filler.wrap()['btcusdt'], received
+
+
+def _trade(trade_id):
+    return Trade('BTCUSDT', 1.0, 1.0, int(time.time() * 1000), trade_id)
+
+
+def test_gap_is_filled_in_order_without_duplicates():
+    filler, on_trade, received = _filler(FakeClient(last_id=105))
+    on_trade(_trade(100))
+    filler.disconnected()
+    down_since = filler.begin_recovery()
+    assert down_since is not None
+    # 보충 중 들어온 실시간 체결은 보류했다가 보충 뒤에 전달 (보충과 겹치는 104, 105는 중복)
+    on_trade(_trade(104))
+    on_trade(_trade(105))
+    on_trade(_trade(106))
+    filler.fill(down_since)
+    assert received == [100, 101, 102, 103, 104, 105, 106]
+    assert filler.stats()['gap_trades'] == 5
+    on_trade(_trade(105))
+    assert received[-1] == 106
+
+
+def test_first_connect_does_not_fill():
+    filler, _, _ = _filler(FakeClient(last_id=105))
+    assert filler.begin_recovery() is None
+
+
+def test_disconnect_during_fill_is_recovered_next():
+    client = FakeClient(last_id=110, blocking=True)
+    filler, on_trade, received = _filler(client)
+    on_trade(_trade(100))
+    filler.disconnected()
+    first = threading.Thread(target=filler.fill, args=(filler.begin_recovery(),))
+    first.start()
+    # 첫 보충이 끝나기 전에 다시 끊기고 재연결
+    filler.disconnected()
+    down_since = filler.begin_recovery()
+    assert down_since is not None
+    second = threading.Thread(target=filler.fill, args=(down_since,))
+    second.start()
+    on_trade(_trade(111))
+    client.release.set()
+    first.join(5)
+    second.join(5)
+    assert received == list(range(100, 112))
+    assert filler.stats()['recoveries'] == 2
@@ -0,0 +1,75 @@
+# tests/test_vector_engine.py
+"""벡터 엔진이 같은 체결 흐름에서 심볼별 감지기와 같은 결과를 내는지 검사"""
+
+import random
+
+import pytest
+
+from volmon.utils.detector import VolatilityDetector, ZScoreDetector
+
+np = pytest.importorskip('numpy')
+from volmon.utils.vector_engine import VectorDetectionEngine, VectorZScore  # noqa: E402
+
+
+def _stream(seed, seconds, gap):
+    """평균 gap초 간격, 허용 지연 안에서 순서가 뒤바뀐 체결 흐름"""
+    rng = random.Random(seed)
+    t, price, samples = 1_000_000.0, 100.0, []
+    while t < 1_000_000 + seconds:
+        t += rng.expovariate(1 / gap)
+        price *= 1 + rng.gauss(0, 0.0005)
+        samples.append((t - rng.uniform(0, 1.5), price))
+    return samples
+
+
+def _batches(samples, size=7):
+    for start in range(0, len(samples), size):
+        yield samples[start:start + size]
+
+
+def test_change_matches_scalar_detector():
+    samples = _stream(seed=3, seconds=600, gap=0.2)
+    detector = VolatilityDetector(time_window=60, alert_threshold=0.3)
+    engine = VectorDetectionEngine(['BTCUSDT'], zscore=False, time_window=60)
+    for batch in _batches(samples):
+        detector.warm(batch)
+        engine.push('BTCUSDT', batch)
+        _, change, _ = engine.evaluate()
+        assert change[0] == pytest.approx(detector.change, abs=1e-9)
+    assert engine.late_samples == detector.late_samples
+
+
+def test_spike_inside_batch_is_detected_like_scalar_detector():
+    base = [(1000 + i * 0.1, 100.0) for i in range(50)]
+    batch = [(1005.1, 100.0), (1005.2, 103.0), (1005.3, 100.1)]
+    detector = VolatilityDetector(time_window=60, alert_threshold=1)
+    engine = VectorDetectionEngine(['BTCUSDT'], zscore=False, time_window=60)
+    detector.warm(base)
+    engine.warm('BTCUSDT', base)
+    engine.evaluate()
+    engine.push('BTCUSDT', batch)
+    detected, _, detected_change = engine.evaluate()
+    assert detector.detect_batch(batch) == (True, pytest.approx(3.0))
+    assert detected[0] and detected_change[0] == pytest.approx(3.0)
+
+
+@pytest.mark.parametrize('gap, warm_seconds', [(0.3, 0), (0.3, 800), (3.0, 800)])
+def test_zscore_matches_scalar_detector(gap, warm_seconds):
+    samples = _stream(seed=4, seconds=warm_seconds + 1500, gap=gap)
+    warm = [sample for sample in samples if sample[0] < 1_000_000 + warm_seconds]
+    live = samples[len(warm):]
+    detector = ZScoreDetector(time_window=60, baseline=600, min_samples=100)
+    engine = VectorDetectionEngine(['BTCUSDT'], zscore=True, time_window=60)
+    engine.zscore = VectorZScore(1, time_window=60, baseline=600, min_samples=100)
+    detector.warm(warm)
+    engine.warm('BTCUSDT', warm)
+
+    compared = 0
+    for batch in _batches(live):
+        detector.warm(batch)
+        engine.push('BTCUSDT', batch)
+        z, _ = detector.scores()
+        vector_z = engine.zscore.scores(engine.latest_price)[0][0]
+        assert vector_z == pytest.approx(z, abs=1e-9)
+        compared += z != 0
+    assert compared
@@ -8,8 +8,9 @@ from typing import Dict, List
 load_dotenv()
 
 # 바이낸스 API 설정
-BASE_API_URL = 'https://api.binance.com'  # REST API 기본 주소
+BASE_API_URL = os.getenv('VOLMON_API_URL', 'https://api.binance.com')  # REST API 기본 주소
 BASE_WEBSOCKET_URL = 'wss://stream.binance.com:9443/ws/'  # 웹소켓 주소
+BASE_STREAM_URL = os.getenv('VOLMON_STREAM_URL', 'wss://stream.binance.com:9443/stream')  # 결합 스트림 웹소켓 주소
 
 # API 키 (필수)
 BINANCE_API_KEY = os.environ["BINANCE_API_KEY"]
@@ -19,8 +20,90 @@ BINANCE_API_SECRET = os.environ["BINANCE_API_SECRET"]
 SYMBOLS = ['btcusdt', 'ethusdt']  # 모니터링할 코인 심볼
 ALERT_THRESHOLD = 0.3  # 변동성 알림 임계값 (%)
 TIME_WINDOW = 60  # 변동성 계산 기간 (초)
+ALLOWED_LATENESS = 2  # 순서가 뒤바뀐 체결을 허용하는 최대 지연 (초, 이벤트 시간 기준)
+DETECTION_ENGINE = 'detector'  # 감지 엔진 ('detector': 심볼별 감지기, 'vector': NumPy 일괄 감지, numpy 필요)
+VECTOR_RING_CAPACITY = 4096  # 벡터 엔진의 심볼당 링 버퍼 슬롯 수
+DETECTOR_RING_CAPACITY = 256  # 심볼별 감지기 가격 기록의 처음 칸 수 (윈도우 안 체결이 더 많으면 두 배씩 늘림)
+DETECTOR_MODE = 'oldest'  # 감지 방식 ('oldest': 윈도우 첫 가격 대비, 'range': 윈도우 최고가/최저가 대비, 'multi': DETECTION_WINDOWS 동시 감지, 'zscore': 종목 자신의 기준 변동성 대비)
+DETECTION_WINDOWS = {  # 'multi' 모드의 윈도우 (초) -> 알림 단계 (%, 첫 값이 감지 임계값)
+    60: [0.3, 0.5, 1.0, 2.0, 3.0, 5.0],
+    300: [0.8, 1.5, 3.0, 5.0],
+    900: [1.5, 3.0, 5.0, 8.0],
+    3600: [3.0, 5.0, 8.0, 12.0],
+}
+ZSCORE_BASELINE_WINDOW = 3600  # 'zscore' 모드의 기준 구간 (초, 감지 윈도우 바로 앞 구간의 1초 로그 수익률로 기준 변동성 계산)
+ZSCORE_MIN_SAMPLES = 300  # 감지를 시작하는 기준 구간 최소 표본 수 (초)
+ZSCORE_THRESHOLD = 4.0  # 감지 윈도우 수익률의 z-점수 임계값 (기준 표준편차의 배수)
+ZSCORE_RV_MULTIPLE = 3.0  # 감지 윈도우 실현 변동성이 기준의 이 배수 이상이어도 감지 (0이면 z-점수만)
+ZSCORE_STEPS = [4.0, 6.0, 8.0, 12.0]  # z-점수 알림 단계 (|z|)
 REQUEST_TIMEOUT = 10  # API 요청 제한 시간 (초)
+REQUEST_WEIGHT_LIMIT = 5000  # 1분당 사용할 최대 요청 가중치 (바이낸스 한도 6000에서 여유분 제외)
+BULK_PRICE_SYMBOLS_LIMIT = 100  # 이 수 이하면 symbols 파라미터로, 초과하면 전체 가격 조회 후 필터링
+HTTP_POOL_SIZE = 8  # REST 요청 keep-alive 연결 풀 크기
 UPDATE_INTERVAL = 5 # 화면 갱신 주기 (초)
+DISPLAY_MODE = os.getenv('VOLMON_DISPLAY', 'table')  # 화면 표시 방식 ('table': 심볼 순 페이지, 'top': 변동률 상위, 'headless': 표시 안 함)
+DISPLAY_ROWS = 40  # 한 화면에 표시할 최대 심볼 수
+DISPLAY_PAGE_SECONDS = 10  # table 방식에서 다음 페이지로 넘어가는 주기 (초)
+MAX_STREAMS_PER_CONNECTION = 1024  # 웹소켓 연결 하나당 최대 스트림 수 (바이낸스 제한)
+RUNTIME = os.getenv('VOLMON_RUNTIME', 'thread')  # 수신 런타임 ('thread' 또는 'asyncio')
+SHARD_PROCESSES = int(os.getenv('VOLMON_SHARDS', '1'))  # 심볼을 나눠 수신/감지할 워커 프로세스 수 (1이면 단일 프로세스)
+PARSER_BACKEND = os.getenv('VOLMON_PARSER', 'auto')  # 메시지 파서 ('auto', 'orjson', 'msgspec', 'json')
+BATCH_INTERVAL_MS = 100  # 체결 묶음을 감지기로 넘기는 주기 (밀리초)
+BATCH_MAX_SIZE = 1000  # 심볼별 체결 버퍼 최대 크기
+BATCH_POLICY = 'none'  # 버퍼가 가득 찼을 때 처리 방식 ('none': 손실 없음, 'coalesce': 압축, 'drop': 버림)
+
+# 심볼 유니버스 설정
+UNIVERSE_ENABLED = False  # 거래소 정보로 모니터링 심볼을 정하고 주기적으로 갱신 (False면 SYMBOLS 사용)
+UNIVERSE_QUOTE_ASSETS = ['USDT']  # 포함할 호가 자산
+UNIVERSE_MIN_QUOTE_VOLUME = 10_000_000  # 24시간 거래대금 하한 (호가 자산 기준)
+UNIVERSE_MAX_SYMBOLS = 0  # 최대 심볼 수 (거래대금 상위, 0이면 제한 없음)
+UNIVERSE_REFRESH_INTERVAL = 3600  # 유니버스 갱신 주기 (초)
+
+# 메타데이터 캐시 설정
+CACHE_DIR = 'cache'  # 거래소 정보 디스크 캐시 디렉터리
+EXCHANGE_INFO_TTL = 3600  # 거래소 정보를 다시 조회하지 않는 시간 (초)
+EXCHANGE_INFO_STALE_TTL = 86400  # 유효 시간이 지난 뒤 백그라운드로 갱신하는 동안 이전 값을 쓰는 최대 나이 (초)
+
+# 알림 상태 저장 설정
+STATE_PERSIST = True  # 알림 상태를 주기적으로 디스크에 저장하고 시작 시 복원 (재시작 직후 중복 알림 방지)
+STATE_FILE = os.path.join(CACHE_DIR, 'notification_state.json')  # 알림 상태 저장 파일
+STATE_SNAPSHOT_INTERVAL = 5  # 저장 주기 (초, 바뀐 것이 없으면 쓰지 않음)
+STATE_MAX_AGE = 3600  # 복원할 상태의 최대 나이 (초, 마지막 알림 기준)
+STATE_LOCK_SHARDS = 64  # 알림 상태 잠금 수 (심볼별로 나눠 다른 심볼끼리 기다리지 않음)
+
+# 감지 윈도우 백필 설정
+BACKFILL_ON_START = True  # 시작 시 과거 데이터로 감지 윈도우 채우기
+BACKFILL_SOURCE = 'klines'  # 백필 데이터 ('klines': 1초봉, 'aggTrades': 집계 체결)
+BACKFILL_WORKERS = 8  # 동시에 백필할 심볼 수
+
+# 재연결 설정
+RECONNECT_BASE_DELAY = 1  # 재연결 대기 기본값 (초, 시도마다 두 배)
+RECONNECT_MAX_DELAY = 60  # 재연결 대기 최댓값 (초)
+GAP_FILL_ON_RECONNECT = True  # 재연결 후 끊긴 구간의 체결을 aggTrades로 보충
+GAP_FILL_WORKERS = 4  # 연결 하나에서 동시에 보충할 심볼 수
+GAP_FILL_MAX_WEIGHT = 1000  # 재연결 한 번에 보충에 쓸 최대 요청 가중치 (aggTrades 한 페이지 4, 넘으면 보충 없이 재개)
+
+# 체결 기록 설정
+RECORD_TRADES = False  # 수신한 체결을 바이너리 세그먼트 파일로 기록
+RECORD_DIR = 'ticks'  # 기록 디렉터리
+RECORD_FLUSH_INTERVAL = 1.0  # 묶어서 파일에 쓰는 주기 (초)
+RECORD_SEGMENT_MAX_MB = 256  # 세그먼트 파일 최대 크기 (넘으면 같은 날의 다음 세그먼트로)
+RECORD_QUEUE_SIZE = 1_000_000  # 쓰기 대기 최대 체결 수 (초과 시 버림)
+RECORD_RETENTION_DAYS = 0  # 세그먼트 보관 일수 (0이면 삭제하지 않음)
+
+# 지표 설정
+METRICS_ENABLED = False  # 단계별 지연 측정과 /metrics 엔드포인트 (Prometheus 텍스트 형식)
+METRICS_HOST = '127.0.0.1'  # 지표 서버 주소 (로컬에서만 접근)
+METRICS_PORT = 9108  # 지표 서버 포트
+
+# 로그 설정
+LOG_FILE = 'volmon.log'  # 로그 파일 경로
+LOG_FORMAT = os.getenv('VOLMON_LOG_FORMAT', 'text')  # 파일 로그 형식 ('text' 또는 'json': 한 줄에 JSON 하나)
+LOG_MAX_MB = 50  # 로그 파일 최대 크기 (넘으면 교체, 0이면 크기로 교체하지 않음)
+LOG_ROTATE_WHEN = ''  # 시간 기준 교체 주기 ('midnight', 'H' 등, 지정하면 크기 대신 시간으로 교체)
+LOG_BACKUPS = 5  # 보관할 이전 로그 파일 수
+LOG_QUEUE_SIZE = 100_000  # 쓰기 대기 최대 로그 수 (초과 시 버림)
+LOG_REPEAT_INTERVAL = 10  # 같은 경고/오류 메시지를 다시 기록하기까지의 최소 간격 (초, 그 사이 반복은 건수만 셈)
 
 # 보안 설정
 SECURITY_TOKEN = os.environ["SECURITY_TOKEN"]
@@ -29,11 +112,18 @@ ALLOWED_WEBHOOK_IDS = [id_.strip() for id_ in os.environ["ALLOWED_WEBHOOK_IDS"].
 # 디스코드 웹훅 URL (필수)
 DISCORD_WEBHOOK_URL = os.environ["DISCORD_WEBHOOK_URL"]
 
+# 알림 전송 설정
+ALERT_QUEUE_SIZE = 1000  # 전송 대기 알림 최대 수 (초과 시 버림)
+ALERT_MAX_RETRIES = 5  # 알림 전송 최대 재시도 횟수
+ALERT_COALESCE_WINDOW = 1.0  # 여러 심볼의 알림을 한 메시지로 묶는 시간 (초)
+
 # 바이낸스 API 엔드포인트
 ENDPOINTS = {
     'ticker_price': '/api/v3/ticker/price',  # 현재가 조회
     'exchange_info': '/api/v3/exchangeInfo',  # 거래소 정보
-    'klines': '/api/v3/klines'  # 캔들스틱 데이터
+    'klines': '/api/v3/klines',  # 캔들스틱 데이터
+    'agg_trades': '/api/v3/aggTrades',  # 집계 체결 내역
+    'ticker_24hr': '/api/v3/ticker/24hr'  # 24시간 가격/거래량 통계
 }
 
 def get_full_url(endpoint: str) -> str:
@@ -0,0 +1,234 @@
+# volmon/utils/aio_stream.py
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from volmon.config import MAX_STREAMS_PER_CONNECTION, GAP_FILL_ON_RECONNECT
+from volmon.utils.stream import (
+    TradeHandler, control_message, merge_recovery_stats, route_message, shard_symbols, stream_name, stream_url
+)
+from volmon.utils.supervisor import GapFiller, backoff_delay
+
+# asyncio 런타임은 선택 사항 (pip install websockets)
+try:
+    import websockets
+except ImportError:  # pragma: no cover - 선택 의존성
+    websockets = None
+
+logger = logging.getLogger('volmon')
+
+
+class _Connection:
+    """asyncio 런타임의 결합 스트림 연결 하나의 상태"""
+
+    def __init__(self, conn_id: int, symbols: List[str], handlers: Dict[str, TradeHandler], gap_fill: bool):
+        self.conn_id = conn_id
+        self.label = f"Stream #{conn_id}"
+        self.symbols = list(symbols)
+        source = {symbol: handlers[symbol] for symbol in self.symbols}
+        # 누락 체결 보충기 (핸들러를 감싸 마지막 체결을 추적)
+        self.filler = GapFiller(source, self.label) if gap_fill else None
+        if self.filler is not None:
+            source = self.filler.wrap()
+        # 스트림 이름 -> 핸들러
+        self.handlers = {stream_name(symbol): source[symbol] for symbol in self.symbols}
+        self.ws = None  # 연결된 웹소켓 (연결 전이면 None)
+        self.running = True
+        self.reconnect_attempts = 0  # 재연결 시도 횟수
+        self.request_id = 0  # 구독 변경 요청 번호
+        self.task: Optional[asyncio.Task] = None
+
+
+class AsyncStreamMultiplexer:
+    """이벤트 루프 하나에서 모든 결합 스트림 연결, 파싱, 감지, 알림 큐잉을 처리
+
+    StreamMultiplexer와 같은 핸들러(TickerMonitor.on_trade)를 그대로 사용하며,
+    연결마다 스레드를 두는 대신 연결마다 코루틴 하나를 실행합니다.
+    """
+
+    def __init__(self, handlers: Dict[str, TradeHandler], max_streams: int = MAX_STREAMS_PER_CONNECTION,
+                 gap_fill: bool = GAP_FILL_ON_RECONNECT):
+        if websockets is None:
+            raise RuntimeError("asyncio 런타임에는 websockets 패키지가 필요합니다 (pip install websockets)")
+
+        # 심볼(소문자) -> 핸들러
+        self.handlers = {symbol.lower(): handler for symbol, handler in handlers.items()}
+        self.max_streams = max_streams
+        self.gap_fill = gap_fill
+        self.connections: List[_Connection] = [
+            _Connection(conn_id, shard, self.handlers, gap_fill)
+            for conn_id, shard in enumerate(shard_symbols(list(self.handlers), max_streams))
+        ]
+        self.next_conn_id = len(self.connections)  # 새로 만들 연결 번호
+        self.running = False  # 실행 여부
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks = set()  # 실행 중인 연결/주기 작업
+        self._fill_tasks = set()  # 실행 중인 보충 작업 (참조 유지용)
+
+    @property
+    def gap_fillers(self) -> List[GapFiller]:
+        return [conn.filler for conn in self.connections if conn.filler is not None]
+
+    def _start_gap_fill(self, filler: GapFiller, down_since: float):
+        """보충 작업을 스레드에서 실행 (REST 조회가 이벤트 루프를 막지 않도록)"""
+        task = asyncio.ensure_future(asyncio.to_thread(filler.fill, down_since))
+        self._fill_tasks.add(task)
+        task.add_done_callback(self._fill_tasks.discard)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run_connection(self, conn: _Connection):
+        """결합 스트림 연결 하나를 유지하며 메시지를 핸들러로 전달"""
+        label = conn.label
+        while self.running and conn.running:
+            try:
+                # 구독이 바뀌었을 수 있으므로 연결할 때마다 현재 심볼로 URL 구성
+                async with websockets.connect(stream_url(conn.symbols), max_size=None) as ws:
+                    conn.ws = ws
+                    logger.info(f"[{label}] 웹소켓 연결 성공. 스트림 {len(conn.handlers)}개 구독")
+                    conn.reconnect_attempts = 0
+                    down_since = conn.filler.begin_recovery() if conn.filler is not None else None
+                    if down_since is not None:
+                        self._start_gap_fill(conn.filler, down_since)
+                    async for message in ws:
+                        route_message(conn.handlers, message, label)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[{label}] 웹소켓 오류: {e}")
+            finally:
+                conn.ws = None
+
+            if not (self.running and conn.running):
+                break
+            if conn.filler is not None:
+                conn.filler.disconnected()
+            conn.reconnect_attempts += 1
+            attempts = conn.reconnect_attempts
+            wait_time = backoff_delay(attempts)
+            logger.info(f"[{label}] {wait_time:.1f}초 후 재연결 시도... ({attempts}번째 시도)")
+            await asyncio.sleep(wait_time)
+
+    async def _send(self, conn: _Connection, method: str, symbols: List[str]):
+        """연결되어 있으면 구독 변경 요청 전송 (연결 전이면 다음 연결 URL에 반영됨)"""
+        if conn.ws is None:
+            return
+        conn.request_id += 1
+        try:
+            await conn.ws.send(control_message(method, symbols, conn.request_id))
+            logger.info(f"[{conn.label}] {method} 스트림 {len(symbols)}개 (요청 {conn.request_id})")
+        except Exception as e:
+            logger.error(f"[{conn.label}] {method} 요청 전송 오류: {e}")
+
+    def _call_in_loop(self, func, *args):
+        """실행 중이면 이벤트 루프 스레드에서, 아니면 바로 실행 (다른 스레드에서 호출 가능)"""
+        if self.loop is not None and self.running:
+            self.loop.call_soon_threadsafe(func, *args)
+        else:
+            func(*args)
+
+    def add_symbols(self, handlers: Dict[str, TradeHandler]):
+        """새 심볼을 여유가 있는 연결에 구독 추가하고, 모자라면 연결을 새로 만듦"""
+        self._call_in_loop(self._add_symbols, {symbol.lower(): handler for symbol, handler in handlers.items()})
+
+    def _add_symbols(self, handlers: Dict[str, TradeHandler]):
+        added = {symbol: handler for symbol, handler in handlers.items() if symbol not in self.handlers}
+        self.handlers.update(added)
+        pending = list(added)
+        for conn in self.connections:
+            room = self.max_streams - len(conn.symbols)
+            if room <= 0 or not pending:
+                continue
+            chunk, pending = pending[:room], pending[room:]
+            source = {symbol: added[symbol] for symbol in chunk}
+            if conn.filler is not None:
+                source = conn.filler.add(source)
+            for symbol in chunk:
+                conn.handlers[stream_name(symbol)] = source[symbol]
+            conn.symbols.extend(chunk)
+            if self.running:
+                self._spawn(self._send(conn, 'SUBSCRIBE', chunk))
+        for shard in shard_symbols(pending, self.max_streams):
+            conn = _Connection(self.next_conn_id, shard, self.handlers, self.gap_fill)
+            self.next_conn_id += 1
+            self.connections.append(conn)
+            if self.running:
+                conn.task = self._spawn(self._run_connection(conn))
+
+    def remove_symbols(self, symbols: List[str]):
+        """심볼 구독 해제 (스트림이 모두 빠진 연결은 종료)"""
+        self._call_in_loop(self._remove_symbols, [symbol.lower() for symbol in symbols])
+
+    def _remove_symbols(self, symbols: List[str]):
+        removed = set(symbols) & set(self.handlers)
+        for conn in list(self.connections):
+            mine = [symbol for symbol in conn.symbols if symbol in removed]
+            if not mine:
+                continue
+            if len(mine) == len(conn.symbols):
+                conn.running = False
+                if conn.task is not None:
+                    conn.task.cancel()
+                self.connections.remove(conn)
+                continue
+            if self.running:
+                self._spawn(self._send(conn, 'UNSUBSCRIBE', mine))
+            for symbol in mine:
+                conn.handlers.pop(stream_name(symbol), None)
+            conn.symbols = [symbol for symbol in conn.symbols if symbol not in removed]
+            if conn.filler is not None:
+                conn.filler.remove(mine)
+        for symbol in removed:
+            del self.handlers[symbol]
+
+    async def _run_ticker(self, on_tick: Callable[[], None], tick_interval: float):
+        """주기 작업(버퍼 비우기 등)을 같은 루프에서 실행"""
+        while self.running:
+            await asyncio.sleep(tick_interval)
+            try:
+                on_tick()
+            except Exception as e:
+                logger.error(f"[VolMon] 주기 작업 중 예상치 못한 오류: {e}")
+
+    async def run(self, on_tick: Optional[Callable[[], None]] = None, tick_interval: float = 1.0):
+        """모든 연결을 실행 (취소될 때까지 반환하지 않음)"""
+        self.loop = asyncio.get_running_loop()
+        self.running = True
+        logger.info(
+            f"[VolMon] asyncio 런타임: 심볼 {len(self.handlers)}개를 연결 {len(self.connections)}개로 구독합니다."
+        )
+        for conn in self.connections:
+            conn.task = self._spawn(self._run_connection(conn))
+        if on_tick is not None:
+            self._spawn(self._run_ticker(on_tick, tick_interval))
+        try:
+            # 실행 중에 연결이 추가될 수 있으므로 남은 작업이 없을 때까지 대기
+            while self._tasks:
+                await asyncio.wait(set(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.running = False
+            for task in list(self._tasks):
+                task.cancel()
+
+    def stop(self):
+        """실행 중지: 연결과 주기 작업을 바로 취소 (열린 웹소켓은 취소되며 닫힘, 다른 스레드에서 호출 가능)"""
+        self.running = False
+        loop = self.loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._cancel_tasks)
+            except RuntimeError:
+                pass  # 루프가 이미 종료됨
+
+    def _cancel_tasks(self):
+        for task in list(self._tasks):
+            task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """모든 연결의 재연결 및 누락 체결 보충 통계"""
+        return merge_recovery_stats(self.gap_fillers, sum(conn.reconnect_attempts for conn in self.connections))
@@ -0,0 +1,84 @@
+# volmon/utils/backfill.py
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from volmon.config import TIME_WINDOW, BACKFILL_SOURCE, BACKFILL_WORKERS
+from volmon.utils.binance_client import BinanceClient, binance_client
+
+logger = logging.getLogger('volmon')
+
+# (event_time(초), price) 샘플
+Sample = Tuple[float, float]
+
+# 백필한 샘플을 감지 윈도우에 적재하는 콜백 (예: TickerMonitor.warm)
+SampleLoader = Callable[[List[Sample]], None]
+
+
+def fetch_samples(
+    symbol: str,
+    start_ms: int,
+    end_ms: int,
+    source: str = BACKFILL_SOURCE,
+    client: BinanceClient = binance_client
+) -> List[Sample]:
+    """구간의 과거 데이터를 이벤트 시간 순 (event_time, price) 샘플로 변환
+
+    - klines: 1초봉마다 시가(시작 시간)와 종가(종료 시간) 두 샘플
+    - aggTrades: 집계 체결마다 한 샘플
+    """
+    samples = []
+    if source == 'klines':
+        for row in client.iter_klines(symbol, '1s', start_ms, end_ms):
+            open_time, open_price, close_time, close_price = row[0], row[1], row[6], row[4]
+            samples.append((open_time / 1000, float(open_price)))
+            samples.append((min(close_time, end_ms) / 1000, float(close_price)))
+    elif source == 'aggTrades':
+        for row in client.iter_agg_trades(symbol, start_ms, end_ms):
+            samples.append((row['T'] / 1000, float(row['p'])))
+    else:
+        raise ValueError(f"지원하지 않는 백필 데이터: {source} (가능한 값: klines, aggTrades)")
+    return samples
+
+
+def backfill(
+    loaders: Dict[str, SampleLoader],
+    lookback: float = TIME_WINDOW,
+    end_time: Optional[float] = None,
+    source: str = BACKFILL_SOURCE,
+    workers: int = BACKFILL_WORKERS
+) -> Dict[str, int]:
+    """여러 심볼의 최근 lookback(초) 데이터를 동시에 조회해 각 감지 윈도우에 적재
+
+    요청은 BinanceClient의 공유 연결 풀과 요청 가중치 제한을 거칩니다.
+
+    Returns:
+        dict: 심볼별 적재한 샘플 수 (실패한 심볼은 제외)
+    """
+    end_ms = int((end_time if end_time is not None else time.time()) * 1000)
+    start_ms = end_ms - int(lookback * 1000)
+    started = time.time()
+    loaded = {}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='volmon-backfill') as executor:
+        futures = {
+            executor.submit(fetch_samples, symbol, start_ms, end_ms, source): symbol
+            for symbol in loaders
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                samples = future.result()
+            except Exception as e:
+                logger.error(f"[Backfill] {symbol} 조회 오류: {str(e)[:100]}")
+                continue
+            loaders[symbol](samples)
+            loaded[symbol] = len(samples)
+
+    logger.info(
+        f"[Backfill] 심볼 {len(loaded)}/{len(loaders)}개, 샘플 {sum(loaded.values())}개 적재 "
+        f"({source}, {lookback}초, {time.time() - started:.2f}초 소요)"
+    )
+    return loaded
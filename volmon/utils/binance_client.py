@@ -1,19 +1,76 @@
 """바이낸스 API를 통한 암호화폐 가격 조회 모듈"""
 import time
 import hmac
+import logging
+import json
 import hashlib
+import threading
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from urllib.parse import urlencode
 
 from volmon.config import (
     BINANCE_API_KEY,
     BINANCE_API_SECRET,
     REQUEST_TIMEOUT,
+    REQUEST_WEIGHT_LIMIT,
+    BULK_PRICE_SYMBOLS_LIMIT,
+    HTTP_POOL_SIZE,
+    EXCHANGE_INFO_TTL,
+    EXCHANGE_INFO_STALE_TTL,
     get_full_url,
     get_headers,
     ENDPOINTS
 )
+from volmon.utils.metadata import CachedResource, SymbolInfo, decode_symbols, encode_symbols, index_symbols
+
+logger = logging.getLogger('volmon')
+
+class RequestWeightLimiter:
+    """바이낸스 1분 요청 가중치 한도를 넘지 않도록 요청을 지연
+
+    가중치는 매 분(벽시계 기준) 초기화되며, 응답의 X-MBX-USED-WEIGHT-1M 헤더로
+    서버가 집계한 사용량을 반영합니다.
+    """
+
+    def __init__(self, limit: int = REQUEST_WEIGHT_LIMIT):
+        self.limit = limit  # 1분 가중치 한도
+        self.used = 0  # 현재 분에 사용한 가중치
+        self.window_start = 0  # 현재 분의 시작 시간
+        self.lock = threading.Lock()
+
+    def _roll(self, now: float):
+        """분이 바뀌었으면 사용량 초기화"""
+        window_start = now - now % 60
+        if window_start != self.window_start:
+            self.window_start = window_start
+            self.used = 0
+
+    def acquire(self, weight: int):
+        """가중치를 확보할 때까지 대기"""
+        while True:
+            with self.lock:
+                now = time.time()
+                self._roll(now)
+                if self.used + weight <= self.limit:
+                    self.used += weight
+                    return
+                wait_time = self.window_start + 60 - now
+            time.sleep(wait_time)
+
+    def update(self, used_weight: Optional[str]):
+        """서버가 알려준 사용량 반영"""
+        if used_weight is None:
+            return
+        try:
+            used = int(used_weight)
+        except (ValueError, TypeError):
+            logger.debug(f"[Binance] 잘못된 사용량 헤더 무시: {used_weight!r}")
+            return
+        with self.lock:
+            self._roll(time.time())
+            self.used = max(self.used, used)
 
 class BinanceClient:
     """바이낸스 API 클라이언트"""
@@ -22,10 +79,23 @@ class BinanceClient:
         self.api_key = api_key or BINANCE_API_KEY
         self.api_secret = api_secret or BINANCE_API_SECRET
         self.session = self._init_session()
+        self.weight_limiter = RequestWeightLimiter()  # 요청 가중치 제한
+        # 심볼 -> SymbolInfo 색인 (메모리 + 디스크 캐시)
+        self.exchange_info_cache = CachedResource(
+            'exchange_info',
+            lambda validators: self._request_conditional(ENDPOINTS['exchange_info'], 20, validators),
+            build=index_symbols,
+            encode=encode_symbols,
+            decode=decode_symbols,
+            ttl=EXCHANGE_INFO_TTL,
+            stale_ttl=EXCHANGE_INFO_STALE_TTL,
+            key=get_full_url(ENDPOINTS['exchange_info'])
+        )
     
     def _init_session(self) -> requests.Session:
-        """요청 세션 초기화"""
+        """요청 세션 초기화 (여러 스레드가 keep-alive 연결 풀을 공유)"""
         session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE))
         session.headers.update(get_headers())
         return session
     
@@ -40,9 +110,10 @@ class BinanceClient:
             hashlib.sha256
         ).hexdigest()
     
-    def _request(self, method: str, endpoint: str, signed: bool = False, **kwargs) -> Dict:
-        """API 요청 실행"""
+    def _request(self, method: str, endpoint: str, signed: bool = False, weight: int = 1, **kwargs) -> Dict:
+        """API 요청 실행 (weight: 엔드포인트의 요청 가중치)"""
         uri = get_full_url(endpoint)
+        self.weight_limiter.acquire(weight)
         
         if signed:  # 비공개 API 호출 시 서명 추가
             kwargs['params'] = kwargs.get('params', {})
@@ -56,6 +127,7 @@ class BinanceClient:
                 timeout=REQUEST_TIMEOUT,
                 **kwargs
             )
+            self.weight_limiter.update(response.headers.get('X-MBX-USED-WEIGHT-1M'))
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -64,14 +136,42 @@ class BinanceClient:
                 error_msg += f" - {e.response.text}"
             raise Exception(error_msg)
     
+    def _request_conditional(self, endpoint: str, weight: int,
+                             validators: Dict[str, str]) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """검증자(ETag, Last-Modified)를 붙여 GET 요청 -> (본문, 새 검증자). 바뀌지 않았으면(304) 본문 None"""
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        self.weight_limiter.acquire(weight)
+        try:
+            response = self.session.get(get_full_url(endpoint), headers=headers, timeout=REQUEST_TIMEOUT)
+            self.weight_limiter.update(response.headers.get('X-MBX-USED-WEIGHT-1M'))
+            if response.status_code == 304:
+                return None, validators
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            error_msg = f"API 요청 실패: {str(e)}"
+            if hasattr(e, 'response') and e.response is not None:
+                error_msg += f" - {e.response.text}"
+            raise Exception(error_msg)
+        fresh = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        return response.content, {key: value for key, value in fresh.items() if value}
+
     def get_ticker_price(self, symbol: str) -> Dict[str, str]:
         """특정 코인의 현재 가격 조회"""
         params = {'symbol': symbol.upper()}
-        return self._request('GET', ENDPOINTS['ticker_price'], params=params)
+        return self._request('GET', ENDPOINTS['ticker_price'], weight=2, params=params)
+    
+    def get_ticker_prices(self, symbols: List[str]) -> List[Dict[str, str]]:
+        """여러 코인의 현재 가격을 한 번의 요청으로 조회"""
+        symbols_param = json.dumps([symbol.upper() for symbol in symbols], separators=(',', ':'))
+        return self._request('GET', ENDPOINTS['ticker_price'], weight=4, params={'symbols': symbols_param})
     
     def get_all_prices(self) -> List[Dict[str, str]]:
         """모든 코인의 현재 가격 조회"""
-        return self._request('GET', ENDPOINTS['ticker_price'])
+        return self._request('GET', ENDPOINTS['ticker_price'], weight=4)
     
     def get_klines(
         self,
@@ -88,16 +188,91 @@ class BinanceClient:
             'limit': min(limit, 1000)  # 최대 1000건
         }
         
-        if start_time:
+        if start_time is not None:
             params['startTime'] = start_time
-        if end_time:
+        if end_time is not None:
             params['endTime'] = end_time
             
-        return self._request('GET', ENDPOINTS['klines'], params=params)
+        return self._request('GET', ENDPOINTS['klines'], weight=2, params=params)
     
+    def iter_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: int,
+        end_time: int
+    ) -> Iterator[list]:
+        """start_time~end_time(밀리초) 구간의 캔들을 1000건씩 나눠 조회하며 순서대로 반환"""
+        cursor = start_time
+        while cursor <= end_time:
+            rows = self.get_klines(symbol, interval, limit=1000, start_time=cursor, end_time=end_time)
+            if not rows:
+                return
+            yield from rows
+            if len(rows) < 1000:
+                return
+            cursor = rows[-1][0] + 1  # 마지막 캔들의 시작 시간 다음부터
+
+    def get_agg_trades(
+        self,
+        symbol: str,
+        from_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """집계 체결 조회 (startTime~endTime은 1시간 이내)"""
+        params = {'symbol': symbol.upper(), 'limit': min(limit, 1000)}
+        if from_id is not None:
+            params['fromId'] = from_id
+        if start_time is not None:
+            params['startTime'] = start_time
+        if end_time is not None:
+            params['endTime'] = end_time
+        return self._request('GET', ENDPOINTS['agg_trades'], weight=4, params=params)
+
+    def iter_agg_trades(self, symbol: str, start_time: int, end_time: int) -> Iterator[Dict[str, Any]]:
+        """start_time~end_time(밀리초) 구간의 집계 체결을 순서대로 반환
+
+        첫 페이지는 시간 구간(1시간 이내)으로 찾고, 이후는 마지막 집계 체결 ID
+        다음부터 이어서 조회합니다.
+        """
+        # 체결이 있는 첫 1시간 구간 찾기
+        cursor = start_time
+        while True:
+            if cursor > end_time:
+                return
+            window_end = min(end_time, cursor + 3600 * 1000 - 1)
+            rows = self.get_agg_trades(symbol, start_time=cursor, end_time=window_end)
+            if rows:
+                break
+            cursor = window_end + 1
+
+        while rows:
+            for row in rows:
+                if row['T'] > end_time:
+                    return
+                yield row
+            if len(rows) < 1000 and window_end >= end_time:
+                return  # 요청한 구간의 마지막 페이지
+            window_end = end_time  # 이후 페이지는 ID로 이어서 조회
+            rows = self.get_agg_trades(symbol, from_id=rows[-1]['a'] + 1)
+
     def get_exchange_info(self) -> Dict[str, Any]:
-        """거래소 지원 코인 및 거래쌍 정보 조회"""
-        return self._request('GET', ENDPOINTS['exchange_info'])
+        """거래소 지원 코인 및 거래쌍 정보 조회 (원본 응답, 캐시 없음)"""
+        return self._request('GET', ENDPOINTS['exchange_info'], weight=20)
+
+    def symbols(self) -> Dict[str, SymbolInfo]:
+        """심볼 -> SymbolInfo 색인 (EXCHANGE_INFO_TTL 동안 캐시, 디스크에 저장)"""
+        return self.exchange_info_cache.get()
+
+    def symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
+        """심볼 하나의 메타데이터 (없는 심볼이면 None)"""
+        return self.symbols().get(symbol.upper())
+
+    def get_24h_tickers(self) -> List[Dict[str, Any]]:
+        """모든 거래쌍의 24시간 통계 조회 (MINI: 가격/거래량 필드만)"""
+        return self._request('GET', ENDPOINTS['ticker_24hr'], weight=80, params={'type': 'MINI'})
 
 
 # 전역 인스턴스 생성
@@ -109,9 +284,18 @@ def get_price(symbol: str) -> float:
     return float(result['price'])
 
 def get_prices(symbols: List[str] = None) -> Dict[str, float]:
-    """여러 코인의 현재가를 딕셔너리로 반환"""
-    if symbols:
-        return {symbol: get_price(symbol) for symbol in symbols}
+    """여러 코인의 현재가를 딕셔너리로 반환 (키는 대문자 심볼)
+
+    심볼 수가 BULK_PRICE_SYMBOLS_LIMIT 이하면 symbols 파라미터로 한 번에 조회하고,
+    그보다 많으면 전체 가격을 한 번 조회한 뒤 필요한 심볼만 남깁니다.
+    """
+    if symbols and len(symbols) <= BULK_PRICE_SYMBOLS_LIMIT:
+        result = binance_client.get_ticker_prices(symbols)
+    else:
+        result = binance_client.get_all_prices()
     
-    all_prices = binance_client.get_all_prices()
-    return {item['symbol']: float(item['price']) for item in all_prices}
+    prices = {item['symbol']: float(item['price']) for item in result}
+    if symbols:
+        wanted = {symbol.upper() for symbol in symbols}
+        prices = {symbol: price for symbol, price in prices.items() if symbol in wanted}
+    return prices
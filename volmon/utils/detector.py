@@ -1,59 +1,807 @@
 # volmon/utils/detector.py
 
+import math
 import time
+import bisect
+import logging
+import operator
+from array import array
 from collections import deque
-from volmon.config import TIME_WINDOW, ALERT_THRESHOLD
+from typing import Dict, List, Optional, Sequence, Tuple
+from volmon.config import (
+    TIME_WINDOW, ALERT_THRESHOLD, ALLOWED_LATENESS, DETECTOR_MODE, DETECTION_WINDOWS, DETECTOR_RING_CAPACITY,
+    ZSCORE_BASELINE_WINDOW, ZSCORE_MIN_SAMPLES, ZSCORE_THRESHOLD, ZSCORE_RV_MULTIPLE
+)
+
+logger = logging.getLogger('volmon')
+
+
+class PriceRing:
+    """(이벤트 시간, 가격)을 시간 순으로 담는 array('d') 두 개짜리 링 버퍼
+
+    샘플 하나에 16바이트이며 샘플마다 파이썬 객체를 만들지 않습니다. 첫 샘플을 넣을 때 capacity칸을
+    할당하고, 윈도우 안의 샘플이 그보다 많아지면 두 배로 늘립니다 (가장 오래된 샘플을 덮어쓰면
+    윈도우가 몰래 짧아지므로).
+    """
+    __slots__ = ('times', 'prices', 'capacity', 'head', 'size')
+
+    def __init__(self, capacity: int = DETECTOR_RING_CAPACITY):
+        self.times = array('d')  # 이벤트 시간 (초)
+        self.prices = array('d')  # 가격
+        self.capacity = max(1, capacity)  # 처음 할당할 칸 수
+        self.head = 0  # 가장 오래된 샘플의 칸
+        self.size = 0  # 샘플 수
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self):
+        """칸 수를 늘리고 샘플을 0번 칸부터 다시 배치"""
+        slots = len(self.times)
+        new_slots = slots * 2 if slots else self.capacity
+        padding = array('d', bytes(8 * (new_slots - self.size)))
+        # 가득 찬 상태에서만 호출되므로 head부터 끝, 처음부터 head 앞까지가 시간 순서
+        head = self.head
+        self.times = self.times[head:] + self.times[:head] + padding
+        self.prices = self.prices[head:] + self.prices[:head] + padding
+        self.head = 0
+
+    def append(self, event_time: float, price: float):
+        """가장 늦은 샘플 뒤에 추가"""
+        if self.size == len(self.times):
+            self._grow()
+        slot = (self.head + self.size) % len(self.times)
+        self.times[slot] = event_time
+        self.prices[slot] = price
+        self.size += 1
+
+    def insert(self, event_time: float, price: float):
+        """이벤트 시간 위치에 삽입 (같은 시간이면 뒤에, 늦게 도착한 샘플은 끝 근처라 뒤쪽만 한 칸씩 밂)"""
+        if self.size == len(self.times):
+            self._grow()
+        times, prices, slots = self.times, self.prices, len(self.times)
+        # 뒤에서부터 event_time보다 늦은 샘플을 한 칸씩 뒤로
+        i = self.size
+        while i > 0:
+            prev = (self.head + i - 1) % slots
+            if times[prev] <= event_time:
+                break
+            slot = (self.head + i) % slots
+            times[slot], prices[slot] = times[prev], prices[prev]
+            i -= 1
+        slot = (self.head + i) % slots
+        times[slot], prices[slot] = event_time, price
+        self.size += 1
+
+    def __iter__(self):
+        slots = len(self.times)
+        for i in range(self.size):
+            slot = (self.head + i) % slots
+            yield self.times[slot], self.prices[slot]
+
 
 class VolatilityDetector:
-    def __init__(self):
-        self.price_history = deque()  # (timestamp, price) 튜플을 저장하는 데크
-        self.time_window = TIME_WINDOW  # 초 단위 시간 창
+    __slots__ = (
+        'price_history', 'time_window', 'alert_threshold', 'verbose', 'allowed_lateness', 'max_event_time',
+        'late_samples', 'last_log_time', 'log_interval', 'last_detected_change', 'last_direction'
+    )
+    score: Optional[float] = None  # 마지막 감지의 z-점수 (통계 감지기만)
+
+    def __init__(self, time_window: float = TIME_WINDOW, alert_threshold: float = ALERT_THRESHOLD,
+                 verbose: bool = True, capacity: int = DETECTOR_RING_CAPACITY):
+        self.price_history = PriceRing(capacity)  # (event_time, price)를 이벤트 시간 순으로 저장하는 링 버퍼
+        self.time_window = time_window  # 초 단위 시간 창
+        self.alert_threshold = alert_threshold  # 변동성 감지 임계값 (%)
+        self.verbose = verbose  # 감지 로그 출력 여부 (리플레이 시 끔)
+        self.allowed_lateness = ALLOWED_LATENESS  # 순서가 뒤바뀐 샘플을 허용하는 최대 지연 (초)
+        self.max_event_time = float('-inf')  # 지금까지 본 가장 늦은 이벤트 시간
+        self.late_samples = 0  # 워터마크보다 늦게 도착해 버려진 샘플 수
         self.last_log_time = 0  # 마지막 로그 출력 시간
         self.log_interval = 300  # 로그 출력 최소 간격 (초)
         self.last_detected_change = 0  # 마지막 감지된 변동률
         self.last_direction = 0  # 마지막 변동 방향 (1: 상승, -1: 하락, 0: 초기값)
 
-    def detect(self, current_price: float):
-        now = time.time()
-        
-        # 현재 시간 기준으로 time_window(초) 이전의 타임스탬프 계산
-        time_threshold = now - self.time_window
+    @property
+    def watermark(self) -> float:
+        """이 시간보다 이른 이벤트는 더 이상 받아들이지 않음"""
+        return self.max_event_time - self.allowed_lateness
 
-        # 오래된 데이터 제거 (time_window 이전의 데이터)
-        while self.price_history and self.price_history[0][0] < time_threshold:
-            self.price_history.popleft()
+    def _add_sample(self, event_time: float, price: float) -> float:
+        """샘플을 이벤트 시간 순서대로 추가하고 time_window 내 변동률(%)을 반환
 
-        # 현재 가격과 시간 추가
-        self.price_history.append((now, current_price))
-        
+        가장 늦은 이벤트 시간 기준으로 allowed_lateness 이내에 도착한 샘플은
+        제자리에 끼워 넣고, 그보다 늦은 샘플은 버립니다. 결과는 수신 시각이 아닌
+        이벤트 시간에만 의존하므로 같은 입력에 대해 항상 같습니다.
+        """
+        if event_time >= self.max_event_time:
+            self.max_event_time = event_time
+        elif event_time < self.watermark:
+            # 워터마크보다 늦게 도착한 샘플은 버림
+            self.late_samples += 1
+            return self._window_change()
+
+        # 가장 늦은 이벤트 시간으로부터 time_window(초) 이전의 타임스탬프 계산
+        time_threshold = self.max_event_time - self.time_window
+
+        # 오래된 데이터 제거 (time_window 이전의 데이터). 링 버퍼 조작은 핫 패스라 메서드 호출 없이 직접
+        history = self.price_history
+        times, head, size = history.times, history.head, history.size
+        slots = len(times)
+        if size and times[head] < time_threshold:
+            while size and times[head] < time_threshold:
+                head += 1
+                if head == slots:
+                    head = 0
+                size -= 1
+            history.head = head
+
+        if event_time < time_threshold:
+            history.size = size
+            return self._window_change()
+
+        # 가격과 시간 추가 (순서가 뒤바뀐 샘플은 이벤트 시간 위치에 삽입)
+        tail = head + size
+        if tail >= slots:
+            tail -= slots
+        if size and event_time < times[tail - 1]:  # tail이 0이면 times[-1]이 마지막 칸
+            history.size = size
+            history.insert(event_time, price)
+        elif size < slots:
+            times[tail] = event_time
+            prices = history.prices
+            prices[tail] = price
+            history.size = size + 1
+            # 변동률 계산 (_window_change와 같음, 핫 패스라 직접)
+            if size < 1:
+                return 0
+            oldest_price = prices[head]
+            return ((price - oldest_price) / oldest_price) * 100
+        else:
+            history.size = size
+            history.append(event_time, price)
+
+        return self._window_change()
+
+    @property
+    def lookback(self) -> float:
+        """시작 시 감지에 필요한 과거 데이터 길이 (초, 백필 구간)"""
+        return self.time_window
+
+    @property
+    def change(self) -> float:
+        """현재 time_window 내 변동률(%)"""
+        return self._window_change()
+
+    def _window_change(self) -> float:
+        """time_window 내 첫 번째 가격 대비 마지막 가격의 변동률(%)"""
         # 최소 2개 이상의 데이터가 있어야 변동성 계산 가능
-        if len(self.price_history) >= 2:
-            # time_window 내의 첫 번째 가격과 현재 가격 비교
-            _, oldest_price = self.price_history[0]
-            price_change = ((current_price - oldest_price) / oldest_price) * 100
-            
-            if abs(price_change) >= ALERT_THRESHOLD:
-                current_time = time.time()
-                current_direction = 1 if price_change >= 0 else -1
-                
-                # 방향이 바뀌었거나, 로그 출력 간격이 지났거나, 변동률이 크게 증가한 경우에만 로그 출력
-                should_log = (
-                    current_time - self.last_log_time >= self.log_interval or
-                    current_direction != self.last_direction or
-                    abs(price_change) >= abs(self.last_detected_change) * 1.3
-                )
-                
-                if should_log:
-                    print(
-                        f"[Detector] 변동성 감지! {price_change:+.2f}% "
-                        f"(임계값: {ALERT_THRESHOLD}%, 이전: {self.last_detected_change:+.2f}%)"
-                    )
-                    self.last_log_time = current_time
-                
-                # 상태 업데이트
-                self.last_detected_change = price_change
-                self.last_direction = current_direction
-                
-                return True, price_change
-
-        return False, 0
\ No newline at end of file
+        history = self.price_history
+        size = history.size
+        if size < 2:
+            return 0
+
+        prices = history.prices
+        oldest_price = prices[history.head]
+        latest_price = prices[(history.head + size - 1) % len(prices)]
+        return ((latest_price - oldest_price) / oldest_price) * 100
+
+    def warm(self, samples):
+        """과거 (event_time, price) 샘플로 윈도우를 채움 (감지/로그 없음)"""
+        for event_time, price in samples:
+            self._add_sample(event_time, price)
+
+    @property
+    def detections(self) -> List[Tuple[Optional[int], float]]:
+        """마지막 감지의 (윈도우(초), 변동률) 목록. 단일 윈도우 감지기는 윈도우가 None (TIME_WINDOW 기준 알림)"""
+        return [(None, self.last_detected_change)]
+
+    def _describe(self, price_change: float, threshold: Optional[float] = None) -> str:
+        """감지 로그 메시지"""
+        return (
+            f"변동성 감지! {price_change:+.2f}% "
+            f"(임계값: {threshold if threshold is not None else self.alert_threshold}%, "
+            f"이전: {self.last_detected_change:+.2f}%)"
+        )
+
+    def _report(self, price_change: float, threshold: Optional[float] = None):
+        """변동성 감지 로그 출력 및 상태 갱신"""
+        current_time = time.time()
+        current_direction = 1 if price_change >= 0 else -1
+        
+        # 방향이 바뀌었거나, 로그 출력 간격이 지났거나, 변동률이 크게 증가한 경우에만 로그 출력
+        should_log = (
+            current_time - self.last_log_time >= self.log_interval or
+            current_direction != self.last_direction or
+            abs(price_change) >= abs(self.last_detected_change) * 1.3
+        )
+        
+        if should_log and self.verbose:
+            logger.info(f"[Detector] {self._describe(price_change, threshold)}")
+            self.last_log_time = current_time
+        
+        # 상태 업데이트
+        self.last_detected_change = price_change
+        self.last_direction = current_direction
+
+    def detect(self, current_price: float, event_time: Optional[float] = None):
+        """가격 샘플 하나를 추가하고 (감지_여부, 변동률)을 반환
+
+        Args:
+            current_price: 체결 가격
+            event_time: 거래소 체결 시간 (초). 없으면 현재 시간 사용
+        """
+        if event_time is None:
+            event_time = time.time()
+        price_change = self._add_sample(event_time, current_price)
+
+        if abs(price_change) >= self.alert_threshold:
+            self._report(price_change)
+            return True, price_change
+
+        return False, 0
+
+    def detect_batch(self, samples):
+        """(event_time, price) 샘플 묶음을 순서대로 추가하고 한 번에 판정
+
+        묶음 안의 각 샘플에서 계산한 변동률 중 절댓값이 가장 큰 값을 기준으로
+        detect()와 같은 (감지_여부, 변동률) 형식을 반환합니다.
+        """
+        max_change = 0
+        for event_time, price in samples:
+            price_change = self._add_sample(event_time, price)
+            if abs(price_change) > abs(max_change):
+                max_change = price_change
+
+        if abs(max_change) >= self.alert_threshold:
+            self._report(max_change)
+            return True, max_change
+
+        return False, 0
+
+
+class RangeVolatilityDetector(VolatilityDetector):
+    """time_window 내 최고가/최저가 대비 변동률로 감지하는 감지기
+
+    단조 최소/최대 큐를 유지하므로 윈도우 안의 최고가와 최저가를 샘플당
+    분할 상환 O(1)로 얻습니다. 윈도우 안에서 하락 후 회복(또는 상승 후 반락)해
+    첫 가격과 차이가 작아진 경우도 감지하며, detect()/detect_batch()의 반환
+    형식은 VolatilityDetector와 같습니다.
+    """
+    __slots__ = ('min_queue', 'max_queue', 'latest')
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self.min_queue = deque()  # 가격이 증가하는 (event_time, price) 큐. 맨 앞이 최저가
+        self.max_queue = deque()  # 가격이 감소하는 (event_time, price) 큐. 맨 앞이 최고가
+        self.latest = None  # 이벤트 시간 기준 마지막 (event_time, price)
+
+    @staticmethod
+    def _push(queue: deque, event_time: float, price: float, dominated):
+        """단조성을 유지하며 샘플을 추가. dominated(a, b)가 참이면 a는 b에 가려져 필요 없음"""
+        if not queue or event_time >= queue[-1][0]:
+            while queue and dominated(queue[-1][1], price):
+                queue.pop()
+            queue.append((event_time, price))
+            return
+
+        # 순서가 뒤바뀐 샘플: 이벤트 시간 위치를 찾아 삽입
+        index = bisect.bisect_right(queue, (event_time, float('inf')))
+        if index < len(queue) and dominated(price, queue[index][1]):
+            return  # 더 늦고 더 극단적인 샘플이 있으면 필요 없음
+        while index > 0 and dominated(queue[index - 1][1], price):
+            del queue[index - 1]
+            index -= 1
+        queue.insert(index, (event_time, price))
+
+    def _add_sample(self, event_time: float, price: float) -> float:
+        if event_time >= self.max_event_time:
+            self.max_event_time = event_time
+        elif event_time < self.watermark:
+            # 워터마크보다 늦게 도착한 샘플은 버림
+            self.late_samples += 1
+            return self._window_change()
+
+        # 가장 늦은 이벤트 시간으로부터 time_window(초) 이전의 타임스탬프 계산
+        time_threshold = self.max_event_time - self.time_window
+
+        # 오래된 데이터 제거
+        while self.min_queue and self.min_queue[0][0] < time_threshold:
+            self.min_queue.popleft()
+        while self.max_queue and self.max_queue[0][0] < time_threshold:
+            self.max_queue.popleft()
+
+        if event_time < time_threshold:
+            return self._window_change()
+
+        self._push(self.min_queue, event_time, price, operator.ge)
+        self._push(self.max_queue, event_time, price, operator.le)
+        if self.latest is None or event_time >= self.latest[0]:
+            self.latest = (event_time, price)
+
+        return self._window_change()
+
+    def window_range(self):
+        """time_window 내 (최저가, 최고가). 샘플이 없으면 None"""
+        if not self.min_queue:
+            return None
+        return self.min_queue[0][1], self.max_queue[0][1]
+
+    def _window_change(self) -> float:
+        """마지막 가격의 최저가 대비 상승률과 최고가 대비 하락률 중 절댓값이 큰 값(%)"""
+        if self.latest is None or not self.min_queue:
+            return 0
+
+        _, latest_price = self.latest
+        low, high = self.window_range()
+        rise = ((latest_price - low) / low) * 100
+        drop = ((latest_price - high) / high) * 100
+        return rise if rise >= -drop else drop
+
+
+class _Window:
+    """다중 윈도우 감지기의 윈도우 하나: 윈도우에 걸친 확정 버킷의 (시작, 시가) 큐와 최고가/최저가 단조 큐"""
+    __slots__ = ('seconds', 'resolution', 'threshold', 'opens', 'highs', 'lows')
+
+    def __init__(self, seconds: int, resolution: int, threshold: float):
+        self.seconds = seconds  # 윈도우 길이 (초)
+        self.resolution = resolution  # 버킷 길이 (1초 또는 60초)
+        self.threshold = threshold  # 감지 임계값 (%)
+        self.opens = deque()  # (버킷 시작, 시가)
+        self.highs = deque()  # 고가가 감소하는 (버킷 시작, 고가). 맨 앞이 윈도우 최고가
+        self.lows = deque()  # 저가가 증가하는 (버킷 시작, 저가). 맨 앞이 윈도우 최저가
+
+    def push(self, start: int, open_: float, high: float, low: float):
+        """확정된 버킷 추가 (조회가 없어도 큐가 윈도우 길이를 넘지 않도록 오래된 버킷 제거)"""
+        self.opens.append((start, open_))
+        highs, lows = self.highs, self.lows
+        while highs and highs[-1][1] <= high:
+            highs.pop()
+        highs.append((start, high))
+        while lows and lows[-1][1] >= low:
+            lows.pop()
+        lows.append((start, low))
+        self.expire(start - self.seconds)
+
+    def expire(self, start_time: float):
+        """start_time 이전에 끝난 버킷 제거 (윈도우 시작은 버킷 단위로 내림)"""
+        cutoff = start_time - self.resolution
+        for queue in (self.opens, self.highs, self.lows):
+            while queue and queue[0][0] <= cutoff:
+                queue.popleft()
+
+
+class MultiWindowDetector(VolatilityDetector):
+    """여러 윈도우(예: 1분, 5분, 15분, 1시간)의 변동률을 동시에 계산하는 감지기
+
+    체결은 1초 OHLC 버킷에 모으고, 워터마크가 지나 확정된 초 버킷을 다시 1분 버킷으로 합칩니다.
+    5분 이상이면서 분 단위로 나누어떨어지는 윈도우는 분 버킷을, 나머지는 초 버킷을 쓰며, 각 윈도우는
+    걸쳐 있는 확정 버킷의 시가 큐와 최고가/최저가 단조 큐만 유지합니다. 따라서 체결당 변동률과
+    최고가/최저가 조회는 윈도우마다 O(1)이고, 메모리는 체결 수와 관계없이 윈도우 길이 / 버킷 길이로 제한됩니다.
+
+    변동률은 윈도우에 걸친 가장 오래된 버킷의 시가 대비 마지막 가격이며, 윈도우 시작이 버킷 단위로
+    내려가므로 실제 윈도우는 최대 버킷 하나만큼 깁니다. 윈도우마다 임계값이 다르고, 감지된 윈도우는
+    detections로 얻어 윈도우별 알림 단계(NotificationState)에 넘깁니다.
+    """
+
+    __slots__ = ('windows', 'second_windows', 'minute_windows', 'open_seconds', 'final_second', 'minute', 'latest',
+                 '_detections')
+
+    MINUTE_WINDOW_MIN = 300  # 이 길이 이상이면서 60의 배수인 윈도우는 분 버킷 사용 (초)
+
+    def __init__(self, windows: Optional[Dict[int, Sequence[float]]] = None, time_window: Optional[float] = None,
+                 alert_threshold: Optional[float] = None, **params):
+        """
+        Args:
+            windows: 윈도우 (초) -> 알림 단계 (%, 첫 값이 감지 임계값). 없으면 DETECTION_WINDOWS
+            time_window: 지정하면 가장 짧은 윈도우를 이 길이로 바꿈 (리플레이 파라미터 탐색 등)
+            alert_threshold: 지정하면 가장 짧은 윈도우(time_window를 지정했으면 그 윈도우)의 감지 임계값
+            params: 나머지 VolatilityDetector 인자 (verbose, capacity)
+        """
+        windows = DETECTION_WINDOWS if windows is None else windows
+        windows = {int(seconds): list(steps) for seconds, steps in windows.items()}
+        if windows and (time_window is not None or alert_threshold is not None):
+            shortest = min(windows)
+            steps = windows.pop(shortest)
+            if alert_threshold is not None:
+                steps = [alert_threshold] + [step for step in steps if step > alert_threshold]
+            windows[int(time_window) if time_window is not None else shortest] = steps
+        self.windows = [
+            _Window(int(seconds), 60 if seconds >= self.MINUTE_WINDOW_MIN and seconds % 60 == 0 else 1, steps[0])
+            for seconds, steps in sorted(windows.items())
+        ]
+        if not self.windows:
+            raise ValueError("감지 윈도우가 없습니다 (DETECTION_WINDOWS)")
+        shortest = self.windows[0]
+        super().__init__(time_window=shortest.seconds, alert_threshold=shortest.threshold, **params)
+        self.second_windows = [window for window in self.windows if window.resolution == 1]
+        self.minute_windows = [window for window in self.windows if window.resolution == 60]
+
+        # 초 -> [첫 체결 시간, 시가, 고가, 저가, 마지막 체결 시간, 종가] (워터마크가 지나지 않아 늦은 체결을 받는 버킷)
+        self.open_seconds: Dict[int, list] = {}
+        self.final_second = float('-inf')  # 이 초 이전의 초 버킷은 확정
+        self.minute = None  # 확정된 초 버킷을 모으는 현재 분 버킷 [시작, 시가, 고가, 저가, 종가]
+        self.latest = None  # 이벤트 시간 기준 마지막 가격
+        self._detections: List[Tuple[int, float]] = []
+
+    def _add_sample(self, event_time: float, price: float):
+        if event_time >= self.max_event_time:
+            self.max_event_time = event_time
+            self.latest = price
+            limit = int(self.watermark)
+            if limit > self.final_second:
+                self._finalize(limit)
+        elif event_time < self.watermark:
+            # 워터마크보다 늦게 도착한 샘플은 버림
+            self.late_samples += 1
+            return
+
+        # 워터마크 이후의 샘플이므로 항상 아직 확정되지 않은 초 버킷에 들어감
+        second = int(event_time)
+        bucket = self.open_seconds.get(second)
+        if bucket is None:
+            self.open_seconds[second] = [event_time, price, price, price, event_time, price]
+            return
+        if event_time < bucket[0]:
+            bucket[0], bucket[1] = event_time, price
+        if price > bucket[2]:
+            bucket[2] = price
+        elif price < bucket[3]:
+            bucket[3] = price
+        if event_time >= bucket[4]:
+            bucket[4], bucket[5] = event_time, price
+
+    def _finalize(self, limit: int):
+        """limit초 이전의 초 버킷을 확정해 초 윈도우와 분 버킷에 반영"""
+        self.final_second = limit
+        for second in sorted(second for second in self.open_seconds if second < limit):
+            _, open_, high, low, _, close = self.open_seconds.pop(second)
+            for window in self.second_windows:
+                window.push(second, open_, high, low)
+
+            start = second - second % 60
+            minute = self.minute
+            if minute is None or minute[0] != start:
+                if minute is not None:
+                    for window in self.minute_windows:
+                        window.push(minute[0], minute[1], minute[2], minute[3])
+                self.minute = [start, open_, high, low, close]
+            else:
+                if high > minute[2]:
+                    minute[2] = high
+                if low < minute[3]:
+                    minute[3] = low
+                minute[4] = close
+
+    def _pending(self, window: _Window, start_time: float) -> List[list]:
+        """윈도우의 확정 버킷 큐에 아직 들어가지 않은 버킷 ([시작, 시가, 고가, 저가, ...], 시간 순)"""
+        pending = []
+        minute = self.minute
+        if window.resolution == 60 and minute is not None and minute[0] + 60 > start_time:
+            pending.append(minute)
+        for second in sorted(self.open_seconds):
+            bucket = self.open_seconds[second]
+            pending.append([second, bucket[1], bucket[2], bucket[3]])
+        return pending
+
+    def window_change(self, window: _Window) -> float:
+        """윈도우에 걸친 가장 오래된 버킷의 시가 대비 마지막 가격의 변동률(%)"""
+        if self.latest is None:
+            return 0
+        start_time = self.max_event_time - window.seconds
+        # 시가 큐만 정리 (최고가/최저가 큐는 버킷을 넣을 때와 window_range에서 정리)
+        opens, cutoff = window.opens, start_time - window.resolution
+        while opens and opens[0][0] <= cutoff:
+            opens.popleft()
+        if opens:
+            reference = opens[0][1]
+        else:
+            pending = self._pending(window, start_time)
+            if not pending:
+                return 0
+            reference = pending[0][1]
+        return ((self.latest - reference) / reference) * 100
+
+    @property
+    def lookback(self) -> float:
+        """가장 긴 윈도우와 그 버킷 하나 (윈도우 시작이 버킷 단위로 내려가므로)"""
+        longest = self.windows[-1]
+        return longest.seconds + longest.resolution
+
+    def window_range(self, seconds: Optional[int] = None):
+        """윈도우(초, 없으면 가장 짧은 윈도우) 내 (최저가, 최고가). 샘플이 없으면 None"""
+        window = self._window(seconds)
+        start_time = self.max_event_time - window.seconds
+        window.expire(start_time)
+        pending = self._pending(window, start_time)
+        highs = [bucket[2] for bucket in pending]
+        lows = [bucket[3] for bucket in pending]
+        if window.highs:
+            highs.append(window.highs[0][1])
+            lows.append(window.lows[0][1])
+        if not highs:
+            return None
+        return min(lows), max(highs)
+
+    def _window(self, seconds: Optional[int]) -> _Window:
+        if seconds is None:
+            return self.windows[0]
+        for window in self.windows:
+            if window.seconds == seconds:
+                return window
+        raise KeyError(f"설정되지 않은 윈도우: {seconds}초")
+
+    def changes(self) -> Dict[int, float]:
+        """윈도우 (초) -> 현재 변동률(%)"""
+        return {window.seconds: self.window_change(window) for window in self.windows}
+
+    def _window_change(self) -> float:
+        """가장 짧은 윈도우의 변동률(%) (화면 표시용)"""
+        return self.window_change(self.windows[0])
+
+    @property
+    def detections(self) -> List[Tuple[int, float]]:
+        """마지막 detect/detect_batch에서 임계값을 넘은 (윈도우(초), 변동률) 목록"""
+        return self._detections
+
+    def detect(self, current_price: float, event_time: Optional[float] = None):
+        if event_time is None:
+            event_time = time.time()
+        return self.detect_batch(((event_time, current_price),))
+
+    def detect_batch(self, samples):
+        """샘플 묶음을 추가하고 윈도우마다 묶음 안의 최대 변동률로 판정
+
+        Returns:
+            tuple: (감지_여부, 임계값 대비 비율이 가장 큰 윈도우의 변동률)
+        """
+        windows = self.windows
+        window_change = self.window_change
+        peaks = [0.0] * len(windows)
+        for event_time, price in samples:
+            self._add_sample(event_time, price)
+            for i, window in enumerate(windows):
+                change = window_change(window)
+                if abs(change) > abs(peaks[i]):
+                    peaks[i] = change
+
+        detections = []
+        best, best_ratio = 0, 0.0
+        for window, change in zip(self.windows, peaks):
+            ratio = abs(change) / window.threshold
+            if ratio >= 1:
+                detections.append((window.seconds, change))
+                if ratio > best_ratio:
+                    best, best_ratio = change, ratio
+                    best_threshold = window.threshold
+        self._detections = detections
+        if not detections:
+            return False, 0
+        self._report(best, best_threshold)
+        return True, best
+
+
+class RollingStats:
+    """최근 size개 값의 평균과 분산을 값마다 O(1)로 갱신 (Welford 방식 추가/제거)
+
+    값은 array('d') 링에 보관하며(첫 값을 넣을 때 할당), 가득 차면 가장 오래된 값을 빼고 반환합니다.
+    더하고 빼기를 반복하며 쌓이는 반올림 오차는 size번 뺄 때마다 링에서 다시 계산해 없앱니다.
+    """
+    __slots__ = ('values', 'size', 'position', 'count', 'mean', 'm2', 'removals')
+
+    def __init__(self, size: int):
+        self.values = array('d')
+        self.size = max(1, int(size))  # 보관할 값 수
+        self.position = 0  # 다음에 쓸 칸
+        self.count = 0  # 값 수
+        self.mean = 0.0
+        self.m2 = 0.0  # 평균과의 차 제곱합
+        self.removals = 0  # 마지막으로 다시 계산한 뒤 뺀 값 수
+
+    @property
+    def variance(self) -> float:
+        """모분산"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.count
+
+    @property
+    def sum_squares(self) -> float:
+        return self.m2 + self.count * self.mean * self.mean
+
+    def push(self, value: float) -> Optional[float]:
+        """값을 넣고, 가득 차 있었으면 빠진 가장 오래된 값을 반환"""
+        if not self.values:
+            self.values = array('d', bytes(8 * self.size))
+        evicted = None
+        if self.count == self.size:
+            evicted = self.values[self.position]
+            self.count -= 1
+            if self.count:
+                delta = evicted - self.mean
+                self.mean -= delta / self.count
+                self.m2 = max(0.0, self.m2 - delta * (evicted - self.mean))
+            else:
+                self.mean = self.m2 = 0.0
+            self.removals += 1
+        self.values[self.position] = value
+        self.position = (self.position + 1) % self.size
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.removals >= self.size:
+            self._recompute()
+        return evicted
+
+    def _recompute(self):
+        values = self.values if self.count == self.size else [
+            self.values[(self.position - self.count + i) % self.size] for i in range(self.count)]
+        self.mean = sum(values) / self.count
+        self.m2 = sum((value - self.mean) ** 2 for value in values)
+        self.removals = 0
+
+    def clear(self):
+        self.position = self.count = self.removals = 0
+        self.mean = self.m2 = 0.0
+
+
+class ZScoreDetector(VolatilityDetector):
+    """종목 자신의 기준 변동성 대비 z-점수와 실현 변동성 배수로 감지하는 감지기
+
+    같은 0.3%라도 BTCUSDT와 소형 종목에서 의미가 다르므로 고정 임계값 대신 종목별 기준과 비교합니다.
+    체결을 1초 버킷으로 모으고, 워터마크가 지난 초마다 종가의 로그 수익률을 하나씩 만듭니다 (체결이
+    없는 초는 0). 최근 time_window초(감지 구간)와 그 바로 앞 baseline초(기준 구간)의 수익률을
+    RollingStats 두 개로 유지하므로 초당 O(1)이고, 감지 구간에서 빠진 수익률은 기준 구간으로 넘어갑니다.
+
+    - z-점수: 감지 구간 로그 수익률 합(아직 확정되지 않은 초 포함)과 기준 평균 × 초 수의 차를
+      기준 표준편차 × sqrt(초 수)로 나눈 값
+    - 실현 변동성 배수: 감지 구간 수익률 제곱합의 제곱근을 기준 구간에서 같은 초 수에 기대되는 값으로 나눈 값
+
+    |z| >= z_threshold 이거나 실현 변동성 배수가 rv_multiple 이상이면 감지합니다. 반환하는 변동률은
+    다른 감지기와 같은 윈도우 첫 가격 대비 변동률(%)이고 z-점수는 score로 얻습니다 (알림 단계는
+    NotificationState.SCORE_THRESHOLDS). 기준 구간 표본이 min_samples 미만이면 감지하지 않습니다.
+    """
+    __slots__ = ('baseline', 'z_threshold', 'rv_multiple', 'min_samples', 'open_seconds', 'final_second',
+                 'last_close', 'latest', 'recent', 'history', 'score', 'rv_ratio')
+
+    def __init__(self, baseline: float = ZSCORE_BASELINE_WINDOW, z_threshold: float = ZSCORE_THRESHOLD,
+                 rv_multiple: float = ZSCORE_RV_MULTIPLE, min_samples: int = ZSCORE_MIN_SAMPLES, **params):
+        super().__init__(**params)
+        self.baseline = int(baseline)  # 기준 구간 (초)
+        self.z_threshold = z_threshold  # z-점수 임계값
+        self.rv_multiple = rv_multiple  # 실현 변동성 배수 임계값 (0이면 사용 안 함)
+        self.min_samples = min_samples  # 감지를 시작하는 기준 구간 최소 표본 수
+        self.open_seconds: Dict[int, list] = {}  # 초 -> [마지막 체결 시간, 종가] (아직 확정되지 않은 버킷)
+        self.final_second = float('-inf')  # 이 초 이전의 버킷은 수익률로 확정
+        self.last_close = None  # 마지막으로 확정한 초의 종가
+        self.latest = None  # 이벤트 시간 기준 마지막 가격
+        self.recent = RollingStats(self.time_window)  # 감지 구간 1초 로그 수익률
+        self.history = RollingStats(self.baseline)  # 기준 구간 1초 로그 수익률
+        self.score = 0.0  # 마지막 감지의 z-점수
+        self.rv_ratio = 0.0  # 마지막 감지의 실현 변동성 배수
+
+    @property
+    def lookback(self) -> float:
+        """감지 구간과 기준 구간, 첫 수익률의 기준 종가 1초"""
+        return self.time_window + self.baseline + 1
+
+    def _add_sample(self, event_time: float, price: float) -> float:
+        late_samples = self.late_samples
+        change = super()._add_sample(event_time, price)
+        if self.late_samples != late_samples:
+            return change
+        if event_time >= self.max_event_time:
+            self.latest = price
+        limit = int(self.watermark)
+        if limit > self.final_second:
+            self._finalize(limit)
+
+        # 워터마크 이후의 샘플이므로 항상 아직 확정되지 않은 버킷에 들어감
+        second = int(event_time)
+        bucket = self.open_seconds.get(second)
+        if bucket is None:
+            self.open_seconds[second] = [event_time, price]
+        elif event_time >= bucket[0]:
+            bucket[0], bucket[1] = event_time, price
+        return change
+
+    def _finalize(self, limit: int):
+        """limit 이전 초의 버킷을 확정해 1초 로그 수익률로 넣음"""
+        second = self.final_second
+        span = int(self.time_window) + self.baseline
+        if limit - second > span:
+            # 처음이거나 두 구간보다 긴 공백 (재연결 실패 등): 통계를 새로 시작
+            self.recent.clear()
+            self.history.clear()
+            self.last_close = None
+            second = max(limit - span, min(self.open_seconds, default=limit))
+            for stale in [s for s in self.open_seconds if s < second]:
+                del self.open_seconds[stale]
+
+        open_seconds, recent, history = self.open_seconds, self.recent, self.history
+        while second < limit:
+            bucket = open_seconds.pop(second, None)
+            if bucket is not None:
+                close = bucket[1]
+                if self.last_close is not None:
+                    evicted = recent.push(math.log(close / self.last_close))
+                    if evicted is not None:
+                        history.push(evicted)
+                self.last_close = close
+            elif self.last_close is not None:
+                evicted = recent.push(0.0)
+                if evicted is not None:
+                    history.push(evicted)
+            second += 1
+        self.final_second = limit
+
+    def scores(self) -> Tuple[float, float]:
+        """현재 (z-점수, 실현 변동성 배수). 기준 구간 표본이 모자라면 (0, 0)"""
+        history = self.history
+        if history.count < self.min_samples or history.m2 <= 0 or self.last_close is None:
+            return 0.0, 0.0
+        recent = self.recent
+        partial = math.log(self.latest / self.last_close)  # 아직 확정되지 않은 초의 수익률
+        seconds = recent.count + 1
+        mean, variance = history.mean, history.variance
+        z = (recent.total + partial - seconds * mean) / math.sqrt(seconds * variance)
+        rv = math.sqrt((recent.sum_squares + partial * partial) / (seconds * (variance + mean * mean)))
+        return z, rv
+
+    def _strength(self, z: float, rv: float) -> float:
+        """임계값 대비 비율 (1 이상이면 감지)"""
+        strength = abs(z) / self.z_threshold
+        if self.rv_multiple:
+            strength = max(strength, rv / self.rv_multiple)
+        return strength
+
+    def _describe(self, price_change: float, threshold: Optional[float] = None) -> str:
+        return (
+            f"변동성 감지! {price_change:+.2f}% (z {self.score:+.1f}, 실현 변동성 {self.rv_ratio:.1f}배, "
+            f"임계값: z {self.z_threshold:g}, 이전: {self.last_detected_change:+.2f}%)"
+        )
+
+    def detect(self, current_price: float, event_time: Optional[float] = None):
+        if event_time is None:
+            event_time = time.time()
+        return self.detect_batch(((event_time, current_price),))
+
+    def detect_batch(self, samples):
+        """샘플 묶음을 추가하고 묶음 안에서 임계값 대비 비율이 가장 큰 시점으로 판정
+
+        Returns:
+            tuple: (감지_여부, 그 시점의 윈도우 첫 가격 대비 변동률(%))
+        """
+        best_strength, best = 0.0, None
+        for event_time, price in samples:
+            change = self._add_sample(event_time, price)
+            z, rv = self.scores()
+            strength = self._strength(z, rv)
+            if strength > best_strength:
+                best_strength, best = strength, (change, z, rv)
+
+        if best_strength < 1:
+            return False, 0
+        change, self.score, self.rv_ratio = best
+        self._report(change)
+        return True, change
+
+
+# 감지기 모드 -> 클래스
+DETECTORS = {
+    'oldest': VolatilityDetector,
+    'range': RangeVolatilityDetector,
+    'multi': MultiWindowDetector,
+    'zscore': ZScoreDetector,
+}
+
+
+def create_detector(mode: str = DETECTOR_MODE, **params) -> VolatilityDetector:
+    """설정된 모드의 변동성 감지기 생성 (params는 time_window, alert_threshold, verbose 등 감지기 생성자 인자)"""
+    try:
+        detector_class = DETECTORS[mode]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 감지기 모드: {mode} (가능한 값: {', '.join(DETECTORS)})")
+    return detector_class(**params)
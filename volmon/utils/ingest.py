@@ -0,0 +1,108 @@
+# volmon/utils/ingest.py
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from volmon.config import BATCH_INTERVAL_MS, BATCH_MAX_SIZE, BATCH_POLICY
+
+# (event_time, price) 샘플
+Sample = Tuple[float, float]
+
+# 버퍼가 가득 찼을 때의 처리 방식
+# - none: 손실 없음. 즉시 묶음을 넘겨 감지 수행
+# - coalesce: 버퍼를 첫 가격/최저가/최고가/마지막 가격만 남기도록 압축
+# - drop: 다음 묶음 전송 시점까지 새 체결을 버림
+BATCH_POLICIES = ('none', 'coalesce', 'drop')
+
+
+def coalesce_samples(samples: List[Sample]) -> List[Sample]:
+    """시간 순서를 유지한 채 첫 샘플, 최저가, 최고가, 마지막 샘플만 남김"""
+    if len(samples) <= 4:
+        return samples
+    prices = [price for _, price in samples]
+    keep = {
+        0,
+        len(samples) - 1,
+        prices.index(min(prices)),
+        prices.index(max(prices)),
+    }
+    return [samples[i] for i in sorted(keep)]
+
+
+class TradeBatcher:
+    """심볼 하나의 체결을 버퍼에 모아 일정 주기(또는 크기)마다 묶음으로 넘겨주는 수집기
+
+    스레드 안전하지 않으므로 호출하는 쪽(TickerMonitor)에서 직렬화해야 합니다.
+    """
+    __slots__ = (
+        'interval', 'max_size', 'policy', 'buffer', 'last_flush', 'received', 'delivered', 'coalesced', 'dropped',
+        'batches'
+    )
+
+    def __init__(
+        self,
+        interval_ms: int = BATCH_INTERVAL_MS,
+        max_size: int = BATCH_MAX_SIZE,
+        policy: str = BATCH_POLICY
+    ):
+        if policy not in BATCH_POLICIES:
+            raise ValueError(f"지원하지 않는 배치 정책: {policy} (가능한 값: {', '.join(BATCH_POLICIES)})")
+        self.interval = interval_ms / 1000  # 묶음 전송 주기 (초)
+        self.max_size = max_size  # 버퍼 최대 크기
+        self.policy = policy  # 버퍼가 가득 찼을 때의 처리 방식
+        self.buffer: List[Sample] = []  # 아직 넘기지 않은 샘플
+        self.last_flush = time.monotonic()  # 마지막 묶음 전송 시간
+
+        # 처리 통계
+        self.received = 0  # 수신한 체결 수
+        self.delivered = 0  # 감지기로 넘긴 샘플 수
+        self.coalesced = 0  # 압축으로 합쳐진 샘플 수
+        self.dropped = 0  # 버려진 체결 수
+        self.batches = 0  # 넘긴 묶음 수
+
+    def add(self, event_time: float, price: float) -> Optional[List[Sample]]:
+        """체결을 버퍼에 추가하고, 전송 시점이 되면 묶음을 반환"""
+        self.received += 1
+
+        if len(self.buffer) >= self.max_size:
+            if self.policy == 'drop':
+                self.dropped += 1
+                return self._due()
+            if self.policy == 'coalesce':
+                before = len(self.buffer)
+                self.buffer = coalesce_samples(self.buffer)
+                self.coalesced += before - len(self.buffer)
+            else:
+                # 손실 없음: 가득 찬 버퍼를 먼저 넘기고 새 버퍼에 추가
+                batch = self.flush()
+                self.buffer.append((event_time, price))
+                return batch
+
+        self.buffer.append((event_time, price))
+        return self._due()
+
+    def _due(self) -> Optional[List[Sample]]:
+        """전송 주기가 지났으면 묶음을 반환"""
+        if time.monotonic() - self.last_flush >= self.interval:
+            return self.flush()
+        return None
+
+    def flush(self) -> List[Sample]:
+        """버퍼의 샘플을 모두 꺼냄 (비어 있으면 빈 리스트)"""
+        self.last_flush = time.monotonic()
+        batch, self.buffer = self.buffer, []
+        if batch:
+            self.delivered += len(batch)
+            self.batches += 1
+        return batch
+
+    def stats(self) -> Dict[str, int]:
+        """처리 통계"""
+        return {
+            "received": self.received,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "pending": len(self.buffer),
+        }
@@ -0,0 +1,209 @@
+# volmon/utils/log.py
+"""큐 기반 비동기 로깅
+
+수신/감지 스레드에서 로그를 남기면 메시지 문자열만 만들어 큐에 넣고 바로 반환하며, 파일 쓰기와
+콘솔 출력은 리스너 스레드가 수행합니다. 장애 중 로그가 몰려도 수신 스레드는 디스크를 기다리지 않습니다.
+
+- 파일: LOG_MAX_MB 크기마다 (LOG_ROTATE_WHEN을 지정하면 시간마다) 교체, LOG_FORMAT이 'json'이면 JSON 한 줄씩
+- 콘솔: extra=CONSOLE로 남긴 로그만 출력 (감지, 알림 큐 진입, 전송 오류 등 사용자가 봐야 하는 것)
+- 반복 억제: 같은 경고/오류 메시지(심볼이 메시지에 포함되므로 심볼별)는 LOG_REPEAT_INTERVAL초에
+  한 번만 큐에 넣고, 다음에 기록할 때 그 사이 생략한 건수를 덧붙임
+
+샤드 워커 프로세스는 setup_logging(forward_to=...)로 부모 프로세스의 큐에 로그를 넘기고,
+부모가 같은 파일에 씁니다 (여러 프로세스가 한 파일을 교체하지 않도록).
+"""
+
+import sys
+import json
+import time
+import queue
+import atexit
+import logging
+import logging.handlers
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from volmon.config import (
+    LOG_FILE, LOG_FORMAT, LOG_MAX_MB, LOG_ROTATE_WHEN, LOG_BACKUPS, LOG_QUEUE_SIZE, LOG_REPEAT_INTERVAL
+)
+
+# 콘솔에도 출력할 로그: logger.info(..., extra=CONSOLE)
+CONSOLE = {'console': True}
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_handler: Optional[logging.Handler] = None  # 'volmon' 로거에 붙인 큐 핸들러
+_listeners = []  # 실행 중인 QueueListener
+_file_handler: Optional[logging.Handler] = None
+console_handler: Optional[logging.Handler] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나 (ts, level, thread, msg, exc)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'thread': record.threadName,
+            'msg': record.getMessage(),
+        }
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+
+
+class RepeatFilter(logging.Filter):
+    """같은 경고/오류 메시지를 interval초에 한 번만 통과시키고 생략한 건수를 다음 기록에 덧붙임
+
+    여러 스레드에서 잠금 없이 호출하므로 드물게 생략 건수가 한 건 어긋날 수 있습니다.
+    """
+
+    def __init__(self, interval: float = LOG_REPEAT_INTERVAL, level: int = logging.WARNING, max_keys: int = 10_000):
+        super().__init__()
+        self.interval = interval
+        self.level = level  # 이 수준 이상만 억제 (INFO 이하는 항상 통과)
+        self.max_keys = max_keys  # 기억할 최대 메시지 수
+        self.seen: Dict[Tuple[int, str], list] = {}  # (수준, 메시지) -> [마지막 기록 시간, 생략 건수]
+        self.suppressed = 0  # 누적 생략 건수
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level or self.interval <= 0:
+            return True
+        key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+        state = self.seen.get(key)
+        if state is not None and now - state[0] < self.interval:
+            state[1] += 1
+            self.suppressed += 1
+            return False
+
+        if state is not None and state[1]:
+            record.msg = f"{key[1]} (이전 {state[1]}건 반복 생략)"
+            record.args = None
+        if state is None and len(self.seen) >= self.max_keys:
+            self._prune(now)
+        self.seen[key] = [now, 0]
+        return True
+
+    def _prune(self, now: float):
+        """억제 구간이 지난 메시지를 잊음 (그래도 많으면 전부)"""
+        expired = [key for key, state in list(self.seen.items()) if now - state[0] >= self.interval]
+        for key in expired:
+            self.seen.pop(key, None)
+        if len(self.seen) >= self.max_keys:
+            self.seen.clear()
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """호출 스레드에서는 메시지 문자열만 만들어 큐에 넣음 (포맷과 쓰기는 리스너 스레드)"""
+
+    def __init__(self, log_queue, max_size: int = 0):
+        super().__init__(log_queue)
+        self.max_size = max_size  # 쓰기 대기 최대 로그 수 (0이면 제한 없음)
+        self.dropped = 0  # 큐가 가득 차서 버린 로그 수
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 다른 프로세스로 넘길 수 있도록 인자와 예외 객체를 문자열로 바꿈
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        # SimpleQueue는 잠금 없이 넣으므로 크기 제한은 qsize()로 확인 (조금 넘칠 수 있음)
+        if self.max_size and self.queue.qsize() >= self.max_size:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+
+class _ConsoleFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, 'console', False)
+
+
+def _file_handler_for(path: str) -> logging.Handler:
+    if LOG_ROTATE_WHEN:
+        handler = logging.handlers.TimedRotatingFileHandler(
+            path, when=LOG_ROTATE_WHEN, backupCount=LOG_BACKUPS, encoding='utf-8', delay=True)
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=int(LOG_MAX_MB * 1024 * 1024), backupCount=LOG_BACKUPS, encoding='utf-8', delay=True)
+    if LOG_FORMAT == 'json':
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT))
+    return handler
+
+
+def _listen(log_queue) -> logging.handlers.QueueListener:
+    listener = logging.handlers.QueueListener(log_queue, _file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+    return listener
+
+
+def setup_logging(path: str = LOG_FILE, forward_to=None) -> logging.Logger:
+    """'volmon' 로거를 큐 핸들러로 설정 (다시 호출하면 이전 설정을 정리하고 교체)
+
+    Args:
+        path: 로그 파일 경로
+        forward_to: 샤드 워커에서 부모 프로세스의 forward_queue()를 넘기면 파일에 직접 쓰지 않고 그 큐로 보냄
+    """
+    global _handler, _file_handler, console_handler
+    logger = logging.getLogger('volmon')
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    stop_logging()
+
+    if forward_to is not None:
+        _handler = _QueueHandler(forward_to)
+    else:
+        _file_handler = _file_handler_for(path)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter('%(message)s'))
+        console_handler.addFilter(_ConsoleFilter())
+        log_queue = queue.SimpleQueue()
+        _handler = _QueueHandler(log_queue, LOG_QUEUE_SIZE)
+        _listen(log_queue)
+    _handler.addFilter(RepeatFilter())
+    logger.addHandler(_handler)
+    return logger
+
+
+def forward_queue(context):
+    """샤드 워커의 로그를 받을 프로세스 간 큐 (부모 프로세스의 리스너가 파일에 씀)"""
+    log_queue = context.Queue()
+    _listen(log_queue)
+    return log_queue
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 쓰고 리스너와 핸들러 정리 (종료 시 자동 호출)"""
+    global _handler
+    while _listeners:
+        _listeners.pop().stop()
+    if _handler is not None:
+        logging.getLogger('volmon').removeHandler(_handler)
+        _handler = None
+    for handler in (_file_handler, console_handler):
+        if handler is not None:
+            handler.flush()
+
+
+def stats() -> Dict[str, int]:
+    """로그 큐 통계"""
+    if _handler is None:
+        return {}
+    repeat = next((f for f in _handler.filters if isinstance(f, RepeatFilter)), None)
+    return {
+        'dropped': _handler.dropped,
+        'suppressed': repeat.suppressed if repeat is not None else 0,
+    }
+
+
+atexit.register(stop_logging)
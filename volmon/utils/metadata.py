@@ -0,0 +1,229 @@
+# volmon/utils/metadata.py
+"""거래소 메타데이터 캐시
+
+- SymbolInfo: exchangeInfo의 심볼 하나에서 필요한 필드만 담은 레코드 (__slots__)
+- CachedResource: 메모리 TTL 캐시 + 디스크 저장 + 조건부/stale-while-revalidate 갱신
+
+유효 시간(ttl) 안에서는 다시 조회하지 않고, ttl이 지났지만 stale_ttl 안이면 이전 값을 바로
+돌려주면서 백그라운드에서 갱신합니다. 갱신할 때는 서버가 준 ETag/Last-Modified로 조건부
+요청을 보내고(304면 본문 없음), 검증자가 없으면 본문 해시가 같을 때 색인을 다시 만들지 않습니다.
+디스크에는 원본 JSON 대신 색인할 레코드만 저장하므로 재시작 후에도 작은 파일 하나로 바로 채워집니다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from volmon.config import CACHE_DIR
+from volmon.utils.parser import loads
+
+logger = logging.getLogger('volmon')
+
+# 검증자(ETag 등)를 받아 (본문, 새 검증자)를 반환하는 조회 함수. 304면 본문이 None
+Fetcher = Callable[[Dict[str, str]], Tuple[Optional[bytes], Dict[str, str]]]
+
+
+class SymbolInfo:
+    """거래쌍 하나의 메타데이터"""
+    __slots__ = ('symbol', 'status', 'base_asset', 'quote_asset', 'tick_size', 'step_size', 'min_notional', 'spot')
+
+    def __init__(self, symbol: str, status: str, base_asset: str, quote_asset: str,
+                 tick_size: float, step_size: float, min_notional: float, spot: bool):
+        self.symbol = symbol
+        self.status = status  # 거래 상태 (TRADING, BREAK 등)
+        self.base_asset = base_asset
+        self.quote_asset = quote_asset
+        self.tick_size = tick_size  # 가격 단위 (PRICE_FILTER)
+        self.step_size = step_size  # 수량 단위 (LOT_SIZE)
+        self.min_notional = min_notional  # 최소 주문 금액 (NOTIONAL / MIN_NOTIONAL)
+        self.spot = spot  # 현물 거래 가능 여부
+
+    @property
+    def trading(self) -> bool:
+        return self.status == 'TRADING'
+
+    @classmethod
+    def from_exchange_info(cls, info: Dict[str, Any]) -> 'SymbolInfo':
+        """exchangeInfo의 symbols 항목 하나에서 생성"""
+        filters = {f['filterType']: f for f in info.get('filters', ())}
+        notional = filters.get('NOTIONAL') or filters.get('MIN_NOTIONAL') or {}
+        return cls(
+            info['symbol'],
+            info.get('status', ''),
+            info.get('baseAsset', ''),
+            info.get('quoteAsset', ''),
+            float(filters.get('PRICE_FILTER', {}).get('tickSize', 0)),
+            float(filters.get('LOT_SIZE', {}).get('stepSize', 0)),
+            float(notional.get('minNotional', 0)),
+            bool(info.get('isSpotTradingAllowed', True)),
+        )
+
+    def to_row(self) -> List[Any]:
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __repr__(self) -> str:
+        return f"SymbolInfo({self.symbol}, {self.status}, tick={self.tick_size}, step={self.step_size})"
+
+
+def index_symbols(exchange_info: Dict[str, Any]) -> Dict[str, SymbolInfo]:
+    """exchangeInfo 응답 -> 심볼 -> SymbolInfo"""
+    return {info['symbol']: SymbolInfo.from_exchange_info(info) for info in exchange_info['symbols']}
+
+
+def encode_symbols(symbols: Dict[str, SymbolInfo]) -> List[List[Any]]:
+    return [info.to_row() for info in symbols.values()]
+
+
+def decode_symbols(rows: List[List[Any]]) -> Dict[str, SymbolInfo]:
+    return {row[0]: SymbolInfo(*row) for row in rows}
+
+
+class CachedResource:
+    """무거운 REST 응답 하나를 색인한 값으로 캐시 (메모리 + 디스크)"""
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Fetcher,
+        build: Callable[[Any], Any],
+        encode: Callable[[Any], Any],
+        decode: Callable[[Any], Any],
+        ttl: float,
+        stale_ttl: float,
+        key: str = '',
+        directory: Optional[str] = CACHE_DIR
+    ):
+        self.name = name
+        self.fetch = fetch  # 조건부 조회 함수
+        self.build = build  # 응답 JSON -> 색인한 값
+        self.encode = encode  # 색인한 값 -> 디스크 저장 형식
+        self.decode = decode  # 디스크 저장 형식 -> 색인한 값
+        self.ttl = ttl  # 다시 조회하지 않는 시간 (초)
+        self.stale_ttl = stale_ttl  # 백그라운드 갱신 중 이전 값을 쓰는 최대 나이 (초)
+        self.key = key  # 응답 출처 (주소가 바뀌면 디스크 캐시를 쓰지 않음)
+        self.path = Path(directory) / f"{name}.json" if directory else None
+
+        self.value = None
+        self.fetched_at = 0.0  # 마지막으로 서버에서 확인한 시간 (벽시계)
+        self.digest = None  # 본문 해시
+        self.validators: Dict[str, str] = {}  # ETag, Last-Modified
+        self.loaded = False  # 디스크 캐시를 읽었는지 여부
+        self.lock = threading.Lock()  # 디스크 읽기
+        self.refresh_lock = threading.Lock()  # 동시에 한 번만 조회
+        self.refreshing = False  # 백그라운드 갱신 중
+
+        self.hits = 0  # 유효 시간 안에서 바로 반환
+        self.stale_hits = 0  # 이전 값을 반환하고 백그라운드 갱신
+        self.fetches = 0  # 서버 조회 횟수
+        self.not_modified = 0  # 조회했지만 바뀌지 않음 (304 또는 같은 본문)
+
+    def _load(self):
+        """디스크 캐시 읽기 (없거나 손상됐거나 출처가 다르면 무시)"""
+        self.loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            saved = json.loads(self.path.read_text(encoding='utf-8'))
+            if saved.get('key') != self.key:
+                return
+            self.value = self.decode(saved['data'])
+            self.fetched_at = saved['fetched_at']
+            self.digest = saved.get('digest')
+            self.validators = saved.get('validators', {})
+            logger.info(f"[Cache] {self.name} 디스크 캐시 사용 ({time.time() - self.fetched_at:.0f}초 전 조회)")
+        except Exception as e:
+            logger.warning(f"[Cache] {self.name} 디스크 캐시를 읽을 수 없습니다: {e}")
+
+    def _save(self):
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix('.tmp')
+            tmp.write_text(json.dumps({
+                'key': self.key,
+                'fetched_at': self.fetched_at,
+                'digest': self.digest,
+                'validators': self.validators,
+                'data': self.encode(self.value),
+            }, separators=(',', ':')), encoding='utf-8')
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"[Cache] {self.name} 디스크 캐시 저장 실패: {e}")
+
+    def age(self) -> float:
+        """마지막 확인 이후 경과 시간 (초)"""
+        return time.time() - self.fetched_at
+
+    def get(self):
+        """캐시된 값 (유효 시간이 지났으면 갱신, 조금 지났으면 이전 값 반환 후 백그라운드 갱신)"""
+        if not self.loaded:
+            with self.lock:
+                if not self.loaded:
+                    self._load()
+        value, age = self.value, self.age()
+        if value is not None and age < self.ttl:
+            self.hits += 1
+            return value
+        if value is not None and age < self.stale_ttl:
+            self.stale_hits += 1
+            self._refresh_in_background()
+            return value
+        return self.refresh()
+
+    def refresh(self, force: bool = False):
+        """서버에서 다시 조회 (조회 실패 시 이전 값이 있으면 그 값을 반환)"""
+        with self.refresh_lock:
+            # 기다리는 동안 다른 스레드가 갱신했으면 그 값 사용
+            if not force and self.value is not None and self.age() < self.ttl:
+                return self.value
+            try:
+                content, validators = self.fetch(self.validators)
+            except Exception as e:
+                if self.value is None:
+                    raise
+                logger.error(f"[Cache] {self.name} 갱신 실패, 이전 값을 사용합니다: {str(e)[:100]}")
+                return self.value
+            self.fetches += 1
+
+            digest = hashlib.sha1(content).hexdigest() if content is not None else self.digest
+            if content is None or (digest == self.digest and self.value is not None):
+                self.not_modified += 1
+            else:
+                self.value = self.build(loads(content))
+                self.digest = digest
+            if validators:
+                self.validators = validators
+            self.fetched_at = time.time()
+            self._save()
+            return self.value
+
+    def _refresh_in_background(self):
+        if self.refreshing:
+            return
+        self.refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"[Cache] {self.name} 백그라운드 갱신 실패: {str(e)[:100]}")
+            finally:
+                self.refreshing = False
+
+        threading.Thread(target=run, name=f"volmon-cache-{self.name}", daemon=True).start()
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 통계"""
+        return {
+            'age': self.age() if self.value is not None else -1,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'fetches': self.fetches,
+            'not_modified': self.not_modified,
+        }
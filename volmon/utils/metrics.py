@@ -0,0 +1,190 @@
+# volmon/utils/metrics.py
+"""단계별 지연 히스토그램과 Prometheus 텍스트 형식 지표 엔드포인트
+
+히스토그램은 마이크로초 단위 로그-선형(HDR 방식) 버킷을 사용합니다. 2배 구간마다 16개
+버킷으로 나누므로 상대 오차는 약 6% 이내이며, 기록은 정수 연산 몇 번과 리스트 증가 한 번입니다.
+여러 스레드에서 동시에 기록할 때 잠금을 쓰지 않으므로 드물게 한 건이 누락될 수 있습니다.
+
+카운터와 게이지는 핫 패스에서 따로 세지 않고, 이미 집계 중인 통계(수집기, 디스패처 등)를
+스크랩 시점에 collector 함수로 읽어 옵니다.
+
+지표 수집은 METRICS_ENABLED(또는 enabled 모듈 변수)가 켜져 있을 때만 수행합니다.
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from volmon.config import METRICS_ENABLED, METRICS_HOST, METRICS_PORT
+
+logger = logging.getLogger('volmon')
+
+# 지표 수집 여부 (핫 패스에서 확인)
+enabled = METRICS_ENABLED
+
+_SUB_BITS = 5  # 처음 32마이크로초는 1마이크로초 단위, 이후 2배 구간마다 16개 버킷
+_SUB_COUNT = 1 << _SUB_BITS
+_HALF = _SUB_COUNT >> 1
+_MAX_SHIFT = 36  # 약 2^41 마이크로초 (25일)까지 구분, 그 이상은 마지막 버킷
+_BUCKETS = _SUB_COUNT + _MAX_SHIFT * _HALF
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# (지표 이름, 레이블, 값)
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < _SUB_COUNT:
+        return micros if micros > 0 else 0
+    shift = micros.bit_length() - _SUB_BITS
+    if shift > _MAX_SHIFT:
+        return _BUCKETS - 1
+    return _SUB_COUNT + (shift - 1) * _HALF + ((micros >> shift) - _HALF)
+
+
+def _bucket_value(index: int) -> float:
+    """버킷 대표값 (마이크로초, 구간 중간값)"""
+    if index < _SUB_COUNT:
+        return float(index)
+    shift = (index - _SUB_COUNT) // _HALF + 1
+    mantissa = (index - _SUB_COUNT) % _HALF + _HALF
+    return ((mantissa << shift) + ((mantissa + 1) << shift)) / 2
+
+
+class Histogram:
+    """초 단위 값을 기록하는 로그-선형 버킷 히스토그램"""
+    __slots__ = ('name', 'help', 'counts', 'count', 'sum', 'max')
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        """값 하나 기록 (음수는 0으로 기록, 예: 거래소와 로컬 시계 차이)"""
+        if seconds < 0:
+            seconds = 0.0
+        self.counts[_bucket_index(int(seconds * 1e6))] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """분위수 (초). 기록이 없으면 0"""
+        total = sum(self.counts)
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(_bucket_value(index) / 1e6, self.max)
+        return self.max
+
+    def samples(self) -> List[Sample]:
+        """Prometheus summary 형식 샘플"""
+        samples = [(self.name, {'quantile': str(q)}, self.quantile(q)) for q in QUANTILES]
+        samples.append((f"{self.name}_sum", {}, self.sum))
+        samples.append((f"{self.name}_count", {}, self.count))
+        return samples
+
+
+class MetricsRegistry:
+    """히스토그램과 스크랩 시점 수집 함수 모음"""
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        # 수집 함수: (지표 이름, 유형, 설명) 메타데이터와 샘플 목록을 반환
+        self.collectors: List[Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]] = []
+        self.lock = threading.Lock()
+
+    def histogram(self, name: str, help: str) -> Histogram:
+        """이름에 해당하는 히스토그램 (없으면 생성)"""
+        with self.lock:
+            if name not in self.histograms:
+                self.histograms[name] = Histogram(name, help)
+            return self.histograms[name]
+
+    def register(self, collector: Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]):
+        """스크랩할 때 호출할 수집 함수 등록"""
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        lines = []
+
+        def emit(name, kind, help, samples):
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                if labels:
+                    label_text = ','.join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                    lines.append(f"{sample_name}{{{label_text}}} {value}")
+                else:
+                    lines.append(f"{sample_name} {value}")
+
+        for histogram in list(self.histograms.values()):
+            emit(histogram.name, 'summary', histogram.help, histogram.samples())
+        for collector in self.collectors:
+            try:
+                for name, kind, help, samples in collector():
+                    emit(name, kind, help, samples)
+            except Exception as e:
+                logger.error(f"[Metrics] 지표 수집 오류: {e}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# 전역 레지스트리와 단계별 히스토그램
+registry = MetricsRegistry()
+event_receive_seconds = registry.histogram(
+    'volmon_event_receive_seconds', '거래소 체결 시간부터 수신까지 걸린 시간')
+parse_seconds = registry.histogram(
+    'volmon_parse_seconds', '웹소켓 메시지 파싱 시간')
+render_seconds = registry.histogram(
+    'volmon_render_seconds', '화면 한 프레임을 그리는 시간')
+detect_seconds = registry.histogram(
+    'volmon_detect_seconds', '체결 묶음 하나의 변동성 감지 시간')
+notify_check_seconds = registry.histogram(
+    'volmon_notify_check_seconds', 'NotificationState.should_notify 판단 시간')
+webhook_seconds = registry.histogram(
+    'volmon_webhook_seconds', '디스코드 웹훅 요청 왕복 시간')
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_http_server(host: str = METRICS_HOST, port: int = METRICS_PORT) -> Optional[ThreadingHTTPServer]:
+    """/metrics 엔드포인트를 백그라운드 스레드에서 시작"""
+    try:
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        logger.error(f"[Metrics] 지표 서버 시작 실패 ({host}:{port}): {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='volmon-metrics', daemon=True).start()
+    logger.info(f"[Metrics] 지표 엔드포인트: http://{host}:{server.server_address[1]}/metrics")
+    return server
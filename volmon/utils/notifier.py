@@ -1,92 +1,302 @@
 # volmon/utils/notifier.py
 
+import os
 import requests
 import json
 import re
 import time
-from typing import Optional, Dict, Any, Tuple
-from volmon.config import DISCORD_WEBHOOK_URL, TIME_WINDOW
+import queue
+import random
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, List, Tuple
+from volmon.config import (
+    DISCORD_WEBHOOK_URL, TIME_WINDOW, REQUEST_TIMEOUT, ALERT_QUEUE_SIZE, ALERT_MAX_RETRIES,
+    ALERT_COALESCE_WINDOW, DETECTION_WINDOWS, ZSCORE_STEPS, STATE_FILE, STATE_SNAPSHOT_INTERVAL, STATE_MAX_AGE, STATE_LOCK_SHARDS
+)
 
 # 보안 설정 가져오기
 from volmon.config import SECURITY_TOKEN, ALLOWED_WEBHOOK_IDS
+from volmon.utils import metrics
+from volmon.utils.log import CONSOLE
+from volmon.utils.parser import loads
+
+logger = logging.getLogger('volmon')
+
+class SymbolState:
+    """심볼(과 윈도우) 하나의 알림 상태"""
+    __slots__ = ('last_notified', 'last_change', 'last_threshold_index', 'last_direction')
+
+    def __init__(self):
+        self.last_notified = 0  # 마지막 알림 시간
+        self.last_change = 0  # 마지막 알림의 변동률
+        self.last_threshold_index = -1  # 마지막 알림의 임계값 단계 (-1: 없음)
+        self.last_direction = 0  # 마지막 알림의 방향 (1: 상승, -1: 하락)
 
 # 알림 상태 추적을 위한 전역 변수
 class NotificationState:
+    """심볼(과 윈도우)별 알림 상태
+
+    상태는 심볼 해시로 LOCK_SHARDS개 구역에 나눠 담고 구역마다 잠금을 두므로, 여러 수신 스레드가
+    동시에 판단해도 같은 구역의 심볼끼리만 기다립니다. snapshot()은 구역을 하나씩 잠그고 복사하며,
+    save()/load()로 재시작 후에도 마지막 알림 단계를 이어갑니다 (재시작 직후 중복 알림 방지).
+    """
     _instance = None
     
     # 알림을 보낼 변동률 임계값 목록 (단위: %)
     THRESHOLDS = [0.3, 0.5, 1.0, 2.0, 3.0, 5.0]
+    MIN_CHANGE = 0.3  # 반복 알림을 보내는 최소 변동률 (%). 미만이면 임계값 단계 초기화
+    REPEAT_INTERVAL = 60  # 같은 단계 반복 알림 간격 (초)
+    # 다중 윈도우 감지의 윈도우 (초) -> 알림 단계. 윈도우마다 상태를 따로 두고, 반복 간격은 윈도우 길이 이상
+    WINDOW_THRESHOLDS = {int(window): list(steps) for window, steps in DETECTION_WINDOWS.items()}
+    # z-점수 감지의 알림 단계 (|z|). 변동률과 별도 상태로 두고, 첫 값 미만이면 단계 초기화
+    SCORE_THRESHOLDS = list(ZSCORE_STEPS)
+    LOCK_SHARDS = STATE_LOCK_SHARDS  # 잠금(구역) 수
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(NotificationState, cls).__new__(cls)
-            cls._instance._state = {}
+            cls._instance._init_shards()
         return cls._instance
+
+    @classmethod
+    def isolated(cls, thresholds: Optional[List[float]] = None) -> 'NotificationState':
+        """전역 상태와 분리된 인스턴스 생성 (리플레이, 파라미터 탐색용)"""
+        state = super(NotificationState, cls).__new__(cls)
+        state._init_shards()
+        if thresholds is not None:
+            state.THRESHOLDS = list(thresholds)
+            state.MIN_CHANGE = state.THRESHOLDS[0]
+        return state
+
+    def _init_shards(self):
+        self._shards: List[Dict[Any, SymbolState]] = [{} for _ in range(self.LOCK_SHARDS)]  # 키 -> 상태
+        self._locks = [threading.Lock() for _ in range(self.LOCK_SHARDS)]
+        self.version = 0  # 상태가 바뀐 횟수 (저장할 필요가 있는지 판단, 잠금 없이 세므로 근사값)
+
+    def _shard(self, symbol: str) -> int:
+        # 같은 심볼의 모든 윈도우는 같은 구역 (forget이 잠금 하나로 끝나도록)
+        return hash(symbol) % self.LOCK_SHARDS
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
     
-    def _get_threshold_index(self, change: float) -> int:
+    def forget(self, symbol: str):
+        """모니터링에서 빠진 심볼의 알림 상태 삭제 (모든 윈도우)"""
+        index = self._shard(symbol)
+        shard = self._shards[index]
+        with self._locks[index]:
+            shard.pop(symbol, None)
+            shard.pop((symbol, 'z'), None)
+            for window in self.WINDOW_THRESHOLDS:
+                shard.pop((symbol, window), None)
+        self.version += 1
+
+    def _get_threshold_index(self, change: float, thresholds: Optional[List[float]] = None) -> int:
         """변화율에 해당하는 임계값 인덱스를 반환합니다."""
+        thresholds = self.THRESHOLDS if thresholds is None else thresholds
         abs_change = abs(change)
-        for i, threshold in enumerate(self.THRESHOLDS):
+        for i, threshold in enumerate(thresholds):
             if abs_change < threshold:
                 return i - 1
-        return len(self.THRESHOLDS) - 1
+        return len(thresholds) - 1
     
-    def should_notify(self, symbol: str, change: float) -> Tuple[bool, float]:
+    def should_notify(self, symbol: str, change: float, now: Optional[float] = None,
+                      window: Optional[int] = None, score: Optional[float] = None) -> Tuple[bool, float]:
         """
         알림을 보내야 하는지 확인합니다.
         
         Args:
             symbol: 코인 심볼
             change: 현재 변동률
+            now: 판단 기준 시간 (초). 없으면 현재 시간 (리플레이는 체결 시간 사용)
+            window: 다중 윈도우 감지의 윈도우 (초). 있으면 그 윈도우의 알림 단계와 상태 사용
+            score: z-점수 감지의 z-점수. 있으면 변동률 대신 |z|를 SCORE_THRESHOLDS 단계와 비교 (방향은 변동률 기준)
             
         Returns:
             tuple: (알림_전송_여부, 마지막_알림_이후_경과_시간(초))
         """
-        current_time = time.time()
-        state = self._state.get(symbol, {
-            "last_notified": 0, 
-            "last_change": 0,
-            "last_threshold_index": -1,
-            "last_direction": 0
-        })
+        current_time = time.time() if now is None else now
+        level = change  # 알림 단계와 비교할 값
+        if score is not None:
+            key, thresholds, level = (symbol, 'z'), self.SCORE_THRESHOLDS, score
+            min_change, repeat_interval = thresholds[0], self.REPEAT_INTERVAL
+        elif window is None or window not in self.WINDOW_THRESHOLDS:
+            key, thresholds = symbol, self.THRESHOLDS
+            min_change, repeat_interval = self.MIN_CHANGE, self.REPEAT_INTERVAL
+        else:
+            key, thresholds = (symbol, window), self.WINDOW_THRESHOLDS[window]
+            min_change, repeat_interval = thresholds[0], max(self.REPEAT_INTERVAL, window)
         
         # 현재 방향 (1: 상승, -1: 하락, 0: 변화 없음)
         current_direction = 1 if change > 0 else (-1 if change < 0 else 0)
         
-        # 방향이 바뀌었는지 확인
-        direction_changed = (state["last_direction"] * current_direction) < 0
-        
         # 현재 변동률의 임계값 인덱스
-        current_threshold_index = self._get_threshold_index(change)
-        
-        # 알림 조건:
-        # 1. 방향이 바뀌었거나
-        # 2. 현재 변동률이 새로운 임계값에 도달했거나
-        # 3. 변동률이 0.3% 이상이고, 마지막 알림으로부터 1분(60초)이 지났을 때
-        should_notify = (
-            direction_changed or
-            current_threshold_index > state["last_threshold_index"] or
-            (abs(change) >= 0.3 and current_time - state["last_notified"] >= 60)
-        )
-        
-        # 변동률이 0.3% 미만이면 임계값 인덱스 초기화
-        if abs(change) < 0.3:
-            state["last_threshold_index"] = -1
-        
-        if should_notify:
-            state.update({
-                "last_notified": current_time,
-                "last_change": change,
-                "last_threshold_index": current_threshold_index,
-                "last_direction": current_direction
-            })
-            self._state[symbol] = state
+        current_threshold_index = self._get_threshold_index(level, thresholds)
+
+        index = self._shard(symbol)
+        shard = self._shards[index]
+        with self._locks[index]:
+            state = shard.get(key)
+            if state is None:
+                state = SymbolState()
+            
+            # 방향이 바뀌었는지 확인
+            direction_changed = (state.last_direction * current_direction) < 0
+            
+            # 알림 조건:
+            # 1. 방향이 바뀌었거나
+            # 2. 현재 변동률이 새로운 임계값에 도달했거나
+            # 3. 변동률이 MIN_CHANGE(0.3%) 이상이고, 마지막 알림으로부터 REPEAT_INTERVAL(60초)이 지났을 때
+            should_notify = (
+                direction_changed or
+                current_threshold_index > state.last_threshold_index or
+                (abs(level) >= min_change and current_time - state.last_notified >= repeat_interval)
+            )
             
-        return should_notify, current_time - state["last_notified"]
+            # 변동률(z-점수 감지는 |z|)이 첫 단계 미만이면 임계값 인덱스 초기화
+            if abs(level) < min_change and state.last_threshold_index != -1:
+                state.last_threshold_index = -1
+                self.version += 1
+            
+            if should_notify:
+                state.last_notified = current_time
+                state.last_change = change
+                state.last_threshold_index = current_threshold_index
+                state.last_direction = current_direction
+                shard[key] = state
+                self.version += 1
+            
+            return should_notify, current_time - state.last_notified
+
+    def snapshot(self) -> List[List[Any]]:
+        """모든 상태를 [심볼, 윈도우('z'는 z-점수 상태), 마지막 알림 시간, 변동률, 단계, 방향] 행으로 복사
+
+        구역을 하나씩 잠그므로 판단을 멈추지 않으며, 각 행은 한 시점의 값입니다.
+        """
+        rows = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                for key, state in shard.items():
+                    symbol, window = key if isinstance(key, tuple) else (key, None)
+                    rows.append([symbol, window, state.last_notified, round(state.last_change, 4),
+                                 state.last_threshold_index, state.last_direction])
+        return rows
+
+    def restore(self, rows: List[List[Any]], max_age: float = STATE_MAX_AGE, now: Optional[float] = None) -> int:
+        """snapshot() 행으로 상태를 채우고 복원한 수를 반환 (마지막 알림이 max_age초보다 오래된 행은 버림)"""
+        current_time = time.time() if now is None else now
+        restored = 0
+        for symbol, window, last_notified, last_change, threshold_index, direction in rows:
+            if current_time - last_notified > max_age:
+                continue
+            state = SymbolState()
+            state.last_notified = last_notified
+            state.last_change = last_change
+            state.last_threshold_index = threshold_index
+            state.last_direction = direction
+            index = self._shard(symbol)
+            with self._locks[index]:
+                self._shards[index][symbol if window is None else (symbol, window)] = state
+            restored += 1
+        return restored
+
+    def save(self, path: str = STATE_FILE) -> int:
+        """스냅샷을 임시 파일에 쓰고 이름을 바꿔 교체하고, 스냅샷 직전의 상태 버전을 반환
+
+        쓰는 도중 종료돼도 이전 파일이 그대로 남습니다.
+        """
+        version = self.version
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'saved_at': time.time(), 'rows': self.snapshot()}, separators=(',', ':')),
+                       encoding='utf-8')
+        os.replace(tmp, target)
+        return version
+
+    def load(self, path: str = STATE_FILE, max_age: float = STATE_MAX_AGE) -> int:
+        """save()로 저장한 상태를 복원하고 복원한 수를 반환 (없거나 손상됐으면 0)"""
+        target = Path(path)
+        if not target.exists():
+            return 0
+        try:
+            saved = loads(target.read_bytes())
+            return self.restore(saved['rows'], max_age)
+        except Exception as e:
+            logger.warning(f"[Notifier] 알림 상태 파일을 읽을 수 없습니다: {e}")
+            return 0
 
 # 전역 상태 관리자
 notification_state = NotificationState()
 
+class StateSnapshotter:
+    """알림 상태를 주기적으로 디스크에 저장하는 백그라운드 스레드 (바뀐 것이 없으면 쓰지 않음)"""
+
+    def __init__(self, state: NotificationState = notification_state, path: str = STATE_FILE,
+                 interval: float = STATE_SNAPSHOT_INTERVAL):
+        self.state = state
+        self.path = path
+        self.interval = interval  # 저장 주기 (초)
+        self.saved_version = state.version  # 마지막으로 저장한 시점의 상태 버전
+
+        self.saves = 0  # 저장 횟수
+        self.errors = 0  # 저장 실패 횟수
+        self.last_duration = 0.0  # 마지막 저장에 걸린 시간 (초)
+
+        self.running = False
+        self.wakeup = threading.Event()
+        self.thread = None
+
+    def load(self) -> int:
+        """시작 시 저장된 상태 복원"""
+        started = time.perf_counter()
+        restored = self.state.load(self.path)
+        self.saved_version = self.state.version
+        if restored:
+            logger.info(f"[Notifier] 알림 상태 {restored}건 복원 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+        return restored
+
+    def save(self):
+        """바뀐 것이 있으면 저장"""
+        if self.state.version == self.saved_version:
+            return
+        started = time.perf_counter()
+        try:
+            self.saved_version = self.state.save(self.path)
+            self.saves += 1
+        except OSError as e:
+            self.errors += 1
+            logger.warning(f"[Notifier] 알림 상태 저장 실패: {e}")
+        self.last_duration = time.perf_counter() - started
+
+    def _run(self):
+        while self.running:
+            self.wakeup.wait(self.interval)
+            self.save()
+
+    def start(self):
+        """저장 스레드 시작"""
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name='volmon-state', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """저장 스레드 종료 (마지막으로 한 번 저장)"""
+        self.running = False
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join(1)
+        self.save()
+
+    def stats(self) -> Dict[str, float]:
+        """저장 통계"""
+        return {'entries': len(self.state), 'saves': self.saves, 'errors': self.errors,
+                'last_duration': self.last_duration}
+
 class WebhookSecurityError(Exception):
     """웹훅 보안 관련 예외"""
     pass
@@ -106,6 +316,15 @@ def sanitize_mentions(text: str) -> str:
     """@everyone, @here 등의 멘션을 방지하기 위한 문자열 처리"""
     return text.replace("@everyone", "@​everyone").replace("@here", "@​here")
 
+def _score_text(score: Optional[float]) -> str:
+    """z-점수 감지 알림이면 ', z +5.2' (아니면 빈 문자열)"""
+    return f", z {score:+.1f}" if score is not None else ""
+
+def _score_cell(alert: Dict[str, Any]) -> str:
+    """표 행 끝에 붙이는 z-점수 (z-점수 감지 알림만)"""
+    score = alert.get('score')
+    return f" {'z' + format(score, '+.1f'):>6}" if score is not None else ""
+
 def create_alert_message(symbol: str, price: float, change: float, **kwargs) -> Dict[str, Any]:
     """알림 메시지 생성"""
     # 기본 메시지 생성
@@ -113,7 +332,7 @@ def create_alert_message(symbol: str, price: float, change: float, **kwargs) ->
         f"변동성 알림!\n"
         f"티커: {symbol.upper()}\n"
         f"가격: ${price:,.2f}\n"
-        f"변동률: {change:+.2f}% ({TIME_WINDOW}초 기준)\n"
+        f"변동률: {change:+.2f}% ({kwargs.get('window') or TIME_WINDOW}초 기준{_score_text(kwargs.get('score'))})\n"
         f"시간: {kwargs.get('timestamp', '')}"
     )
     
@@ -128,6 +347,293 @@ def create_alert_message(symbol: str, price: float, change: float, **kwargs) ->
         }
     }
 
+# 디스코드 메시지 content 최대 길이는 2000자 (여유를 두고 분할)
+MAX_CONTENT_LENGTH = 1900
+
+def create_batch_alert_messages(alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """여러 심볼의 알림을 변동률 크기 순 표로 묶은 메시지 목록 생성 (길이 제한에 맞춰 분할)"""
+    alerts = sorted(alerts, key=lambda alert: abs(alert['change']), reverse=True)
+    timestamp = max(str(alert.get('timestamp', '')) for alert in alerts)
+    windows = {alert.get('window') or TIME_WINDOW for alert in alerts}
+    footer = f"시간: {timestamp}"
+    if len(windows) == 1:
+        header = f"변동성 알림! {len(alerts)}개 종목 ({windows.pop()}초 기준)\n"
+        table_header = f"{'Symbol':<12} {'Price (USDT)':>16} {'Change':>8}\n"
+        rows = [
+            f"{alert['symbol'].upper():<12} {'$' + format(alert['price'], ',.2f'):>16} {alert['change']:>+7.2f}%{_score_cell(alert)}\n"
+            for alert in alerts
+        ]
+    else:
+        # 윈도우가 섞여 있으면 윈도우 열 추가
+        header = f"변동성 알림! {len(alerts)}건\n"
+        table_header = f"{'Symbol':<12} {'Price (USDT)':>16} {'Change':>8} {'Window':>7}\n"
+        rows = [
+            f"{alert['symbol'].upper():<12} {'$' + format(alert['price'], ',.2f'):>16} {alert['change']:>+7.2f}% "
+            f"{str(alert.get('window') or TIME_WINDOW) + 's':>7}{_score_cell(alert)}\n"
+            for alert in alerts
+        ]
+
+    messages = []
+    chunk = []
+    for row in rows:
+        body = "".join(chunk) + row
+        if chunk and len(header) + len(table_header) + len(body) + len(footer) + 8 > MAX_CONTENT_LENGTH:
+            messages.append(chunk)
+            chunk = []
+        chunk.append(row)
+    messages.append(chunk)
+
+    return [
+        {
+            "content": sanitize_mentions(f"{header}```\n{table_header}{''.join(chunk)}```\n{footer}"),
+            "allowed_mentions": {"parse": [], "users": [], "roles": [], "replied_user": False}
+        }
+        for chunk in messages
+    ]
+
+def coalesce_alerts(alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """같은 심볼(과 윈도우)의 알림은 가장 최근 것만 남김 (이전 임계값 단계 알림은 대체됨)"""
+    latest = {}
+    for alert in alerts:
+        latest[alert['symbol'].upper(), alert.get('window')] = alert
+    return list(latest.values())
+
+def render_alerts(alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """알림 목록을 전송할 메시지 목록으로 변환 (한 건이면 기존 형식)"""
+    if len(alerts) == 1:
+        alert = alerts[0]
+        return [create_alert_message(**alert)]
+    return create_batch_alert_messages(alerts)
+
+class AlertDispatcher:
+    """백그라운드 스레드에서 디스코드 웹훅을 전송하는 디스패처
+
+    submit()은 알림을 제한된 크기의 큐에 넣고 즉시 반환하므로 수신 스레드가
+    네트워크를 기다리지 않습니다. 전송 스레드는 coalesce_window(초) 동안 들어온
+    알림을 모아 심볼별 최신 알림만 남긴 뒤 하나의 표 메시지로 보냅니다.
+    keep-alive 연결 풀을 재사용하며, 429 응답의 retry_after와 X-RateLimit-* 헤더를
+    따르고 실패 시 백오프 후 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        webhook_url: str = DISCORD_WEBHOOK_URL,
+        max_queue: int = ALERT_QUEUE_SIZE,
+        max_retries: int = ALERT_MAX_RETRIES,
+        timeout: float = REQUEST_TIMEOUT,
+        coalesce_window: float = ALERT_COALESCE_WINDOW
+    ):
+        self.webhook_url = webhook_url  # 디스코드 웹훅 URL
+        self.queue = queue.Queue(maxsize=max_queue)  # (큐에 넣은 시간, 알림)
+        self.coalesce_window = coalesce_window  # 알림을 모으는 시간 (초, 0이면 대기 중인 것만 묶음)
+        self.max_retries = max_retries  # 최대 재시도 횟수
+        self.timeout = timeout  # 요청 제한 시간 (초)
+        self.session = self._init_session()
+        self.rate_limited_until = 0  # 이 시각(monotonic)까지 전송 보류
+        self.thread = None  # 전송 스레드
+        self.lock = threading.Lock()  # 스레드 시작 보호
+
+        # 전송 통계
+        self.sent = 0  # 전송에 성공한 알림 수
+        self.failed = 0  # 최종 실패 수
+        self.dropped = 0  # 큐가 가득 차서 버려진 수
+        self.retries = 0  # 재시도 수
+        self.rate_limited = 0  # 429 응답 수
+        self.coalesced = 0  # 다른 알림에 합쳐진 알림 수
+        self.messages = 0  # 전송한 웹훅 메시지 수
+        self.skipped = 0  # 알림 조건(단계, 반복 간격)을 충족하지 않아 보내지 않은 감지 수
+        self.latencies = deque(maxlen=1000)  # 큐 진입부터 전송 완료까지 걸린 시간 (초)
+
+    def _init_session(self) -> requests.Session:
+        """keep-alive 연결 풀을 사용하는 세션 초기화"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Content-Type': 'application/json',
+            'User-Agent': 'VolMon/1.0',
+            'X-Security-Token': SECURITY_TOKEN
+        })
+        return session
+
+    def start(self):
+        """전송 스레드 시작 (이미 실행 중이면 무시)"""
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._run, name='volmon-alert')
+            self.thread.daemon = True  # 메인 스레드 종료 시 함께 종료
+            self.thread.start()
+
+    def stop(self, timeout: float = 5):
+        """큐에 남은 알림을 전송한 뒤 스레드 종료"""
+        if self.thread is None:
+            return
+        self.queue.put((0, None))  # 종료 신호
+        self.thread.join(timeout)
+
+    def submit(self, alert: Dict[str, Any]) -> bool:
+        """알림(symbol, price, change, timestamp)을 전송 큐에 넣음 (블로킹하지 않음)
+
+        Returns:
+            bool: 큐 진입 성공 여부 (큐가 가득 차면 False)
+        """
+        self.start()
+        try:
+            self.queue.put_nowait((time.monotonic(), alert))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.error("[Notifier Error] 알림 큐가 가득 차서 알림을 버립니다", extra=CONSOLE)
+            return False
+
+    def _collect(self, first) -> Tuple[list, bool]:
+        """첫 알림 이후 coalesce_window 동안 들어온 알림을 모음
+
+        Returns:
+            tuple: ((큐에 넣은 시간, 알림) 목록, 종료 신호 수신 여부)
+        """
+        batch = [first]
+        deadline = time.monotonic() + self.coalesce_window
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+            if item[1] is None:
+                return batch, True
+            batch.append(item)
+
+    def _run(self):
+        """큐에서 알림을 모아 심볼별로 합친 뒤 전송"""
+        while True:
+            first = self.queue.get()
+            if first[1] is None:
+                break
+            batch, stopping = self._collect(first)
+            try:
+                alerts = coalesce_alerts([alert for _, alert in batch])
+                self.coalesced += len(batch) - len(alerts)
+                delivered = all([self._deliver(message) for message in render_alerts(alerts)])
+                if delivered:
+                    self.sent += len(batch)
+                    now = time.monotonic()
+                    self.latencies.extend(now - enqueued_at for enqueued_at, _ in batch)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"[Notifier Error] Unexpected error: {str(e)}", extra=CONSOLE)
+            if stopping:
+                break
+
+    def _wait_rate_limit(self):
+        """레이트 리밋 해제 시각까지 대기"""
+        wait_time = self.rate_limited_until - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    def _update_rate_limit(self, response: requests.Response):
+        """X-RateLimit-* 헤더로 다음 전송 가능 시각 갱신"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset_after = response.headers.get('X-RateLimit-Reset-After')
+        if remaining is None or reset_after is None:
+            return
+        try:
+            remaining, reset_after = int(remaining), float(reset_after)
+        except ValueError:
+            logger.debug(f"[Notifier] 잘못된 레이트 리밋 헤더 무시: {remaining!r}, {reset_after!r}")
+            return
+        if remaining <= 0:
+            self.rate_limited_until = max(self.rate_limited_until, time.monotonic() + reset_after)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        """429 응답의 재시도 대기 시간 (초)"""
+        try:
+            return float(response.json()['retry_after'])
+        except (ValueError, KeyError, TypeError):
+            pass
+        retry_after = response.headers.get('Retry-After', 1)
+        try:
+            return float(retry_after)
+        except (ValueError, TypeError):
+            # HTTP 날짜 형식 등 초 단위가 아닌 값
+            logger.debug(f"[Notifier] 잘못된 Retry-After 헤더 무시: {retry_after!r}")
+            return 1.0
+
+    def _backoff(self, attempt: int):
+        """지수 백오프 (지터 포함, 최대 30초)"""
+        time.sleep(min(2 ** attempt, 30) * random.uniform(0.5, 1.0))
+
+    def _deliver(self, message: Dict[str, Any]) -> bool:
+        """메시지 하나를 전송 (레이트 리밋과 일시적 오류는 재시도)"""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.retries += 1
+            self._wait_rate_limit()
+
+            started = time.perf_counter()
+            try:
+                response = self.session.post(self.webhook_url, data=json.dumps(message), timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"[Notifier Error] Failed to send alert: {str(e)}", extra=CONSOLE)
+                self._backoff(attempt)
+                continue
+
+            if metrics.enabled:
+                metrics.webhook_seconds.observe(time.perf_counter() - started)
+            self._update_rate_limit(response)
+
+            if response.status_code == 429:
+                self.rate_limited += 1
+                retry_after = self._retry_after(response)
+                logger.warning("[Notifier] Discord rate limit. 재시도합니다.")
+                self.rate_limited_until = max(self.rate_limited_until, time.monotonic() + retry_after)
+                continue
+
+            if response.status_code >= 500:
+                logger.error(f"[Notifier Error] Discord API Error ({response.status_code}). 재시도합니다.", extra=CONSOLE)
+                self._backoff(attempt)
+                continue
+
+            if response.status_code >= 400:
+                try:
+                    error_msg = response.json()
+                except ValueError:
+                    error_msg = response.text
+                logger.error(f"[Notifier Error] Discord API Error ({response.status_code}): {error_msg}", extra=CONSOLE)
+                self.failed += 1
+                return False
+
+            self.messages += 1
+            logger.info("[Notifier] Successfully sent alert to Discord")
+            return True
+
+        logger.error(f"[Notifier Error] {self.max_retries}회 재시도 후 알림 전송 실패", extra=CONSOLE)
+        self.failed += 1
+        return False
+
+    def stats(self) -> Dict[str, float]:
+        """큐 깊이와 전송 지연 통계"""
+        latencies = sorted(self.latencies)
+        return {
+            "queue_depth": self.queue.qsize(),
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "coalesced": self.coalesced,
+            "messages": self.messages,
+            "skipped": self.skipped,
+            "latency_p50": latencies[len(latencies) // 2] if latencies else 0,
+            "latency_max": latencies[-1] if latencies else 0,
+        }
+
+# 전역 알림 디스패처
+alert_dispatcher = AlertDispatcher()
+
 def send_alert(
     symbol: str, 
     price: float, 
@@ -136,76 +642,59 @@ def send_alert(
     **kwargs
 ) -> bool:
     """
-    디스코드로 알림을 전송합니다.
+    디스코드 알림을 전송 큐에 넣습니다 (네트워크를 기다리지 않음).
     
     Args:
         symbol: 코인 심볼 (예: 'BTCUSDT')
         price: 현재 가격
         change: 가격 변동률 (%)
         security_token: 외부 요청 검증용 토큰
-        **kwargs: 추가 파라미터 (timestamp 등)
+        **kwargs: 추가 파라미터 (timestamp, 다중 윈도우 감지의 window, z-점수 감지의 score 등)
         
     Returns:
-        bool: 알림 전송 성공 여부
+        bool: 알림 큐 진입 성공 여부
     """
     # 알림을 보내야 하는지 확인
-    should_notify, time_since_last = notification_state.should_notify(symbol, change)
+    started = time.perf_counter() if metrics.enabled else 0
+    window = kwargs.get('window')
+    score = kwargs.get('score')
+    should_notify, time_since_last = notification_state.should_notify(symbol, change, window=window, score=score)
+    if metrics.enabled:
+        metrics.notify_check_seconds.observe(time.perf_counter() - started)
     
     # 알림 조건을 충족하지 않으면 전송하지 않음
     if not should_notify:
-        print(f"[Notifier] 알림 건너뜀: {symbol} (마지막 알림 후 {int(time_since_last)}초 경과, 현재 변동: {change:.2f}%)")
+        # 단계가 유지되는 동안 묶음마다 감지되므로 건수만 세고 로그는 디버그 수준
+        alert_dispatcher.skipped += 1
+        logger.debug(f"[Notifier] 알림 건너뜀: {symbol} (마지막 알림 후 {int(time_since_last)}초 경과, 현재 변동: {change:.2f}%)")
         return False
     # 웹훅 URL 검증
     if not DISCORD_WEBHOOK_URL:
-        print("[Notifier Error] Discord webhook URL is not configured")
+        logger.error("[Notifier Error] Discord webhook URL is not configured", extra=CONSOLE)
         return False
         
     if not validate_webhook_url(DISCORD_WEBHOOK_URL):
-        print("[Notifier Error] Invalid webhook URL")
+        logger.error("[Notifier Error] Invalid webhook URL", extra=CONSOLE)
         return False
     
     # 외부 요청인 경우 토큰 검증
     if security_token and security_token != SECURITY_TOKEN:
-        print("[Notifier Error] Invalid security token")
+        logger.error("[Notifier Error] Invalid security token", extra=CONSOLE)
         return False
     
     try:
-        # 메시지 생성
-        message = create_alert_message(symbol, price, change, **kwargs)
-        
-        print(f"[Notifier] Sending alert to Discord: {message['content']}")
-        
-        # 요청 헤더 설정
-        headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'VolMon/1.0',
-            'X-Security-Token': SECURITY_TOKEN
-        }
-        
-        # 요청 전송
-        response = requests.post(
-            DISCORD_WEBHOOK_URL,
-            data=json.dumps(message),
-            headers=headers,
-            timeout=10  # 10초 타임아웃
-        )
+        logger.info(f"[Notifier] Queueing alert for Discord: {symbol.upper()} {change:+.2f}% (${price:,.2f})", extra=CONSOLE)
         
-        # 응답 상태 코드 확인
-        response.raise_for_status()
-        print("[Notifier] Successfully sent alert to Discord")
-        return True
+        # 전송 스레드에 넘기고 바로 반환 (메시지는 다른 알림과 묶어서 생성)
+        return alert_dispatcher.submit({
+            "symbol": symbol,
+            "price": price,
+            "change": change,
+            "timestamp": kwargs.get('timestamp', ''),
+            "window": window,
+            "score": score
+        })
         
-    except requests.exceptions.RequestException as e:
-        if hasattr(e, 'response') and e.response is not None:
-            status_code = e.response.status_code
-            try:
-                error_msg = e.response.json()
-                print(f"[Notifier Error] Discord API Error ({status_code}): {error_msg}")
-            except:
-                print(f"[Notifier Error] Failed to send alert: HTTP {status_code} - {str(e)}")
-        else:
-            print(f"[Notifier Error] Failed to send alert: {str(e)}")
-        return False
     except Exception as e:
-        print(f"[Notifier Error] Unexpected error: {str(e)}")
+        logger.error(f"[Notifier Error] Unexpected error: {str(e)}", extra=CONSOLE)
         return False
@@ -0,0 +1,158 @@
+# volmon/utils/parser.py
+"""웹소켓 메시지 파서
+
+설치된 라이브러리에 따라 msgspec, orjson, 표준 json 순서로 백엔드를 선택합니다.
+체결(trade)과 집계 체결(aggTrade) 메시지는 필요한 필드만 꺼내는 빠른 경로를 제공합니다.
+"""
+
+import json
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from volmon.config import PARSER_BACKEND
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgspec = None
+
+
+class ParseError(ValueError):
+    """메시지 형식 오류"""
+    pass
+
+
+class Trade(NamedTuple):
+    """체결 메시지에서 사용하는 필드 (msgspec 백엔드는 같은 속성을 가진 구조체를 반환)"""
+    symbol: str  # 거래소 심볼 (s)
+    price: float  # 체결 가격 (p)
+    qty: float  # 체결 수량 (q)
+    event_time: Optional[int]  # 체결 시간, 밀리초 (T)
+    trade_id: Optional[int]  # 체결 ID (t) 또는 집계 체결 ID (a)
+
+
+def available_backends() -> Tuple[str, ...]:
+    """설치되어 사용 가능한 백엔드 목록 (우선순위 순)"""
+    backends = []
+    if msgspec is not None:
+        backends.append('msgspec')  # 스키마 디코딩으로 체결 빠른 경로가 가장 빠름
+    if orjson is not None:
+        backends.append('orjson')
+    backends.append('json')
+    return tuple(backends)
+
+
+# NamedTuple.__new__를 거치지 않고 바로 생성 (핫 패스)
+_new_tuple = tuple.__new__
+
+
+def _trade_from_dict(data: Dict[str, Any]) -> Trade:
+    """파싱된 dict에서 체결 필드 추출"""
+    trade_id = data.get('t')
+    if trade_id is None:
+        trade_id = data.get('a')
+    return _new_tuple(Trade, (data['s'], float(data['p']), float(data.get('q', 0)), data.get('T'), trade_id))
+
+
+class _DictParser:
+    """dict로 디코딩한 뒤 필요한 필드를 꺼내는 파서 (json, orjson)"""
+
+    def __init__(self, name: str, loads: Callable[[Any], Any], errors: Tuple[type, ...]):
+        self.name = name
+        self.loads = loads
+        self.errors = errors
+
+    def parse_trade(self, message) -> Trade:
+        """단일 스트림 체결 메시지 파싱"""
+        try:
+            return _trade_from_dict(self.loads(message))
+        except self.errors + (KeyError, TypeError, ValueError) as e:
+            raise ParseError(f"{type(e).__name__}: {e}") from e
+
+    def parse_combined(self, message) -> Tuple[str, Trade]:
+        """결합 스트림 메시지 파싱 -> (스트림 이름, 체결)"""
+        try:
+            payload = self.loads(message)
+            return payload['stream'], _trade_from_dict(payload['data'])
+        except self.errors + (KeyError, TypeError, ValueError) as e:
+            raise ParseError(f"{type(e).__name__}: {e}") from e
+
+
+if msgspec is not None:
+    class _TradeStruct(msgspec.Struct):
+        """trade / aggTrade 스키마 중 필요한 필드만 정의 (나머지 필드는 디코딩하지 않음)
+
+        Trade와 같은 속성을 제공하므로 변환 없이 그대로 핸들러에 넘깁니다.
+        """
+        symbol: str = msgspec.field(name='s')
+        price: float = msgspec.field(name='p')  # 문자열 가격을 디코딩 시 float로 변환
+        qty: float = msgspec.field(name='q', default=0.0)
+        event_time: Optional[int] = msgspec.field(name='T', default=None)
+        trade_no: Optional[int] = msgspec.field(name='t', default=None)
+        agg_id: Optional[int] = msgspec.field(name='a', default=None)
+
+        @property
+        def trade_id(self) -> Optional[int]:
+            return self.trade_no if self.trade_no is not None else self.agg_id
+
+    class _CombinedStruct(msgspec.Struct):
+        stream: str
+        data: _TradeStruct
+
+
+class _MsgspecParser:
+    """스키마 기반으로 필요한 필드만 디코딩하는 파서"""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        # strict=False: "12.34" 같은 문자열 숫자를 float로 디코딩
+        self._trade_decoder = msgspec.json.Decoder(_TradeStruct, strict=False)
+        self._combined_decoder = msgspec.json.Decoder(_CombinedStruct, strict=False)
+        self._any_decoder = msgspec.json.Decoder()
+
+    def loads(self, message):
+        try:
+            return self._any_decoder.decode(message)
+        except msgspec.DecodeError as e:
+            raise ParseError(str(e)) from e
+
+    def parse_trade(self, message) -> Trade:
+        """단일 스트림 체결 메시지 파싱"""
+        try:
+            return self._trade_decoder.decode(message)
+        except msgspec.DecodeError as e:
+            raise ParseError(str(e)) from e
+
+    def parse_combined(self, message) -> Tuple[str, Trade]:
+        """결합 스트림 메시지 파싱 -> (스트림 이름, 체결)"""
+        try:
+            payload = self._combined_decoder.decode(message)
+        except msgspec.DecodeError as e:
+            raise ParseError(str(e)) from e
+        return payload.stream, payload.data
+
+
+def create_parser(backend: str = 'auto'):
+    """백엔드 이름으로 파서 생성 ('auto'면 사용 가능한 가장 빠른 백엔드)"""
+    if backend == 'auto':
+        backend = available_backends()[0]
+    if backend not in available_backends():
+        raise ValueError(f"사용할 수 없는 파서 백엔드: {backend} (가능한 값: {', '.join(available_backends())})")
+
+    if backend == 'orjson':
+        return _DictParser('orjson', orjson.loads, (orjson.JSONDecodeError,))
+    if backend == 'msgspec':
+        return _MsgspecParser()
+    return _DictParser('json', json.loads, (json.JSONDecodeError,))
+
+
+# 전역 파서
+parser = create_parser(PARSER_BACKEND)
+loads = parser.loads
+parse_trade = parser.parse_trade
+parse_combined = parser.parse_combined
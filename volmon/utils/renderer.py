@@ -0,0 +1,200 @@
+# volmon/utils/renderer.py
+"""가격 표를 주기적으로 그리는 터미널 렌더러
+
+수신 스레드는 PriceDisplay의 딕셔너리에 값만 쓰고 바로 반환하며, 화면 출력은 이 모듈의
+렌더러 스레드가 UPDATE_INTERVAL마다 스냅샷을 떠서 수행합니다. 터미널이면 지난 프레임과
+달라진 줄만 커서 위치를 지정해 다시 쓰고, 파이프나 파일로 출력할 때는 프레임 전체를 출력합니다.
+
+표시 방식 (DISPLAY_MODE):
+    table     심볼 이름 순, DISPLAY_ROWS행씩 DISPLAY_PAGE_SECONDS마다 다음 페이지로 넘김
+    top       윈도우 변동률 절댓값 상위 DISPLAY_ROWS개
+    headless  렌더러를 시작하지 않음 (main에서 처리)
+"""
+
+import sys
+import time
+import heapq
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from volmon.config import (
+    ALERT_THRESHOLD, TIME_WINDOW, UPDATE_INTERVAL, DISPLAY_MODE, DISPLAY_ROWS, DISPLAY_PAGE_SECONDS
+)
+from volmon.utils import metrics
+
+logger = logging.getLogger('volmon')
+
+WIDTH = 62  # 표 너비
+CLEAR_SCREEN = '\x1b[2J'
+CLEAR_LINE = '\x1b[K'
+
+
+def move_to(row: int) -> str:
+    """row번째 줄(1부터) 첫 칸으로 커서 이동"""
+    return f'\x1b[{row};1H'
+
+
+class TerminalRenderer:
+    """PriceDisplay 스냅샷을 주기적으로 그리는 렌더러 (달라진 줄만 다시 출력)"""
+
+    def __init__(
+        self,
+        display,
+        interval: float = UPDATE_INTERVAL,
+        mode: str = DISPLAY_MODE,
+        rows: int = DISPLAY_ROWS,
+        page_seconds: float = DISPLAY_PAGE_SECONDS,
+        out=None,
+        full_redraw_interval: float = 60
+    ):
+        if mode not in ('table', 'top'):
+            raise ValueError(f"지원하지 않는 표시 방식: {mode} ('table', 'top')")
+        self.display = display  # 가격 표시기 (prices, last_update, changes, expected_symbols)
+        self.interval = interval  # 화면 갱신 주기 (초)
+        self.mode = mode
+        self.rows = rows  # 한 화면에 표시할 최대 행 수
+        self.page_seconds = page_seconds  # 페이지 전환 주기 (초)
+        self.out = out if out is not None else sys.stdout
+        self.ansi = self.out.isatty()  # 커서 이동을 지원하는 터미널인지
+        # 다른 출력이 화면을 밀어내도 복구되도록 주기적으로 전체를 다시 그림
+        self.full_redraw_interval = full_redraw_interval
+
+        self.screen: List[str] = []  # 마지막으로 그린 프레임
+        self.rendered: Dict[str, Tuple[tuple, str]] = {}  # 심볼 -> (값, 포맷한 줄)
+        self.order: List[str] = []  # table 모드의 심볼 순서
+        self.page = 0
+        self.page_started = 0.0
+        self.last_full_redraw = 0.0
+
+        self.frames = 0  # 그린 프레임 수
+        self.lines_written = 0  # 실제로 다시 쓴 줄 수
+
+        self.running = False
+        self.wakeup = threading.Event()
+        self.thread = None
+
+    def _row(self, symbol: str, price: float, updated: float, change) -> str:
+        """심볼 한 줄 (값이 그대로면 이전에 포맷한 문자열 재사용)"""
+        key = (price, int(updated), None if change is None else round(change, 2))
+        cached = self.rendered.get(symbol)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        price_str = f"{price:,.2f}" if price else 'Loading...'
+        change_str = f"{change:+.2f}%" if change is not None else '--'
+        updated_str = datetime.fromtimestamp(updated).strftime('%H:%M:%S') if updated > 0 else '--:--:--'
+        line = f"{symbol:<14} | {price_str:>15} | {change_str:>9} | {updated_str}"
+        self.rendered[symbol] = (key, line)
+        return line
+
+    def _visible(self, now: float, changes: Dict[str, float]) -> Tuple[List[str], str]:
+        """이번 프레임에 표시할 심볼과 표 제목"""
+        expected = self.display.expected_symbols
+        if len(self.order) != len(expected) or not expected.issuperset(self.order):
+            # 유니버스가 바뀌면 순서를 다시 정하고 빠진 심볼의 줄 캐시 삭제
+            self.order = sorted(expected)
+            self.rendered = {symbol: self.rendered[symbol] for symbol in self.order if symbol in self.rendered}
+            self.page = 0
+            self.page_started = now
+
+        if self.mode == 'top':
+            candidates = [symbol for symbol in changes if symbol in expected]  # 제거된 심볼 제외
+            count = min(self.rows, len(candidates))
+            symbols = heapq.nlargest(count, candidates, key=lambda symbol: abs(changes[symbol]))
+            return symbols, f"Top {count} by {TIME_WINDOW}s change ({len(expected)} symbols)"
+
+        pages = max(1, -(-len(self.order) // self.rows))
+        if now - self.page_started >= self.page_seconds:
+            self.page = (self.page + 1) % pages
+            self.page_started = now
+        start = self.page * self.rows
+        title = "Cryptocurrency Price Monitor"
+        if pages > 1:
+            title += f" (page {self.page + 1}/{pages})"
+        return self.order[start:start + self.rows], title
+
+    def frame(self, now: float) -> List[str]:
+        """현재 스냅샷으로 한 프레임 구성"""
+        # dict.copy()는 GIL 아래 한 번에 수행되므로 수신 스레드와 잠금 없이 일관된 스냅샷
+        prices = self.display.prices.copy()
+        last_update = self.display.last_update.copy()
+        changes = self.display.changes.copy()
+        symbols, title = self._visible(now, changes)
+
+        expected = self.display.expected_symbols
+        if len(expected) <= self.rows:
+            monitoring = f"Monitoring {len(expected)} coins - {', '.join(sorted(expected))}"
+        else:
+            monitoring = f"Monitoring {len(expected)} coins"
+        lines = [
+            "=== VolMon - Cryptocurrency Volatility Monitor ===",
+            monitoring,
+            f"Alert threshold: {ALERT_THRESHOLD}% change within {TIME_WINDOW} seconds",
+            "=" * WIDTH,
+            "",
+            f"=== {title} ===",
+            f"{'Symbol':<14} | {'Price (USDT)':>15} | {'Change':>9} | Last Updated",
+            "-" * WIDTH,
+        ]
+        for symbol in symbols:
+            lines.append(self._row(symbol, prices.get(symbol, 0), last_update.get(symbol, 0), changes.get(symbol)))
+        return lines
+
+    def render(self):
+        """한 프레임을 그림 (터미널이면 달라진 줄만)"""
+        now = time.time()
+        lines = self.frame(now)
+        self.frames += 1
+
+        if not self.ansi:
+            self.out.write("\n".join(lines) + "\n")
+            self.out.flush()
+            self.lines_written += len(lines)
+            return
+
+        parts = []
+        if not self.screen or now - self.last_full_redraw >= self.full_redraw_interval:
+            parts.append(CLEAR_SCREEN)
+            self.screen = []
+            self.last_full_redraw = now
+        for i, line in enumerate(lines):
+            if i >= len(self.screen) or self.screen[i] != line:
+                parts.append(move_to(i + 1) + line + CLEAR_LINE)
+        for i in range(len(lines), len(self.screen)):
+            parts.append(move_to(i + 1) + CLEAR_LINE)  # 줄어든 표의 남은 줄 지우기
+        if parts:
+            parts.append(move_to(len(lines) + 1))
+            self.out.write(''.join(parts))
+            self.out.flush()
+        self.lines_written += len(parts)
+        self.screen = lines
+
+    def _run(self):
+        while self.running:
+            started = time.perf_counter()
+            try:
+                self.render()
+            except Exception as e:
+                logger.error(f"[Renderer] 화면 갱신 중 오류: {e}")
+            elapsed = time.perf_counter() - started
+            if metrics.enabled:
+                metrics.render_seconds.observe(elapsed)
+            self.wakeup.wait(max(0.0, self.interval - elapsed))
+
+    def start(self):
+        """렌더러 스레드 시작"""
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name='volmon-renderer', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """렌더러 스레드 종료"""
+        self.running = False
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join(1)
+
+    def stats(self) -> Dict[str, int]:
+        """렌더링 통계"""
+        return {'frames': self.frames, 'lines_written': self.lines_written}
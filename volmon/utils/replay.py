@@ -0,0 +1,287 @@
+# volmon/utils/replay.py
+"""기록된 체결(또는 1초봉)을 감지기와 알림 판단 로직에 다시 흘려보내는 리플레이/백테스트
+
+실시간 경로와 같은 VolatilityDetector.detect_batch()와 NotificationState.should_notify()를
+사용하되, 시계는 체결 시간을 따르고 (벽시계를 기다리지 않음) 웹훅은 보내지 않습니다.
+여러 파라미터 조합은 프로세스 풀에서 병렬로 실행하며, 각 프로세스는 데이터를 한 번만 읽습니다.
+
+사용법:
+    python -m volmon.utils.replay --ticks ticks --start 2024-05-01 --end 2024-05-02 \\
+        --windows 30 60 120 --alert-thresholds 0.3 0.5 --modes oldest range
+    python -m volmon.utils.replay --klines --symbols btcusdt ethusdt --start 2024-05-01T00:00 --end 2024-05-01T06:00
+"""
+
+import json
+import time
+import argparse
+import itertools
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from volmon.config import (
+    SYMBOLS, TIME_WINDOW, ALERT_THRESHOLD, DETECTOR_MODE, BATCH_INTERVAL_MS, BACKFILL_WORKERS
+)
+from volmon.utils.detector import create_detector
+from volmon.utils.notifier import NotificationState
+
+# 심볼 -> (체결 시간(초) 목록, 가격 목록). NumPy 배열도 가능
+Streams = Dict[str, Tuple[Sequence[float], Sequence[float]]]
+
+
+class ReplayParams(NamedTuple):
+    """리플레이 한 번의 파라미터 조합"""
+    time_window: float = TIME_WINDOW  # 감지 윈도우 (초)
+    alert_threshold: float = ALERT_THRESHOLD  # 감지 임계값 (%)
+    thresholds: Tuple[float, ...] = tuple(NotificationState.THRESHOLDS)  # 알림 단계 (%)
+    detector_mode: str = DETECTOR_MODE  # 감지기 모드
+    batch_interval_ms: float = BATCH_INTERVAL_MS  # 체결을 묶어 감지하는 간격 (체결 시간 기준, 0이면 체결마다)
+
+
+class Alert(NamedTuple):
+    """리플레이 중 보냈을 알림"""
+    time: float  # 체결 시간 (초)
+    price: float  # 가격
+    change: float  # 변동률 (%)
+    window: Optional[int] = None  # 다중 윈도우 감지의 윈도우 (초)
+
+
+def replay_symbol(symbol: str, times, prices, params: ReplayParams, state: NotificationState) -> List[Alert]:
+    """심볼 하나의 체결을 시간 순서대로 감지기에 넣고 보냈을 알림 목록 반환"""
+    if hasattr(times, 'tolist'):
+        times, prices = times.tolist(), prices.tolist()  # NumPy 스칼라보다 파이썬 float가 빠름
+    detector = create_detector(
+        params.detector_mode, time_window=params.time_window,
+        alert_threshold=params.alert_threshold, verbose=False
+    )
+    detect_batch = detector.detect_batch
+    should_notify = state.should_notify
+    step = params.batch_interval_ms / 1000
+    alerts = []
+
+    def evaluate(batch):
+        detected, _ = detect_batch(batch)
+        if detected:
+            # 실시간 경로(TickerMonitor.on_detected)처럼 감지된 윈도우마다 알림 판단
+            event_time, price = batch[-1]
+            for window, change in detector.detections:
+                if should_notify(symbol, change, now=event_time, window=window, score=detector.score)[0]:
+                    alerts.append(Alert(event_time, price, change, window))
+
+    batch = []
+    batch_end = 0.0
+    for sample in zip(times, prices):
+        if batch and sample[0] >= batch_end:
+            evaluate(batch)
+            batch = []
+        if not batch:
+            batch_end = sample[0] + step
+        batch.append(sample)
+    if batch:
+        evaluate(batch)
+    return alerts
+
+
+def replay(streams: Streams, params: ReplayParams = ReplayParams()) -> Dict[str, Any]:
+    """모든 심볼을 한 파라미터 조합으로 리플레이
+
+    심볼마다 감지기와 알림 상태가 독립적이므로 심볼 단위로 끝까지 처리합니다.
+
+    Returns:
+        dict: params, alerts(심볼 -> 알림 목록), counts(심볼 -> 알림 수), total, trades, elapsed
+    """
+    started = time.perf_counter()
+    state = NotificationState.isolated(params.thresholds)
+    alerts = {}
+    trades = 0
+    for symbol, (times, prices) in streams.items():
+        trades += len(times)
+        symbol_alerts = replay_symbol(symbol, times, prices, params, state)
+        if symbol_alerts:
+            alerts[symbol] = symbol_alerts
+    return {
+        'params': params,
+        'alerts': alerts,
+        'counts': {symbol: len(items) for symbol, items in alerts.items()},
+        'total': sum(len(items) for items in alerts.values()),
+        'trades': trades,
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def load_ticks(directory: str, start: Optional[float] = None, end: Optional[float] = None,
+               symbols: Optional[List[str]] = None) -> Streams:
+    """TickRecorder 기록을 심볼별 (시간, 가격) 배열로 읽기 (한 번 훑은 뒤 심볼 번호로 나눔)"""
+    import numpy as np
+    from volmon.utils.tick_store import TickStore
+
+    store = TickStore(directory)
+    ticks = store.load(start=start, end=end)
+    order = np.argsort(ticks['symbol_id'], kind='stable')  # 심볼 안에서는 기록 순서 유지
+    ticks = ticks[order]
+    ids, starts = np.unique(ticks['symbol_id'], return_index=True)
+    bounds = list(starts[1:]) + [len(ticks)]
+    wanted = {symbol.upper() for symbol in symbols} if symbols else None
+
+    streams = {}
+    for symbol_id, lo, hi in zip(ids.tolist(), starts.tolist(), bounds):
+        symbol = store.symbols[symbol_id]
+        if wanted is not None and symbol not in wanted:
+            continue
+        part = ticks[lo:hi]
+        part = part[np.argsort(part['time'], kind='stable')]  # 재연결 보충 등으로 뒤섞인 순서 정렬
+        streams[symbol] = (part['time'] / 1000, part['price'])
+    return streams
+
+
+def load_klines(symbols: List[str], start: float, end: float, workers: int = BACKFILL_WORKERS) -> Streams:
+    """REST 1초봉(시가/종가)을 심볼별 (시간, 가격) 목록으로 조회"""
+    from volmon.utils.backfill import fetch_samples
+
+    start_ms, end_ms = int(start * 1000), int(end * 1000)
+    streams = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='volmon-replay') as executor:
+        results = executor.map(lambda symbol: fetch_samples(symbol, start_ms, end_ms, 'klines'), symbols)
+        for symbol, samples in zip(symbols, results):
+            streams[symbol.upper()] = ([t for t, _ in samples], [p for _, p in samples])
+    return streams
+
+
+# 작업 프로세스마다 한 번 읽어 두는 데이터
+_worker_streams: Optional[Streams] = None
+
+
+def _init_worker(loader: Callable[..., Streams], args: tuple):
+    global _worker_streams
+    _worker_streams = loader(*args)
+
+
+def _run_params(params: ReplayParams) -> Dict[str, Any]:
+    return replay(_worker_streams, params)
+
+
+def _identity(streams: Streams) -> Streams:
+    return streams
+
+
+def sweep(params_list: List[ReplayParams], loader: Callable[..., Streams], args: tuple,
+          workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """여러 파라미터 조합을 프로세스 풀에서 병렬 리플레이 (결과는 params_list 순서)
+
+    각 작업 프로세스는 시작할 때 loader(*args)로 데이터를 한 번 읽습니다. 체결 기록은
+    load_ticks를 넘기면 프로세스마다 mmap으로 읽고, 이미 읽은 데이터는 _identity와
+    (streams,)를 넘기면 프로세스마다 한 번만 전달됩니다.
+    """
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(loader, args)) as executor:
+        return list(executor.map(_run_params, params_list))
+
+
+def param_grid(
+    time_windows: Sequence[float] = (TIME_WINDOW,),
+    alert_thresholds: Sequence[float] = (ALERT_THRESHOLD,),
+    threshold_sets: Sequence[Tuple[float, ...]] = (tuple(NotificationState.THRESHOLDS),),
+    detector_modes: Sequence[str] = (DETECTOR_MODE,),
+    batch_interval_ms: float = BATCH_INTERVAL_MS
+) -> List[ReplayParams]:
+    """파라미터 값 목록의 모든 조합"""
+    return [
+        ReplayParams(window, alert_threshold, tuple(thresholds), mode, batch_interval_ms)
+        for window, alert_threshold, thresholds, mode
+        in itertools.product(time_windows, alert_thresholds, threshold_sets, detector_modes)
+    ]
+
+
+def _parse_time(value: str) -> float:
+    """ISO 형식 날짜/시간 (UTC) 또는 유닉스 시간(초)"""
+    try:
+        return float(value)
+    except ValueError:
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+
+def _format_time(event_time: float) -> str:
+    return datetime.fromtimestamp(event_time, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _describe(params: ReplayParams) -> str:
+    thresholds = ','.join(f"{t:g}" for t in params.thresholds)
+    return (f"window={params.time_window:g}s alert={params.alert_threshold:g}% "
+            f"steps=[{thresholds}] mode={params.detector_mode}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--ticks', metavar='DIR', help='TickRecorder 기록 디렉터리')
+    source.add_argument('--klines', action='store_true', help='REST 1초봉 사용 (--start, --end 필요)')
+    parser.add_argument('--symbols', nargs='+', help='리플레이할 심볼 (기본: 기록된 전체 또는 설정의 SYMBOLS)')
+    parser.add_argument('--start', type=_parse_time, help='시작 시간 (ISO, UTC 또는 유닉스 초)')
+    parser.add_argument('--end', type=_parse_time, help='끝 시간 (ISO, UTC 또는 유닉스 초)')
+    parser.add_argument('--windows', type=float, nargs='+', default=[TIME_WINDOW], help='TIME_WINDOW 후보 (초)')
+    parser.add_argument('--alert-thresholds', type=float, nargs='+', default=[ALERT_THRESHOLD],
+                        help='ALERT_THRESHOLD 후보 (%%)')
+    parser.add_argument('--thresholds', nargs='+',
+                        default=[','.join(f"{t:g}" for t in NotificationState.THRESHOLDS)],
+                        help='알림 단계 후보, 쉼표로 구분 (예: 0.3,0.5,1,2)')
+    parser.add_argument('--modes', nargs='+', default=[DETECTOR_MODE], help='감지기 모드 후보')
+    parser.add_argument('--batch-ms', type=float, default=BATCH_INTERVAL_MS, help='체결 묶음 간격 (밀리초)')
+    parser.add_argument('--workers', type=int, help='병렬 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--timeline', action='store_true', help='조합별 심볼 알림 타임라인 출력')
+    parser.add_argument('--output', help='전체 결과를 JSON으로 저장할 파일')
+    args = parser.parse_args()
+
+    threshold_sets = [tuple(float(t) for t in item.split(',')) for item in args.thresholds]
+    grid = param_grid(args.windows, args.alert_thresholds, threshold_sets, args.modes, args.batch_ms)
+
+    started = time.perf_counter()
+    if args.ticks:
+        loader, loader_args = load_ticks, (args.ticks, args.start, args.end, args.symbols)
+    else:
+        if args.start is None or args.end is None:
+            parser.error('--klines에는 --start와 --end가 필요합니다')
+        streams = load_klines(args.symbols or SYMBOLS, args.start, args.end)
+        loader, loader_args = _identity, (streams,)
+
+    if len(grid) == 1:
+        results = [replay(loader(*loader_args), grid[0])]
+    else:
+        results = sweep(grid, loader, loader_args, args.workers)
+    elapsed = time.perf_counter() - started
+
+    trades = results[0]['trades'] if results else 0
+    print(f"trades: {trades:,} / parameter sets: {len(grid)} / elapsed: {elapsed:.1f}s")
+    print(f"{'#':>3} | {'alerts':>7} | {'symbols':>7} | {'replay(s)':>9} | params")
+    print("-" * 90)
+    for i, result in enumerate(results):
+        print(f"{i:>3} | {result['total']:>7} | {len(result['counts']):>7} | "
+              f"{result['elapsed']:>9.2f} | {_describe(result['params'])}")
+
+    if args.timeline:
+        for i, result in enumerate(results):
+            print(f"\n[{i}] {_describe(result['params'])}")
+            for symbol in sorted(result['alerts']):
+                print(f"  {symbol} ({result['counts'][symbol]})")
+                for alert in result['alerts'][symbol]:
+                    window = f" ({alert.window}s)" if alert.window is not None else ""
+                    print(f"    {_format_time(alert.time)}  {alert.price:>14,.4f}  {alert.change:+.2f}%{window}")
+
+    if args.output:
+        payload = [
+            {
+                'params': result['params']._asdict(),
+                'total': result['total'],
+                'counts': result['counts'],
+                'alerts': {symbol: [alert._asdict() for alert in items] for symbol, items in result['alerts'].items()},
+            }
+            for result in results
+        ]
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
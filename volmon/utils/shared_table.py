@@ -0,0 +1,97 @@
+# volmon/utils/shared_table.py
+"""샤드 워커 프로세스와 부모 프로세스가 함께 쓰는 공유 메모리 가격 표
+
+심볼 하나당 float64 세 칸(가격, 변동률, 갱신 시간)을 차지하며, 행 번호는 생성할 때
+넘긴 심볼 목록의 순서입니다. 각 칸은 8바이트 정렬된 값 하나라 쓰기가 찢어지지 않고,
+심볼마다 쓰는 프로세스가 하나뿐이라 잠금 없이 씁니다 (세 칸 사이의 일관성은 보장하지 않음).
+
+워커는 PriceDisplay와 같은 update_* 메서드로 쓰고, 부모는 prices/last_update/changes
+속성으로 읽으므로 TickerMonitor와 TerminalRenderer를 그대로 쓸 수 있습니다.
+"""
+
+import math
+import time
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List
+
+FIELDS = 3  # 가격, 변동률, 갱신 시간
+PRICE, CHANGE, UPDATED = range(FIELDS)
+SLOT_SIZE = 8  # float64
+
+
+class SharedPriceTable:
+    """공유 메모리 위의 심볼별 (가격, 변동률, 갱신 시간) 표"""
+
+    def __init__(self, symbols: List[str], name: str = None):
+        """name이 없으면 새 공유 메모리를 만들고, 있으면 기존 표에 연결"""
+        self.symbols = [symbol.upper() for symbol in symbols]
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}  # 심볼 -> 행 번호
+        self.expected_symbols = set(self.symbols)
+        self.owner = name is None  # 만든 쪽이 unlink 담당
+        size = max(1, len(self.symbols)) * FIELDS * SLOT_SIZE
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.view = self.shm.buf.cast('d')
+        if self.owner:
+            for i in range(len(self.symbols)):
+                self.view[i * FIELDS + PRICE] = 0.0
+                self.view[i * FIELDS + CHANGE] = math.nan  # 아직 계산 전
+                self.view[i * FIELDS + UPDATED] = 0.0
+
+    @property
+    def name(self) -> str:
+        """워커가 연결할 공유 메모리 이름"""
+        return self.shm.name
+
+    # 쓰기 (워커, PriceDisplay와 같은 인터페이스)
+    def update_price(self, symbol: str, price: float, now: float = None):
+        base = self.index[symbol.upper()] * FIELDS
+        self.view[base + PRICE] = price
+        self.view[base + UPDATED] = now if now is not None else time.time()
+
+    def update_prices(self, prices: Dict[str, float]):
+        now = time.time()
+        for symbol, price in prices.items():
+            if symbol.upper() in self.index:
+                self.update_price(symbol, price, now)
+
+    def update_change(self, symbol: str, change: float):
+        self.view[self.index[symbol] * FIELDS + CHANGE] = change
+
+    def update_changes(self, symbols: Iterable[str], changes: Iterable[float]):
+        view, index = self.view, self.index
+        for symbol, change in zip(symbols, changes):
+            view[index[symbol] * FIELDS + CHANGE] = change
+
+    # 읽기 (부모, TerminalRenderer가 사용하는 스냅샷)
+    def _column(self, field: int, valid) -> Dict[str, float]:
+        view = self.view
+        values = {}
+        for i, symbol in enumerate(self.symbols):
+            value = view[i * FIELDS + field]
+            if valid(value):
+                values[symbol] = value
+        return values
+
+    @property
+    def prices(self) -> Dict[str, float]:
+        """가격을 받은 심볼의 가격"""
+        return self._column(PRICE, lambda value: value > 0)
+
+    @property
+    def last_update(self) -> Dict[str, float]:
+        return self._column(UPDATED, lambda value: value > 0)
+
+    @property
+    def changes(self) -> Dict[str, float]:
+        """변동률을 계산한 심볼의 변동률 (%)"""
+        return self._column(CHANGE, lambda value: not math.isnan(value))
+
+    def close(self):
+        """연결 해제 (만든 쪽이면 공유 메모리 삭제)"""
+        self.view.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
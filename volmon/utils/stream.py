@@ -0,0 +1,299 @@
+# volmon/utils/stream.py
+
+import json
+import time
+import logging
+import threading
+import websocket
+from typing import Any, Callable, Dict, List, Optional
+
+from volmon.config import BASE_STREAM_URL, MAX_STREAMS_PER_CONNECTION, GAP_FILL_ON_RECONNECT
+from volmon.utils.parser import ParseError, Trade, loads, parse_combined
+from volmon.utils.supervisor import GapFiller, backoff_delay
+from volmon.utils import metrics
+
+logger = logging.getLogger('volmon')
+
+# 파싱된 체결을 받아 처리하는 콜백
+TradeHandler = Callable[[Trade], None]
+
+
+def stream_name(symbol: str) -> str:
+    """심볼에 해당하는 체결 스트림 이름 (예: btcusdt@trade)"""
+    return f"{symbol.lower()}@trade"
+
+
+def shard_symbols(symbols: List[str], size: int = MAX_STREAMS_PER_CONNECTION) -> List[List[str]]:
+    """심볼 목록을 연결당 최대 스트림 수 단위로 분할"""
+    if size <= 0:
+        raise ValueError("size must be positive")
+    return [symbols[i:i + size] for i in range(0, len(symbols), size)]
+
+
+def route_message(handlers: Dict[str, TradeHandler], message, label: str) -> bool:
+    """결합 스트림 메시지({"stream": ..., "data": ...})를 해당 스트림의 핸들러로 전달
+
+    Returns:
+        bool: 메시지 형식이 올바른지 여부
+    """
+    started = time.perf_counter() if metrics.enabled else 0
+    try:
+        stream, trade = parse_combined(message)
+    except ParseError as e:
+        response = control_response(message)
+        if response is not None:
+            # SUBSCRIBE/UNSUBSCRIBE 응답 ({"result": null, "id": 1})
+            if response.get('error'):
+                logger.error(f"[{label}] 구독 변경 요청 {response.get('id')} 실패: {response['error']}")
+            return True
+        logger.error(f"[{label}] 메시지 형식 오류: {e} - 데이터: {message[:200]}")
+        return False
+    if metrics.enabled:
+        metrics.parse_seconds.observe(time.perf_counter() - started)
+
+    handler = handlers.get(stream)
+    if handler is None:
+        return True
+
+    try:
+        handler(trade)
+    except Exception as e:
+        logger.error(f"[{label}] {stream} 처리 중 예상치 못한 오류: {e}")
+    return True
+
+
+def control_response(message) -> Optional[Dict[str, Any]]:
+    """구독 변경 요청에 대한 응답이면 파싱한 딕셔너리, 아니면 None"""
+    try:
+        payload = loads(message)
+    except Exception:
+        return None
+    if isinstance(payload, dict) and 'id' in payload and ('result' in payload or 'error' in payload):
+        return payload
+    return None
+
+
+def control_message(method: str, symbols: List[str], request_id: int) -> str:
+    """연결을 끊지 않고 스트림을 추가/제거하는 요청 (method: SUBSCRIBE 또는 UNSUBSCRIBE)"""
+    return json.dumps({'method': method, 'params': [stream_name(symbol) for symbol in symbols], 'id': request_id})
+
+
+def merge_recovery_stats(fillers: List[GapFiller], reconnect_attempts: int = 0) -> Dict[str, Any]:
+    """연결별 복구 통계 합산 (소요 시간은 최댓값)"""
+    totals = {'recoveries': 0, 'gap_trades': 0, 'fill_errors': 0, 'cold_symbols': 0,
+              'last_recovery_time': 0.0, 'max_recovery_time': 0.0}
+    for filler in fillers:
+        stats = filler.stats()
+        for key in ('recoveries', 'gap_trades', 'fill_errors', 'cold_symbols'):
+            totals[key] += stats[key]
+        for key in ('last_recovery_time', 'max_recovery_time'):
+            totals[key] = max(totals[key], stats[key])
+    totals['reconnect_attempts'] = reconnect_attempts  # 현재 재연결 대기 중인 시도 수
+    return totals
+
+
+def stream_url(symbols: List[str]) -> str:
+    """심볼 목록을 구독하는 결합 스트림 URL"""
+    return f"{BASE_STREAM_URL}?streams={'/'.join(stream_name(symbol) for symbol in symbols)}"
+
+
+class StreamConnection:
+    """결합 스트림(/stream?streams=...) 웹소켓 연결 하나
+
+    재연결은 연결 전용 스레드의 실행 루프가 담당하며 (콜백 안에서 대기하지 않음),
+    다시 연결되면 끊긴 구간의 체결을 별도 스레드에서 보충합니다.
+    """
+
+    def __init__(self, conn_id: int, symbols: List[str], handlers: Dict[str, TradeHandler],
+                 gap_fill: bool = GAP_FILL_ON_RECONNECT):
+        self.conn_id = conn_id  # 연결 번호 (로그용)
+        self.symbols = [symbol.lower() for symbol in symbols]
+        handlers = {symbol: handlers[symbol] for symbol in self.symbols}
+        # 재연결 시 누락 체결 보충기 (핸들러를 감싸 마지막 체결을 추적)
+        self.gap_filler = GapFiller(handlers, f"Stream #{conn_id}") if gap_fill else None
+        if self.gap_filler is not None:
+            handlers = self.gap_filler.wrap()
+        # 스트림 이름 -> 핸들러
+        self.handlers = {stream_name(symbol): handlers[symbol] for symbol in self.symbols}
+        self.url = stream_url(self.symbols)
+        self.ws = None  # 웹소켓 연결 객체
+        self.thread = None  # 웹소켓 스레드
+        self.running = False  # 실행 여부
+        self.reconnect_attempts = 0  # 재연결 시도 횟수
+        self.message_count = 0  # 수신 메시지 수
+        self.connected = False  # 현재 연결되어 있는지 여부
+        self.request_id = 0  # 구독 변경 요청 번호
+
+    def on_message(self, ws, message):
+        """결합 스트림 메시지를 심볼별 핸들러로 전달"""
+        if route_message(self.handlers, message, f"Stream #{self.conn_id}"):
+            self.message_count += 1
+
+    def on_error(self, ws, error):
+        """웹소켓 에러 처리"""
+        logger.error(f"[Stream #{self.conn_id}] 웹소켓 오류: {error}")
+
+    def on_close(self, ws, close_status_code, close_msg):
+        """웹소켓 연결 종료 처리 (재연결은 실행 루프에서 수행)"""
+        logger.warning(f"[Stream #{self.conn_id}] 웹소켓 연결 종료 ({close_status_code}): {close_msg}")
+        self.connected = False
+        if self.gap_filler is not None:
+            self.gap_filler.disconnected()
+
+    def on_open(self, ws):
+        """웹소켓 연결 성공 시 호출"""
+        logger.info(f"[Stream #{self.conn_id}] 웹소켓 연결 성공. 스트림 {len(self.handlers)}개 구독")
+        self.reconnect_attempts = 0  # 연결 성공 시 재시도 횟수 초기화
+        self.connected = True
+        down_since = self.gap_filler.begin_recovery() if self.gap_filler is not None else None
+        if down_since is not None:
+            # REST 조회는 수신 스레드를 막지 않도록 별도 스레드에서 수행
+            threading.Thread(
+                target=self.gap_filler.fill, args=(down_since,), name=f"volmon-gapfill-{self.conn_id}", daemon=True
+            ).start()
+
+    def _run(self):
+        """연결이 끊기면 지터를 준 지수 백오프 후 같은 스레드에서 다시 연결"""
+        while self.running:
+            self.ws = websocket.WebSocketApp(
+                self.url,
+                on_message=self.on_message,
+                on_error=self.on_error,
+                on_close=self.on_close,
+                on_open=self.on_open,
+            )
+            self.ws.run_forever()
+            self.connected = False
+
+            if not self.running:
+                break
+            if self.gap_filler is not None:
+                self.gap_filler.disconnected()  # 연결 실패로 on_close 없이 끝난 경우
+            self.reconnect_attempts += 1
+            wait_time = backoff_delay(self.reconnect_attempts)
+            logger.info(f"[Stream #{self.conn_id}] {wait_time:.1f}초 후 재연결 시도... ({self.reconnect_attempts}번째 시도)")
+            time.sleep(wait_time)
+
+    def add_symbols(self, handlers: Dict[str, TradeHandler]):
+        """연결을 끊지 않고 스트림 추가 (SUBSCRIBE). 연결 전이면 다음 연결 URL에 반영"""
+        symbols = [symbol.lower() for symbol in handlers]
+        handlers = {symbol.lower(): handler for symbol, handler in handlers.items()}
+        if self.gap_filler is not None:
+            handlers = self.gap_filler.add(handlers)
+        for symbol in symbols:
+            self.handlers[stream_name(symbol)] = handlers[symbol]
+        self.symbols = self.symbols + symbols
+        self.url = stream_url(self.symbols)
+        self._send('SUBSCRIBE', symbols)
+
+    def remove_symbols(self, symbols: List[str]):
+        """연결을 끊지 않고 스트림 제거 (UNSUBSCRIBE)"""
+        symbols = [symbol.lower() for symbol in symbols]
+        self._send('UNSUBSCRIBE', symbols)
+        removed = set(symbols)
+        for symbol in symbols:
+            self.handlers.pop(stream_name(symbol), None)
+        self.symbols = [symbol for symbol in self.symbols if symbol not in removed]
+        self.url = stream_url(self.symbols)
+        if self.gap_filler is not None:
+            self.gap_filler.remove(symbols)
+
+    def _send(self, method: str, symbols: List[str]):
+        """연결되어 있으면 구독 변경 요청 전송"""
+        if not self.connected or self.ws is None:
+            return
+        self.request_id += 1
+        try:
+            self.ws.send(control_message(method, symbols, self.request_id))
+            logger.info(f"[Stream #{self.conn_id}] {method} 스트림 {len(symbols)}개 (요청 {self.request_id})")
+        except Exception as e:
+            # 전송에 실패해도 URL은 갱신했으므로 다음 재연결 때 반영됨
+            logger.error(f"[Stream #{self.conn_id}] {method} 요청 전송 오류: {e}")
+
+    def start(self):
+        """연결 스레드 시작"""
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name=f"volmon-stream-{self.conn_id}")
+        self.thread.daemon = True  # 메인 스레드 종료 시 함께 종료
+        self.thread.start()
+
+    def stop(self):
+        """연결 종료"""
+        self.running = False
+        if self.ws is not None:
+            self.ws.close()
+
+
+class StreamMultiplexer:
+    """여러 심볼의 체결 스트림을 소수의 결합 스트림 연결로 묶어 수신"""
+
+    def __init__(self, handlers: Dict[str, TradeHandler], max_streams: int = MAX_STREAMS_PER_CONNECTION):
+        # 심볼(소문자) -> 핸들러
+        self.handlers = {symbol.lower(): handler for symbol, handler in handlers.items()}
+        self.max_streams = max_streams
+        self.connections = [
+            StreamConnection(conn_id, shard, self.handlers)
+            for conn_id, shard in enumerate(shard_symbols(list(self.handlers), max_streams))
+        ]
+        self.next_conn_id = len(self.connections)  # 새로 만들 연결 번호
+        self.running = False
+        self.lock = threading.Lock()  # 구독 변경 직렬화
+
+    def add_symbols(self, handlers: Dict[str, TradeHandler]):
+        """새 심볼을 여유가 있는 연결에 구독 추가하고, 모자라면 연결을 새로 만듦"""
+        with self.lock:
+            added = {
+                symbol.lower(): handler for symbol, handler in handlers.items()
+                if symbol.lower() not in self.handlers
+            }
+            self.handlers.update(added)
+            pending = list(added)
+            for connection in self.connections:
+                room = self.max_streams - len(connection.symbols)
+                if room > 0 and pending:
+                    chunk, pending = pending[:room], pending[room:]
+                    connection.add_symbols({symbol: added[symbol] for symbol in chunk})
+            for shard in shard_symbols(pending, self.max_streams):
+                connection = StreamConnection(self.next_conn_id, shard, self.handlers)
+                self.next_conn_id += 1
+                self.connections.append(connection)
+                if self.running:
+                    connection.start()
+
+    def remove_symbols(self, symbols: List[str]):
+        """심볼 구독 해제 (스트림이 모두 빠진 연결은 종료)"""
+        with self.lock:
+            removed = {symbol.lower() for symbol in symbols} & set(self.handlers)
+            for connection in list(self.connections):
+                mine = [symbol for symbol in connection.symbols if symbol in removed]
+                if not mine:
+                    continue
+                if len(mine) == len(connection.symbols):
+                    connection.stop()
+                    self.connections.remove(connection)
+                else:
+                    connection.remove_symbols(mine)
+            for symbol in removed:
+                del self.handlers[symbol]
+
+    def start(self):
+        """모든 연결 시작"""
+        self.running = True
+        logger.info(
+            f"[VolMon] 심볼 {len(self.handlers)}개를 연결 {len(self.connections)}개로 구독합니다."
+        )
+        for connection in self.connections:
+            connection.start()
+
+    def stop(self):
+        """모든 연결 종료"""
+        self.running = False
+        for connection in self.connections:
+            connection.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """모든 연결의 재연결 및 누락 체결 보충 통계"""
+        return merge_recovery_stats(
+            [c.gap_filler for c in self.connections if c.gap_filler is not None],
+            sum(c.reconnect_attempts for c in self.connections)
+        )
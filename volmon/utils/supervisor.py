@@ -0,0 +1,254 @@
+# volmon/utils/supervisor.py
+"""웹소켓 재연결 감독
+
+- backoff_delay: 재연결 대기 시간 (지수 백오프 + 지터, 여러 연결이 동시에 재접속하지 않도록)
+- GapFiller: 연결 하나의 심볼별 마지막 체결을 기억하고, 재연결 후 끊긴 구간의 체결을
+  aggTrades로 조회해 순서대로 다시 전달 (그동안 들어온 실시간 체결은 심볼별로 보류했다가
+  그 심볼의 보충이 끝나면 이어서 전달)
+"""
+
+import time
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from volmon.config import (
+    TIME_WINDOW, RECONNECT_BASE_DELAY, RECONNECT_MAX_DELAY, GAP_FILL_WORKERS, GAP_FILL_MAX_WEIGHT
+)
+from volmon.utils.binance_client import BinanceClient, binance_client
+from volmon.utils.parser import Trade
+
+logger = logging.getLogger('volmon')
+
+AGG_TRADES_WEIGHT = 4  # aggTrades 요청 하나의 가중치
+AGG_TRADES_PAGE = 1000  # aggTrades 한 페이지의 최대 체결 수
+
+
+def backoff_delay(attempt: int, base: float = RECONNECT_BASE_DELAY, cap: float = RECONNECT_MAX_DELAY) -> float:
+    """attempt번째 재연결 전 대기 시간 (초)
+
+    지수 백오프 값의 절반은 고정, 나머지 절반은 무작위로 정합니다 (equal jitter).
+    """
+    delay = min(cap, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class _SymbolState:
+    """심볼 하나의 마지막 체결과 복구 중 보류한 실시간 체결"""
+    __slots__ = ('last_id', 'last_time', 'pending', 'recovering')
+
+    def __init__(self):
+        self.last_id: Optional[int] = None  # 마지막으로 전달한 체결 ID
+        self.last_time: Optional[int] = None  # 마지막으로 전달한 체결 시간 (밀리초)
+        self.pending: List[Trade] = []  # 복구 중 들어온 실시간 체결
+        self.recovering = 0  # 끝나지 않은 복구 수 (0보다 크면 실시간 체결을 보류)
+
+
+class GapFiller:
+    """재연결로 끊긴 구간의 체결을 aggTrades로 보충
+
+    핸들러를 감싸 심볼별 마지막 체결 ID와 시간을 기록하고, 이미 전달한 ID 이하의
+    체결은 중복으로 보고 버립니다. 집계 체결은 마지막 개별 체결 ID(l)를 체결 ID로
+    사용하므로 실시간 체결 ID와 같은 기준으로 중복을 판단합니다.
+
+    사용 순서: disconnected() -> (재연결) -> begin_recovery() -> fill(down_since) (별도 스레드)
+
+    보충 중에 다시 끊기면 그 끊김은 새로 기록되고, 다음 재연결의 보충은 앞선 보충이 끝난 뒤
+    실행됩니다. 보류한 실시간 체결은 그 심볼의 모든 보충이 끝나야 전달합니다.
+    """
+
+    def __init__(self, handlers: Dict[str, Any], label: str, client: BinanceClient = binance_client,
+                 max_gap: float = TIME_WINDOW, workers: int = GAP_FILL_WORKERS,
+                 max_weight: int = GAP_FILL_MAX_WEIGHT):
+        self.handlers = handlers  # 심볼(소문자) -> 핸들러
+        self.label = label  # 로그용 연결 이름
+        self.client = client
+        self.max_gap = max_gap  # 보충할 최대 구간 (초). 감지 윈도우보다 오래된 체결은 필요 없음
+        self.states = {symbol: _SymbolState() for symbol in handlers}
+        self.workers = workers  # 동시에 보충할 심볼 수
+        self.max_weight = max_weight  # 재연결 한 번에 보충에 쓸 최대 요청 가중치
+        self.weight_left = max_weight  # 이번 복구에서 남은 가중치
+        self.lock = threading.Lock()
+        self.budget_lock = threading.Lock()
+        self.fill_lock = threading.Lock()  # 보충은 한 번에 하나씩 (가중치 한도와 보류 체결을 공유하므로)
+        self.down_since: Optional[float] = None  # 연결이 끊긴 시간 (time.monotonic)
+
+        # 복구 지표
+        self.recoveries = 0  # 복구 완료 횟수
+        self.gap_trades = 0  # 보충한 체결 수
+        self.fill_errors = 0  # 보충 조회 실패 횟수
+        self.cold_symbols = 0  # 가중치 한도로 보충하지 못한 심볼 수
+        self.last_recovery_time = 0.0  # 마지막 복구 소요 시간 (연결 끊김 ~ 보충 완료, 초)
+        self.max_recovery_time = 0.0  # 최대 복구 소요 시간 (초)
+
+    def wrap(self) -> Dict[str, Any]:
+        """심볼(소문자) -> 체결 추적 핸들러"""
+        return {symbol: self._make_handler(symbol) for symbol in self.handlers}
+
+    def add(self, handlers: Dict[str, Any]) -> Dict[str, Any]:
+        """실행 중에 심볼 추가 (구독 추가 시). 추가한 심볼의 체결 추적 핸들러 반환"""
+        with self.lock:
+            for symbol, handler in handlers.items():
+                self.handlers[symbol] = handler
+                self.states[symbol] = _SymbolState()
+        return {symbol: self._make_handler(symbol) for symbol in handlers}
+
+    def remove(self, symbols: List[str]):
+        """실행 중에 심볼 제거 (구독 해제 시)"""
+        with self.lock:
+            for symbol in symbols:
+                self.handlers.pop(symbol, None)
+                self.states.pop(symbol, None)
+
+    def _make_handler(self, symbol: str):
+        state = self.states[symbol]
+        handler = self.handlers[symbol]
+
+        def on_trade(trade: Trade):
+            with self.lock:
+                if state.recovering:
+                    state.pending.append(trade)
+                    return
+                self._deliver(state, handler, trade)
+
+        return on_trade
+
+    @staticmethod
+    def _deliver(state: _SymbolState, handler, trade: Trade):
+        """중복이 아니면 핸들러로 전달하고 마지막 체결 갱신 (lock 안에서 호출)"""
+        trade_id = trade.trade_id
+        if trade_id is not None:
+            if state.last_id is not None and trade_id <= state.last_id:
+                return
+            state.last_id = trade_id
+        if trade.event_time is not None:
+            state.last_time = trade.event_time
+        handler(trade)
+
+    def disconnected(self):
+        """연결 끊김 기록 (여러 번 호출돼도 처음 끊긴 시간 유지)"""
+        with self.lock:
+            if self.down_since is None:
+                self.down_since = time.monotonic()
+
+    def begin_recovery(self) -> Optional[float]:
+        """재연결 직후 호출. 보충이 필요하면 실시간 체결 보류를 시작하고 끊긴 시간 반환 (fill()에 전달)
+
+        끊긴 시간은 여기서 가져가고 비우므로, 보충 중에 다시 끊기면 새 끊김으로 기록됩니다.
+        """
+        with self.lock:
+            down_since, self.down_since = self.down_since, None
+            if down_since is None:
+                return None  # 첫 연결
+            for state in self.states.values():
+                state.recovering += 1
+        return down_since
+
+    def _reserve(self, weight: int) -> bool:
+        """이번 복구의 가중치 한도에서 weight를 차감. 남은 한도가 부족하면 False"""
+        with self.budget_lock:
+            if self.weight_left < weight:
+                return False
+            self.weight_left -= weight
+            return True
+
+    def _fetch(self, symbol: str, start_ms: int, end_ms: int) -> Tuple[List[Dict[str, Any]], str]:
+        """구간의 집계 체결 조회. (체결 목록, 결과) 반환
+
+        결과는 'filled', 'cold' (가중치 한도로 조회하지 못했거나 중간에 멈춤), 'error'
+        """
+        if not self._reserve(AGG_TRADES_WEIGHT):
+            return [], 'cold'
+        rows = []
+        try:
+            for row in self.client.iter_agg_trades(symbol, start_ms, end_ms):
+                rows.append(row)
+                # 한 페이지를 다 읽으면 다음 페이지 요청 전에 가중치 차감
+                if len(rows) % AGG_TRADES_PAGE == 0 and not self._reserve(AGG_TRADES_WEIGHT):
+                    return rows, 'cold'
+        except Exception as e:
+            logger.error(f"[{self.label}] {symbol.upper()} 누락 체결 조회 오류: {str(e)[:100]}")
+            return rows, 'error'
+        return rows, 'filled'
+
+    def _fill_symbol(self, symbol: str, state: _SymbolState, now_ms: int) -> int:
+        """심볼 하나의 누락 체결을 보충하고 바로 보류한 실시간 체결까지 전달. 보충한 체결 수 반환"""
+        with self.lock:
+            last_id, last_time = state.last_id, state.last_time
+
+        rows, result = [], 'filled'
+        if last_time is not None:  # 끊기기 전 체결이 없으면 기준점이 없음
+            start_ms = max(last_time, now_ms - int(self.max_gap * 1000))
+            rows, result = self._fetch(symbol, start_ms, now_ms)
+
+        filled = 0
+        with self.lock:
+            if result == 'cold':
+                self.cold_symbols += 1
+            elif result == 'error':
+                self.fill_errors += 1
+            handler = self.handlers.get(symbol)
+            if handler is not None:  # None이면 조회하는 동안 구독 해제됨
+                for row in rows:
+                    if last_id is not None and row['l'] <= last_id:
+                        continue
+                    trade = Trade(symbol.upper(), float(row['p']), float(row['q']), row['T'], row['l'])
+                    before = state.last_id
+                    self._deliver(state, handler, trade)
+                    if state.last_id != before:
+                        filled += 1
+            state.recovering = max(0, state.recovering - 1)
+            if state.recovering:
+                return filled  # 다음 보충이 기다리는 중: 보류한 체결은 그 보충 뒤에 전달
+            if handler is not None:
+                # 보류한 실시간 체결 전달 (보충한 구간과 겹치는 체결은 중복으로 버려짐)
+                for trade in state.pending:
+                    self._deliver(state, handler, trade)
+            state.pending = []
+        return filled
+
+    def fill(self, down_since: Optional[float] = None):
+        """끊긴 구간의 체결을 심볼별로 조회해 순서대로 전달 (블로킹, down_since: begin_recovery()의 반환값)
+
+        조회는 workers개까지 동시에 실행하고, 심볼마다 보충이 끝나는 즉시 보류한
+        실시간 체결을 이어서 전달합니다. 재연결 한 번에 max_weight를 넘게 조회하지
+        않으며, 한도를 넘는 심볼은 보충 없이 실시간 체결로 재개합니다 (윈도우에 끊긴
+        구간이 빈 채로 남음).
+        """
+        with self.fill_lock:
+            self._fill(down_since)
+
+    def _fill(self, down_since: Optional[float]):
+        now_ms = int(time.time() * 1000)
+        self.weight_left = self.max_weight
+        cold = self.cold_symbols
+        with self.lock:
+            states = list(self.states.items())  # 보충 중 구독이 바뀌어도 안전하도록 복사
+        filled = 0
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='volmon-gapfill') as executor:
+            for count in executor.map(lambda item: self._fill_symbol(item[0], item[1], now_ms), states):
+                filled += count
+
+        elapsed = time.monotonic() - down_since if down_since is not None else 0.0
+        self.recoveries += 1
+        self.gap_trades += filled
+        self.last_recovery_time = elapsed
+        self.max_recovery_time = max(self.max_recovery_time, elapsed)
+        logger.info(
+            f"[{self.label}] 복구 완료: {elapsed:.2f}초 만에 재개, 누락 체결 {filled}건 보충 "
+            f"(한도 초과 {self.cold_symbols - cold}개, "
+            f"가중치 {self.max_weight - self.weight_left} 사용)"
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """복구 통계"""
+        return {
+            'recoveries': self.recoveries,
+            'gap_trades': self.gap_trades,
+            'fill_errors': self.fill_errors,
+            'cold_symbols': self.cold_symbols,
+            'last_recovery_time': self.last_recovery_time,
+            'max_recovery_time': self.max_recovery_time,
+        }
@@ -0,0 +1,293 @@
+# volmon/utils/tick_store.py
+"""수신한 체결을 고정 길이 바이너리 레코드로 기록하는 추가 전용 저장소
+
+레코드 (28바이트, 리틀 엔디언, 패딩 없음):
+    symbol_id  uint32   심볼 번호 (symbols.json의 인덱스)
+    time       int64    체결 시간 (밀리초)
+    price      float64  체결 가격
+    qty        float64  체결 수량
+
+파일은 체결 시간(UTC) 기준 하루 단위 세그먼트(ticks-YYYYMMDD-NNN.bin)로 나뉘며,
+세그먼트가 RECORD_SEGMENT_MAX_MB를 넘으면 같은 날의 다음 번호로 넘어갑니다.
+쓰기는 TickRecorder의 백그라운드 스레드가 묶어서 수행하고, 읽기는 TickStore가
+mmap 위의 NumPy 구조체 배열 뷰로 복사 없이 제공합니다.
+"""
+
+import os
+import json
+import time
+import mmap
+import struct
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from volmon.config import (
+    RECORD_DIR, RECORD_FLUSH_INTERVAL, RECORD_SEGMENT_MAX_MB, RECORD_QUEUE_SIZE, RECORD_RETENTION_DAYS
+)
+from volmon.utils.parser import Trade
+
+# 읽기는 선택 사항 (pip install numpy)
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 선택 의존성
+    np = None
+
+logger = logging.getLogger('volmon')
+
+RECORD = struct.Struct('<Iqdd')  # symbol_id, time(ms), price, qty
+RECORD_SIZE = RECORD.size
+TICK_DTYPE = (
+    np.dtype([('symbol_id', '<u4'), ('time', '<i8'), ('price', '<f8'), ('qty', '<f8')])
+    if np is not None else None
+)
+SYMBOLS_FILE = 'symbols.json'
+DAY_MS = 86_400_000
+
+
+def segment_day(time_ms: int) -> str:
+    """체결 시간(밀리초)이 속한 UTC 날짜 (YYYYMMDD)"""
+    return datetime.fromtimestamp(time_ms // DAY_MS * 86400, tz=timezone.utc).strftime('%Y%m%d')
+
+
+def segment_name(day: str, seq: int) -> str:
+    return f"ticks-{day}-{seq:03d}.bin"
+
+
+class SymbolTable:
+    """심볼 <-> 번호 매핑 (symbols.json에 추가 전용으로 저장)"""
+
+    def __init__(self, directory: Path):
+        self.path = directory / SYMBOLS_FILE
+        self.symbols: List[str] = []
+        if self.path.exists():
+            self.symbols = json.loads(self.path.read_text(encoding='utf-8'))
+        self.ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.lock = threading.Lock()
+
+    def id(self, symbol: str) -> int:
+        """심볼 번호 (처음 보는 심볼이면 추가 후 저장)"""
+        symbol = symbol.upper()
+        symbol_id = self.ids.get(symbol)
+        if symbol_id is not None:
+            return symbol_id
+        with self.lock:
+            if symbol not in self.ids:
+                self.symbols.append(symbol)
+                self.ids[symbol] = len(self.symbols) - 1
+                tmp = self.path.with_suffix('.tmp')
+                tmp.write_text(json.dumps(self.symbols), encoding='utf-8')
+                os.replace(tmp, self.path)
+            return self.ids[symbol]
+
+
+class TickRecorder:
+    """체결을 큐에 쌓아 두고 백그라운드 스레드가 주기적으로 묶어서 세그먼트에 추가
+
+    record()는 deque에 튜플 하나를 넣고 바로 반환하므로 수신/감지 경로에 디스크 I/O가
+    끼어들지 않습니다. 큐가 RECORD_QUEUE_SIZE를 넘으면 새 체결은 버리고 dropped에 기록합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str = RECORD_DIR,
+        flush_interval: float = RECORD_FLUSH_INTERVAL,
+        segment_max_mb: float = RECORD_SEGMENT_MAX_MB,
+        max_queue: int = RECORD_QUEUE_SIZE,
+        retention_days: int = RECORD_RETENTION_DAYS
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.symbol_table = SymbolTable(self.directory)
+        self.flush_interval = flush_interval  # 묶어서 쓰는 주기 (초)
+        self.segment_max_bytes = int(segment_max_mb * 1024 * 1024)  # 세그먼트 최대 크기
+        self.max_queue = max_queue  # 쓰기 대기 최대 체결 수
+        self.retention_days = retention_days  # 보관 일수 (0이면 삭제하지 않음)
+
+        self.queue = deque()  # (symbol_id, time_ms, price, qty)
+        self.file = None  # 현재 세그먼트 파일
+        self.day = None  # 현재 세그먼트 날짜
+        self.seq = 0  # 현재 세그먼트 번호
+
+        self.recorded = 0  # 기록한 체결 수
+        self.dropped = 0  # 큐가 가득 차 버린 체결 수
+        self.segments = 0  # 새로 연 세그먼트 수
+
+        self.running = False
+        self.thread = None
+
+    def record(self, symbol_id: int, trade: Trade):
+        """체결 하나를 쓰기 큐에 추가 (핫 패스)"""
+        if len(self.queue) >= self.max_queue:
+            self.dropped += 1
+            return
+        event_time = trade.event_time if trade.event_time is not None else int(time.time() * 1000)
+        self.queue.append((symbol_id, event_time, trade.price, trade.qty))
+
+    def wrap(self, handlers: Dict[str, object]) -> Dict[str, object]:
+        """심볼 -> 핸들러 매핑을 받아 체결을 기록한 뒤 원래 핸들러로 넘기는 핸들러 반환"""
+        def make(symbol_id, handler):
+            record = self.record
+
+            def on_trade(trade: Trade):
+                record(symbol_id, trade)
+                handler(trade)
+            return on_trade
+
+        return {symbol: make(self.symbol_table.id(symbol), handler) for symbol, handler in handlers.items()}
+
+    def _open(self, day: str):
+        """day의 마지막 세그먼트를 이어서 열거나 새 세그먼트 생성"""
+        if self.file is not None:
+            self.file.close()
+        if day != self.day:
+            existing = sorted(self.directory.glob(f"ticks-{day}-*.bin"))
+            self.seq = int(existing[-1].stem.rsplit('-', 1)[1]) if existing else 0
+            self.day = day
+            self._expire()
+        path = self.directory / segment_name(day, self.seq)
+        self.file = open(path, 'ab')
+        # 비정상 종료로 잘린 마지막 레코드가 있으면 레코드 경계에 맞춤
+        size = self.file.tell()
+        if size % RECORD_SIZE:
+            self.file.truncate(size - size % RECORD_SIZE)
+        self.segments += 1
+
+    def _expire(self):
+        """보관 기간이 지난 세그먼트 삭제"""
+        if not self.retention_days:
+            return
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=self.retention_days)).strftime('%Y%m%d')
+        for path in self.directory.glob('ticks-*.bin'):
+            if path.stem.split('-')[1] < cutoff:
+                path.unlink()
+                logger.info(f"[Recorder] 보관 기간이 지난 세그먼트 삭제: {path.name}")
+
+    def flush(self):
+        """쓰기 큐의 체결을 세그먼트에 추가 (날짜나 크기가 바뀌면 다음 세그먼트로)"""
+        count = len(self.queue)
+        if not count:
+            return
+        popleft = self.queue.popleft
+        pack = RECORD.pack
+        chunk = []
+        day_start = day_end = 0  # 현재 묶음이 속한 날의 범위 (밀리초)
+        for _ in range(count):
+            item = popleft()
+            if not day_start <= item[1] < day_end:
+                self._write(chunk)
+                chunk = []
+                day = segment_day(item[1])
+                if day != self.day or self.file is None:
+                    self._open(day)
+                day_start = item[1] // DAY_MS * DAY_MS
+                day_end = day_start + DAY_MS
+            chunk.append(pack(*item))
+        self._write(chunk)
+        self.file.flush()
+        self.recorded += count
+
+    def _write(self, chunk: List[bytes]):
+        if not chunk:
+            return
+        if self.file.tell() >= self.segment_max_bytes:
+            self.seq += 1
+            self._open(self.day)
+        self.file.write(b''.join(chunk))
+
+    def _run(self):
+        while self.running:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"[Recorder] 기록 중 오류: {e}")
+
+    def start(self):
+        """기록 스레드 시작"""
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name='volmon-recorder', daemon=True)
+        self.thread.start()
+        logger.info(f"[Recorder] 체결 기록 시작: {self.directory}")
+
+    def stop(self):
+        """기록 스레드를 멈추고 남은 체결을 기록한 뒤 파일 닫기"""
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(self.flush_interval + 1)
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def stats(self) -> Dict[str, int]:
+        """기록 통계"""
+        return {
+            'pending': len(self.queue),
+            'recorded': self.recorded,
+            'dropped': self.dropped,
+            'segments': self.segments,
+        }
+
+
+class TickStore:
+    """기록된 세그먼트를 mmap으로 열어 NumPy 구조체 배열 뷰로 읽기"""
+
+    def __init__(self, directory: str = RECORD_DIR):
+        if np is None:
+            raise RuntimeError("체결 기록을 읽으려면 numpy 패키지가 필요합니다 (pip install numpy)")
+        self.directory = Path(directory)
+        self.symbols = SymbolTable(self.directory).symbols  # 번호 -> 심볼
+
+    def segments(self, start_day: Optional[str] = None, end_day: Optional[str] = None) -> List[Path]:
+        """날짜(YYYYMMDD) 범위의 세그먼트 파일 (시간 순)"""
+        paths = []
+        for path in sorted(self.directory.glob('ticks-*.bin')):
+            day = path.stem.split('-')[1]
+            if (start_day is None or day >= start_day) and (end_day is None or day <= end_day):
+                paths.append(path)
+        return paths
+
+    @staticmethod
+    def open_segment(path: Path):
+        """세그먼트 하나를 복사 없이 읽는 읽기 전용 뷰 (배열이 살아 있는 동안 mmap 유지)"""
+        size = path.stat().st_size
+        count = size // RECORD_SIZE  # 쓰는 중인 마지막 레코드는 제외
+        if count == 0:
+            return np.empty(0, dtype=TICK_DTYPE)
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return np.frombuffer(mapped, dtype=TICK_DTYPE, count=count)
+
+    def iter_segments(self, start_day: Optional[str] = None, end_day: Optional[str] = None) -> Iterator[Tuple[Path, 'np.ndarray']]:
+        for path in self.segments(start_day, end_day):
+            yield path, self.open_segment(path)
+
+    def load(self, symbol: Optional[str] = None, start: Optional[float] = None, end: Optional[float] = None):
+        """조건에 맞는 레코드를 하나의 배열로 반환 (start/end는 초 단위 체결 시간)
+
+        세그먼트 전체를 가져올 때만 복사 없이 뷰를 쓰려면 iter_segments()를 사용하세요.
+        """
+        start_day = segment_day(int(start * 1000)) if start is not None else None
+        end_day = segment_day(int(end * 1000)) if end is not None else None
+        symbol_id = self.symbols.index(symbol.upper()) if symbol is not None else None
+
+        parts = []
+        for _, ticks in self.iter_segments(start_day, end_day):
+            mask = np.ones(len(ticks), dtype=bool)
+            if symbol_id is not None:
+                mask &= ticks['symbol_id'] == symbol_id
+            if start is not None:
+                mask &= ticks['time'] >= int(start * 1000)
+            if end is not None:
+                mask &= ticks['time'] <= int(end * 1000)
+            parts.append(ticks[mask])
+        return np.concatenate(parts) if parts else np.empty(0, dtype=TICK_DTYPE)
+
+    def samples(self, symbol: str, start: Optional[float] = None, end: Optional[float] = None) -> List[Tuple[float, float]]:
+        """심볼의 (event_time(초), price) 샘플 목록 (감지기에 바로 넣을 수 있는 형식)"""
+        ticks = self.load(symbol, start, end)
+        return list(zip((ticks['time'] / 1000).tolist(), ticks['price'].tolist()))
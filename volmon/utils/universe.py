@@ -0,0 +1,149 @@
+# volmon/utils/universe.py
+"""거래소 정보와 24시간 거래대금으로 모니터링할 심볼(유니버스)을 정하고 주기적으로 갱신
+
+- select_symbols: 호가 자산, 거래 상태, 24시간 거래대금 하한으로 심볼 선택 (거래대금 순)
+- UniverseWatcher: 주기적으로 다시 선택해 추가/제거된 심볼을 콜백으로 알림
+
+하한 근처의 심볼이 갱신마다 들어왔다 빠지며 감지 윈도우가 초기화되지 않도록, 이미 모니터링 중인
+심볼은 거래대금이 하한의 keep_ratio배 아래로 내려갈 때까지 유지합니다.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from volmon.config import (
+    UNIVERSE_QUOTE_ASSETS, UNIVERSE_MIN_QUOTE_VOLUME, UNIVERSE_MAX_SYMBOLS, UNIVERSE_REFRESH_INTERVAL
+)
+from volmon.utils.binance_client import BinanceClient, binance_client
+from volmon.utils.metadata import SymbolInfo
+
+logger = logging.getLogger('volmon')
+
+# 추가된 심볼, 제거된 심볼 (대문자)을 받는 콜백
+UniverseCallback = Callable[[List[str], List[str]], None]
+
+
+def select_symbols(
+    symbols: Iterable[SymbolInfo],
+    tickers: List[Dict[str, Any]],
+    quote_assets: Iterable[str] = UNIVERSE_QUOTE_ASSETS,
+    min_quote_volume: float = UNIVERSE_MIN_QUOTE_VOLUME,
+    max_symbols: int = UNIVERSE_MAX_SYMBOLS,
+    current: Iterable[str] = (),
+    keep_ratio: float = 0.8
+) -> List[str]:
+    """조건에 맞는 심볼을 24시간 거래대금이 큰 순서로 반환
+
+    Args:
+        symbols: 거래쌍 메타데이터 (BinanceClient.symbols()의 값)
+        tickers: get_24h_tickers() 응답
+        current: 현재 모니터링 중인 심볼 (하한의 keep_ratio배까지 유지)
+    """
+    quotes = {asset.upper() for asset in quote_assets}
+    volumes = {ticker['symbol']: float(ticker['quoteVolume']) for ticker in tickers}
+    current = set(current)
+
+    selected = []
+    for info in symbols:
+        symbol = info.symbol
+        if not info.trading or not info.spot or info.quote_asset not in quotes:
+            continue
+        floor = min_quote_volume * keep_ratio if symbol in current else min_quote_volume
+        if volumes.get(symbol, 0.0) >= floor:
+            selected.append(symbol)
+
+    selected.sort(key=lambda symbol: volumes[symbol], reverse=True)
+    if max_symbols:
+        selected = selected[:max_symbols]
+    return selected
+
+
+class UniverseWatcher:
+    """주기적으로 유니버스를 다시 선택하고 바뀐 심볼을 콜백으로 알림"""
+
+    def __init__(
+        self,
+        on_change: Optional[UniverseCallback] = None,
+        client: BinanceClient = binance_client,
+        interval: float = UNIVERSE_REFRESH_INTERVAL,
+        quote_assets: Iterable[str] = UNIVERSE_QUOTE_ASSETS,
+        min_quote_volume: float = UNIVERSE_MIN_QUOTE_VOLUME,
+        max_symbols: int = UNIVERSE_MAX_SYMBOLS
+    ):
+        self.on_change = on_change
+        self.client = client
+        self.interval = interval  # 갱신 주기 (초)
+        self.quote_assets = list(quote_assets)
+        self.min_quote_volume = min_quote_volume
+        self.max_symbols = max_symbols
+        self.symbols: List[str] = []  # 현재 유니버스 (거래대금 순)
+
+        self.refreshes = 0  # 갱신 횟수
+        self.added = 0  # 누적 추가 심볼 수
+        self.removed = 0  # 누적 제거 심볼 수
+
+        self.running = False
+        self.wakeup = threading.Event()
+        self.thread = None
+
+    def fetch(self) -> List[str]:
+        """거래소 정보(캐시)와 24시간 통계를 조회해 유니버스 선택"""
+        return select_symbols(
+            self.client.symbols().values(),
+            self.client.get_24h_tickers(),
+            self.quote_assets,
+            self.min_quote_volume,
+            self.max_symbols,
+            current=self.symbols
+        )
+
+    def load(self) -> List[str]:
+        """시작 시 유니버스를 정함 (콜백 없음)"""
+        self.symbols = self.fetch()
+        logger.info(f"[Universe] 심볼 {len(self.symbols)}개 선택 ({'/'.join(self.quote_assets)}, "
+                    f"24시간 거래대금 {self.min_quote_volume:,.0f} 이상)")
+        return list(self.symbols)
+
+    def refresh(self) -> Tuple[List[str], List[str]]:
+        """유니버스를 다시 선택하고 (추가된 심볼, 제거된 심볼) 반환 (바뀌었으면 콜백 호출)"""
+        selected = self.fetch()
+        current, latest = set(self.symbols), set(selected)
+        added = [symbol for symbol in selected if symbol not in current]
+        removed = [symbol for symbol in self.symbols if symbol not in latest]
+        self.symbols = selected
+        self.refreshes += 1
+        self.added += len(added)
+        self.removed += len(removed)
+        if added or removed:
+            logger.info(f"[Universe] 추가 {len(added)}개, 제거 {len(removed)}개 (현재 {len(selected)}개)")
+            if self.on_change is not None:
+                self.on_change(added, removed)
+        return added, removed
+
+    def _run(self):
+        while self.running:
+            self.wakeup.wait(self.interval)
+            if not self.running:
+                break
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"[Universe] 유니버스 갱신 중 오류: {str(e)[:100]}")
+
+    def start(self):
+        """갱신 스레드 시작"""
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name='volmon-universe', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """갱신 스레드 종료"""
+        self.running = False
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join(1)
+
+    def stats(self) -> Dict[str, int]:
+        """유니버스 통계"""
+        return {'symbols': len(self.symbols), 'refreshes': self.refreshes, 'added': self.added, 'removed': self.removed}
@@ -0,0 +1,463 @@
+# volmon/utils/vector_engine.py
+
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+from volmon.config import (
+    TIME_WINDOW, ALERT_THRESHOLD, ALLOWED_LATENESS, VECTOR_RING_CAPACITY, DETECTOR_MODE,
+    ZSCORE_BASELINE_WINDOW, ZSCORE_MIN_SAMPLES, ZSCORE_THRESHOLD, ZSCORE_RV_MULTIPLE
+)
+
+# 벡터 엔진은 선택 사항 (pip install numpy)
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 선택 의존성
+    np = None
+
+
+class _Moments:
+    """심볼별 개수/평균/차 제곱합 배열 (NaN은 값 없음으로 보고 건너뜀)"""
+
+    def __init__(self, n: int):
+        self.count = np.zeros(n)
+        self.mean = np.zeros(n)
+        self.m2 = np.zeros(n)
+
+    def add(self, values):
+        valid = ~np.isnan(values)
+        self.count += valid
+        delta = np.where(valid, values - self.mean, 0.0)
+        self.mean += np.divide(delta, self.count, out=np.zeros_like(delta), where=self.count > 0)
+        self.m2 += delta * np.where(valid, values - self.mean, 0.0)
+
+    def remove(self, values):
+        valid = ~np.isnan(values)
+        if not valid.any():
+            return
+        self.count -= valid
+        delta = np.where(valid, values - self.mean, 0.0)
+        self.mean -= np.divide(delta, self.count, out=np.zeros_like(delta), where=self.count > 0)
+        self.m2 -= delta * np.where(valid, values - self.mean, 0.0)
+        empty = self.count == 0
+        self.mean[empty] = 0.0
+        np.maximum(self.m2, 0.0, out=self.m2)
+        self.m2[empty] = 0.0
+
+    def recompute(self, ring):
+        """링 배열 (심볼 × 칸)에서 다시 계산 (누적 반올림 오차 제거)"""
+        valid = ~np.isnan(ring)
+        self.count = valid.sum(axis=1).astype(np.float64)
+        filled = np.where(valid, ring, 0.0)
+        self.mean = np.divide(filled.sum(axis=1), self.count, out=np.zeros(len(ring)), where=self.count > 0)
+        self.m2 = (np.where(valid, ring - self.mean[:, None], 0.0) ** 2).sum(axis=1)
+
+    def recompute_row(self, row: int, values):
+        """행 하나를 값 배열에서 다시 계산"""
+        values = values[~np.isnan(values)]
+        self.count[row] = len(values)
+        self.mean[row] = values.mean() if len(values) else 0.0
+        self.m2[row] = ((values - self.mean[row]) ** 2).sum()
+
+    @property
+    def variance(self):
+        return np.divide(self.m2, self.count, out=np.zeros_like(self.m2), where=self.count > 0)
+
+
+class VectorZScore:
+    """ZScoreDetector의 벡터판: 모든 심볼의 1초 로그 수익률 z-점수와 실현 변동성 배수를 한 번에 계산
+
+    ZScoreDetector와 같은 방식으로 체결을 심볼별 1초 버킷(가장 늦은 체결 가격이 종가)에 모으고, 워터마크가
+    지난 초마다 종가의 로그 수익률을 넣습니다 (체결이 없는 초는 0). (심볼 × 초) 링 배열 두 개(감지 구간
+    time_window초, 그 앞 기준 구간 baseline초)에 초마다 수익률 열을 하나씩 넣고, 감지 구간에서 밀려난 열은
+    기준 구간으로 넘기며, 심볼별 평균/분산은 Welford 방식 추가/제거로 열 단위 벡터 연산 한 번에 갱신합니다.
+    종가가 아직 없는 심볼의 수익률은 NaN으로 두고 뺍니다.
+
+    초 열을 모든 심볼이 공유하므로 워터마크도 하나(모든 심볼의 가장 늦은 이벤트 시간 - 허용 지연)이며,
+    심볼마다 워터마크를 두는 ZScoreDetector와는 다음이 다릅니다.
+    - 체결이 뜸한 심볼은 다른 심볼의 체결로 초가 먼저 확정되어 수익률 0이 먼저 들어감
+    - 심볼 자신의 워터마크 안이어도 공유 워터마크가 이미 지난 초에 도착한 체결은 수익률에서 빠짐
+    - 한 심볼만 두 구간보다 오래 체결이 없어도 통계를 새로 시작하지 않음 (수익률 0만 남아 분산이 0이 되면 감지 안 함)
+    """
+
+    def __init__(self, n: int, time_window: float = TIME_WINDOW, baseline: float = ZSCORE_BASELINE_WINDOW,
+                 min_samples: int = ZSCORE_MIN_SAMPLES):
+        self.window = int(time_window)  # 감지 구간 (초)
+        self.baseline = int(baseline)  # 기준 구간 (초)
+        self.min_samples = min_samples  # 감지를 시작하는 기준 구간 최소 표본 수
+        self.second = None  # 다음에 확정할 초 (None: 아직 시작 전)
+        self.open_seconds: List[Dict[int, list]] = [{} for _ in range(n)]  # 심볼별 초 -> [마지막 체결 시간, 종가]
+        self.open_rows = set()  # 확정하지 않은 버킷이 있는 행
+        self.reset(n)
+
+    def reset(self, n: int):
+        """통계를 비움 (확정하지 않은 버킷은 유지)"""
+        self.recent = np.full((n, self.window), np.nan)  # 감지 구간 수익률 링
+        self.history = np.full((n, self.baseline), np.nan)  # 기준 구간 수익률 링
+        self.recent_stats = _Moments(n)
+        self.history_stats = _Moments(n)
+        # 지금까지 넣은 열 수 (링 칸 = position % 길이). 백필한 과거 열도 0 이상이 되도록 두 구간 길이에서 시작
+        self.position = self.window + self.baseline
+        self.last_close = np.zeros(n)  # 마지막으로 확정한 초의 종가 (0: 없음)
+
+    @staticmethod
+    def _closes(times, prices):
+        """샘플의 (초 배열, 초별 종가 시간 배열, 종가 배열). 초 오름차순, 같은 시간이면 나중 샘플"""
+        seconds = np.floor(times).astype(np.int64)
+        order = np.lexsort((np.arange(len(times)), times, seconds))
+        seconds, times, prices = seconds[order], times[order], prices[order]
+        last = np.append(seconds[1:] != seconds[:-1], True)
+        return seconds[last], times[last], prices[last]
+
+    def _add_buckets(self, row: int, seconds, times, prices):
+        """행 하나의 초별 종가를 아직 확정하지 않은 버킷에 기록"""
+        buckets = self.open_seconds[row]
+        for second, event_time, price in zip(seconds.tolist(), times.tolist(), prices.tolist()):
+            bucket = buckets.get(second)
+            if bucket is None:
+                buckets[second] = [event_time, price]
+            elif event_time >= bucket[0]:
+                bucket[0], bucket[1] = event_time, price
+        if buckets:
+            self.open_rows.add(row)
+
+    def record(self, row: int, times, prices):
+        """행 하나의 샘플 묶음을 1초 버킷에 기록 (이미 확정한 초의 샘플은 버림)"""
+        seconds, times, prices = self._closes(times, prices)
+        if self.second is not None:
+            keep = seconds >= self.second
+            seconds, times, prices = seconds[keep], times[keep], prices[keep]
+        self._add_buckets(row, seconds, times, prices)
+
+    def step(self, prices):
+        """1초 종가 벡터로 수익률 열 하나를 넣음 (0: 그 초에 체결 없음)"""
+        traded = prices > 0
+        valid = traded & (self.last_close > 0)
+        returns = np.where(self.last_close > 0, 0.0, np.nan)  # 체결이 없는 초는 0, 종가가 없던 심볼은 NaN
+        np.log(np.divide(prices, self.last_close, out=np.ones_like(returns), where=valid), out=returns, where=valid)
+        self.last_close = np.where(traded, prices, self.last_close)
+
+        slot = self.position % self.window
+        evicted = self.recent[:, slot].copy()
+        self.recent[:, slot] = returns
+        self.recent_stats.remove(evicted)
+        self.recent_stats.add(returns)
+
+        slot = (self.position - self.window) % self.baseline
+        expired = self.history[:, slot].copy()
+        self.history[:, slot] = evicted
+        self.history_stats.remove(expired)
+        self.history_stats.add(evicted)
+        self.position += 1
+        if self.position % self.baseline == 0:
+            self.recent_stats.recompute(self.recent)
+            self.history_stats.recompute(self.history)
+
+    def finalize(self, limit: int):
+        """limit 이전 초의 버킷을 확정해 초마다 수익률 열을 넣음 (limit: 워터마크의 초)"""
+        second = self.second
+        span = self.window + self.baseline
+        open_seconds, open_rows = self.open_seconds, self.open_rows
+        n = len(self.last_close)
+        if second is None or limit - second > span:
+            # 처음이거나 두 구간보다 긴 공백 (재연결 실패 등): 통계를 새로 시작
+            if second is not None:
+                self.reset(n)
+            earliest = min((min(open_seconds[row]) for row in open_rows), default=limit)
+            second = max(limit - span, earliest)
+            for row in list(open_rows):
+                buckets = open_seconds[row]
+                for stale in [s for s in buckets if s < second]:
+                    del buckets[stale]
+                if not buckets:
+                    open_rows.discard(row)
+
+        while second < limit:
+            closes = np.zeros(n)
+            emptied = []
+            for row in open_rows:
+                buckets = open_seconds[row]
+                bucket = buckets.pop(second, None)
+                if bucket is not None:
+                    closes[row] = bucket[1]
+                    if not buckets:
+                        emptied.append(row)
+            open_rows.difference_update(emptied)
+            self.step(closes)
+            second += 1
+        self.second = limit
+
+    def warm(self, row: int, times, prices, start: int):
+        """행 하나를 과거 샘플로 채움 (백필)
+
+        이미 확정한 초(공유 시계가 아직 없으면 start)의 종가 수익률은 링의 제자리에 바로 넣고,
+        그 뒤의 샘플은 버킷에 기록합니다.
+        """
+        if self.second is None:
+            self.second = start
+        final = self.second
+        seconds, times, prices = self._closes(times, prices)
+        done = seconds < final
+        if done.any():
+            done_seconds, done_prices = seconds[done], prices[done]
+            span = self.window + self.baseline
+            # 두 구간과 그 직전 한 초: 초마다 그 초까지의 마지막 종가 (체결이 없는 초는 직전 종가)
+            grid = np.arange(max(final - span - 1, int(done_seconds[0])), final)
+            index = np.searchsorted(done_seconds, grid, side='right') - 1
+            close = np.where(index >= 0, done_prices[np.maximum(index, 0)], np.nan)
+            returns = np.full(len(grid), np.nan)
+            with np.errstate(invalid='ignore'):
+                returns[1:] = np.log(close[1:] / close[:-1])
+            keep = grid >= final - span
+            grid, returns = grid[keep], returns[keep]
+
+            positions = self.position - (final - grid)
+            recent = positions >= self.position - self.window
+            self.recent[row] = np.nan
+            self.history[row] = np.nan
+            self.recent[row, positions[recent] % self.window] = returns[recent]
+            self.history[row, positions[~recent] % self.baseline] = returns[~recent]
+            self.recent_stats.recompute_row(row, self.recent[row])
+            self.history_stats.recompute_row(row, self.history[row])
+            self.last_close[row] = close[-1]
+        self._add_buckets(row, seconds[~done], times[~done], prices[~done])
+
+    def scores(self, prices):
+        """(z-점수 배열, 실현 변동성 배수 배열). 기준 구간 표본이 모자란 심볼은 0
+
+        prices는 심볼별 가장 늦은 이벤트의 가격이며, 마지막 종가 대비 수익률을 아직 확정되지 않은 초로 더합니다.
+        """
+        recent, history = self.recent_stats, self.history_stats
+        valid = (prices > 0) & (self.last_close > 0)
+        partial = np.log(np.divide(prices, self.last_close, out=np.ones_like(prices), where=valid))
+        seconds = recent.count + 1
+        mean, variance = history.mean, history.variance
+        enough = valid & (history.count >= self.min_samples) & (variance > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (recent.mean * recent.count + partial - seconds * mean) / np.sqrt(seconds * variance)
+            sum_squares = recent.m2 + recent.count * recent.mean ** 2 + partial ** 2
+            rv = np.sqrt(sum_squares / (seconds * (variance + mean ** 2)))
+        return np.where(enough, z, 0.0), np.where(enough, rv, 0.0)
+
+
+class VectorDetectionEngine:
+    """모든 심볼의 가격 윈도우를 (심볼 × 슬롯) 링 버퍼 배열에 저장하고 한 번에 감지하는 엔진
+
+    심볼마다 VolatilityDetector와 deque를 두는 대신 미리 할당한 NumPy 배열을 사용하며,
+    evaluate()는 모든 심볼의 윈도우 첫 가격 대비 변동률을 벡터 연산 한 번으로 계산합니다.
+    results()는 VolatilityDetector.detect()와 같은 (감지_여부, 변동률) 형식입니다.
+
+    링 버퍼가 한 바퀴 돌면 가장 오래된 슬롯을 덮어쓰므로, capacity는 윈도우 안의
+    샘플 수보다 커야 합니다 (덮어쓴 윈도우 내 샘플 수는 overwritten에 기록).
+
+    evaluate()는 지난 평가 이후 샘플이 들어온 심볼만 다시 계산합니다.
+
+    zscore가 참이면 (DETECTOR_MODE가 'zscore') 변동률 임계값 대신 VectorZScore의 z-점수/실현 변동성
+    배수로 감지하고, 심볼별 z-점수는 evaluate() 뒤 score에 있습니다.
+    """
+    EVAL_CHUNK = 64  # 평가 버퍼 행 수 (한 번에 계산하는 심볼 수)
+
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        capacity: int = VECTOR_RING_CAPACITY,
+        time_window: float = TIME_WINDOW,
+        zscore: bool = DETECTOR_MODE == 'zscore'
+    ):
+        if np is None:
+            raise RuntimeError("벡터 엔진에는 numpy 패키지가 필요합니다 (pip install numpy)")
+
+        self.symbols = [symbol.upper() for symbol in symbols]
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}  # 심볼 -> 행 번호
+        self.capacity = capacity  # 심볼당 슬롯 수
+        self.time_window = time_window  # 초 단위 시간 창
+        self.allowed_lateness = ALLOWED_LATENESS  # 순서가 뒤바뀐 샘플 허용 지연 (초)
+
+        n = len(self.symbols)
+        self.times = np.full((n, capacity), -np.inf)  # 이벤트 시간 (빈 슬롯은 -inf)
+        self.prices = np.zeros((n, capacity))  # 가격
+        self.head = np.zeros(n, dtype=np.int64)  # 다음에 쓸 슬롯
+        self.latest_time = np.full(n, -np.inf)  # 심볼별 가장 늦은 이벤트 시간
+        self.latest_price = np.zeros(n)  # 가장 늦은 이벤트의 가격
+        self.overwritten = np.zeros(n, dtype=np.int64)  # 윈도우 안에서 덮어쓴 샘플 수
+        self.dirty = np.zeros(n, dtype=bool)  # 지난 평가 이후 샘플이 들어온 심볼
+        self.oldest_price = np.zeros(n)  # 심볼별 마지막으로 평가한 윈도우 첫 가격 (0: 데이터 부족)
+        self.batch_high = np.full(n, -np.inf)  # 지난 평가 이후 최고가
+        self.batch_low = np.full(n, np.inf)  # 지난 평가 이후 최저가
+        # 평가용 버퍼 (EVAL_CHUNK개 행씩 재사용)
+        self._times_buffer = np.empty((min(n, self.EVAL_CHUNK), capacity))
+        self._stale_buffer = np.empty((min(n, self.EVAL_CHUNK), capacity), dtype=bool)
+        self.late_samples = 0  # 워터마크보다 늦게 도착해 버려진 샘플 수
+        self.lock = threading.Lock()  # 쓰기(수신 스레드)와 평가(주기 작업) 직렬화
+
+        self.zscore = VectorZScore(n, time_window) if zscore else None  # z-점수 감지 (lock 안에서 갱신)
+        self.score = None  # 마지막 evaluate()의 심볼별 z-점수 (z-점수 감지일 때)
+
+    @property
+    def lookback(self) -> float:
+        """시작 시 감지에 필요한 과거 데이터 길이 (초, z-점수 감지는 기준 구간까지)"""
+        if self.zscore is not None:
+            return self.time_window + self.zscore.baseline + 1
+        return self.time_window
+
+    @staticmethod
+    def _arrays(samples: List[Tuple[float, float]]):
+        times = np.fromiter((t for t, _ in samples), dtype=np.float64, count=len(samples))
+        prices = np.fromiter((p for _, p in samples), dtype=np.float64, count=len(samples))
+        return times, prices
+
+    def _write(self, row: int, times, prices):
+        """행 하나의 샘플을 링 버퍼에 기록하고 늦지 않은 샘플 (times, prices) 반환 (lock 안에서 호출)"""
+        latest = self.latest_time[row]
+
+        # 각 샘플 도착 직전까지의 최대 이벤트 시간 기준 워터마크보다 늦은 샘플은 버림
+        running_max = np.maximum.accumulate(np.concatenate(([latest], times)))[:-1]
+        keep = times >= running_max - self.allowed_lateness
+        if not keep.all():
+            self.late_samples += int((~keep).sum())
+            times, prices = times[keep], prices[keep]
+        if not len(times):
+            return times, prices
+
+        # 가장 늦은 이벤트 (같은 시간이면 나중에 도착한 샘플)
+        last = len(times) - 1 - int(times[::-1].argmax())
+        if times[last] >= latest:
+            self.latest_time[row] = times[last]
+            self.latest_price[row] = prices[last]
+
+        # 한 바퀴 이상이면 마지막 capacity개만 기록
+        ring_times, ring_prices = times, prices
+        if len(times) > self.capacity:
+            ring_times, ring_prices = times[-self.capacity:], prices[-self.capacity:]
+        slots = (self.head[row] + np.arange(len(ring_times))) % self.capacity
+        in_window = self.times[row, slots] >= self.latest_time[row] - self.time_window
+        self.overwritten[row] += int(in_window.sum())
+        self.times[row, slots] = ring_times
+        self.prices[row, slots] = ring_prices
+        self.head[row] = (self.head[row] + len(ring_times)) % self.capacity
+        self.dirty[row] = True
+        self.batch_high[row] = max(self.batch_high[row], prices.max())
+        self.batch_low[row] = min(self.batch_low[row], prices.min())
+        return times, prices
+
+    def push(self, symbol: str, samples: List[Tuple[float, float]]):
+        """심볼 하나의 (event_time, price) 샘플 묶음을 링 버퍼에 기록
+
+        z-점수 감지는 샘플을 1초 버킷에 기록하고, 공유 워터마크가 지난 초를 확정합니다.
+        """
+        if not samples:
+            return
+        row = self.index[symbol.upper()]
+        times, prices = self._arrays(samples)
+
+        with self.lock:
+            times, prices = self._write(row, times, prices)
+            if self.zscore is not None and len(times):
+                self.zscore.record(row, times, prices)
+                limit = int(self.latest_time[row] - self.allowed_lateness)
+                if self.zscore.second is None or limit > self.zscore.second:
+                    self.zscore.finalize(limit)
+
+    def warm(self, symbol: str, samples: List[Tuple[float, float]]):
+        """백필한 과거 샘플로 심볼 하나의 윈도우를 채움 (z-점수 감지는 기준 구간까지)"""
+        if not samples:
+            return
+        row = self.index[symbol.upper()]
+        times, prices = self._arrays(samples)
+
+        with self.lock:
+            times, prices = self._write(row, times, prices)
+            if self.zscore is not None and len(times):
+                self.zscore.warm(row, times, prices, int(self.latest_time[row] - self.allowed_lateness))
+
+    def _evaluate_rows(self, rows):
+        """rows 심볼의 윈도우 첫 가격을 self.oldest_price에 기록 (lock 안에서 호출)
+
+        EVAL_CHUNK개 행씩 미리 할당한 버퍼에 복사해 계산하므로 평가마다 (심볼 × 슬롯) 임시 배열을 만들지 않습니다.
+        """
+        times, stale = self._times_buffer, self._stale_buffer
+        for start in range(0, len(rows), self.EVAL_CHUNK):
+            chunk = rows[start:start + self.EVAL_CHUNK]
+            k = len(chunk)
+            chunk_times, chunk_stale = times[:k], stale[:k]
+            np.take(self.times, chunk, axis=0, out=chunk_times)
+            # 심볼별 가장 늦은 이벤트 시간 기준 윈도우 밖의 슬롯은 inf로 두고 가장 오래된 슬롯 찾기
+            np.less(chunk_times, (self.latest_time[chunk] - self.time_window)[:, None], out=chunk_stale)
+            chunk_times[chunk_stale] = np.inf
+            enough = self.capacity - chunk_stale.sum(axis=1) >= 2  # 최소 2개 이상의 데이터가 있어야 계산 가능
+            self.oldest_price[chunk] = np.where(enough, self.prices[chunk, chunk_times.argmin(axis=1)], 0.0)
+
+    @staticmethod
+    def _change(prices, oldest_price):
+        """윈도우 첫 가격 대비 변동률(%) (첫 가격이 없으면 0)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(oldest_price > 0, (prices - oldest_price) / oldest_price * 100, 0.0)
+
+    def evaluate(self):
+        """지난 평가 이후 샘플이 들어온 심볼만 평가
+
+        변동률은 심볼의 윈도우에만 달려 있으므로 샘플이 없던 심볼은 지난 값을 그대로 씁니다.
+        감지는 심볼별 감지기의 detect_batch처럼 새 샘플이 들어온 심볼에서만, 그 샘플 중 가장 크게
+        움직인 가격으로 판정합니다 (지난 평가 이후 최고가/최저가 중 임계값 대비 비율이 큰 쪽, 윈도우 첫
+        가격은 평가 시점 기준). 묶음 안에서 튀었다가 되돌아온 변동도 감지합니다.
+
+        Returns:
+            tuple: (감지_여부 배열, 현재 변동률 배열(%), 감지 변동률 배열(%, 판정에 쓴 가격의 변동률))
+        """
+        with self.lock:
+            dirty = self.dirty.copy()
+            self.dirty[:] = False
+            rows = dirty.nonzero()[0]
+            if len(rows):
+                self._evaluate_rows(rows)
+            oldest_price = self.oldest_price.copy()
+            latest_price = self.latest_price.copy()
+            # 새 샘플이 없던 심볼은 현재 가격으로 (감지에는 쓰지 않음)
+            high = np.where(dirty, self.batch_high, latest_price)
+            low = np.where(dirty, self.batch_low, latest_price)
+            self.batch_high[rows] = -np.inf
+            self.batch_low[rows] = np.inf
+            if self.zscore is not None:
+                high_z, high_rv = self.zscore.scores(high)
+                low_z, low_rv = self.zscore.scores(low)
+                self.score, _ = self.zscore.scores(latest_price)
+
+        change = self._change(latest_price, oldest_price)
+        high_change, low_change = self._change(high, oldest_price), self._change(low, oldest_price)
+        if self.zscore is None:
+            high_strength, low_strength = np.abs(high_change), np.abs(low_change)
+            threshold = ALERT_THRESHOLD
+        else:
+            high_strength, low_strength = self._strength(high_z, high_rv), self._strength(low_z, low_rv)
+            threshold = 1
+        use_high = high_strength >= low_strength
+        detected = dirty & (np.where(use_high, high_strength, low_strength) >= threshold)
+        detected_change = np.where(use_high, high_change, low_change)
+        if self.zscore is not None:
+            # 감지한 심볼의 z-점수는 판정에 쓴 가격 기준
+            self.score = np.where(detected, np.where(use_high, high_z, low_z), self.score)
+        return detected, change, detected_change
+
+    @staticmethod
+    def _strength(z, rv):
+        """z-점수 감지의 임계값 대비 비율 (1 이상이면 감지)"""
+        strength = np.abs(z) / ZSCORE_THRESHOLD
+        if ZSCORE_RV_MULTIPLE:
+            strength = np.maximum(strength, rv / ZSCORE_RV_MULTIPLE)
+        return strength
+
+    def stats(self) -> Dict[str, int]:
+        """엔진 통계 (overwritten: 링 버퍼가 모자라 윈도우 안에서 덮어쓴 샘플 수, 0이 아니면 윈도우가 잘림)"""
+        with self.lock:
+            return {
+                'late_samples': self.late_samples,
+                'overwritten': int(self.overwritten.sum()),
+                'overwritten_symbols': int((self.overwritten > 0).sum()),
+            }
+
+    def results(self) -> Dict[str, Tuple[bool, float]]:
+        """심볼별 (감지_여부, 변동률). 감지되지 않은 심볼의 변동률은 0"""
+        detected, _, change = self.evaluate()
+        return {
+            symbol: (bool(detected[i]), float(change[i]) if detected[i] else 0)
+            for i, symbol in enumerate(self.symbols)
+        }